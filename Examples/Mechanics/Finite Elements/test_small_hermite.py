@@ -2,8 +2,17 @@
 Small Hermite Element Test (2x3 mesh)
 Compare with Calcpad Rectangular Slab FEA.cpd
 """
+import sys
+from pathlib import Path
+
 import numpy as np
 
+# Shared FEM core (repository root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from fem.mesh import grid_nodes, quad_connectivity
+from fem.hermite import shape_tables
+from fem.quadrature import tensor_gauss, integrate_stiffness, integrate_load
+
 # Parameters matching Calcpad
 a = 6.0  # m
 b = 4.0  # m
@@ -32,15 +41,9 @@ print(f"Element size: {a_e:.4f} x {b_e:.4f} m")
 n_j = (n_a + 1) * (n_b + 1)  # 3 * 4 = 12 joints
 print(f"Joints: {n_j}")
 
-# Joint coordinates
-x_j = np.zeros(n_j)
-y_j = np.zeros(n_j)
-j = 0
-for i_x in range(n_a + 1):
-    for i_y in range(n_b + 1):
-        x_j[j] = i_x * a_e
-        y_j[j] = i_y * b_e
-        j += 1
+# Joint coordinates (y varies fastest, as in Calcpad)
+joints = grid_nodes(a, b, n_a, n_b, order="y")
+x_j, y_j = joints[:, 0], joints[:, 1]
 
 print("\nJoint coordinates:")
 print("j    x      y")
@@ -49,15 +52,7 @@ for j in range(n_j):
 
 # Element connectivity (1-based like Calcpad)
 n_e = n_a * n_b  # 6 elements
-e_j = np.zeros((n_e, 4), dtype=int)
-for i_a in range(n_a):
-    for i_b in range(n_b):
-        e = i_b + n_b * i_a
-        j_base = e + i_a
-        e_j[e, 0] = j_base + 1      # node 1
-        e_j[e, 1] = j_base + n_b + 2  # node 2
-        e_j[e, 2] = j_base + n_b + 3  # node 3
-        e_j[e, 3] = j_base + 2      # node 4
+e_j = quad_connectivity(n_a, n_b, order="y", base=1)
 
 print("\nElement connectivity (1-based):")
 print("e   j1  j2  j3  j4")
@@ -88,129 +83,19 @@ print(f"  D[0,0] = {D[0,0]:.6f}")
 print(f"  D[0,1] = {D[0,1]:.6f}")
 print(f"  D[2,2] = {D[2,2]:.6f}")
 
-# Hermite shape functions (Calcpad notation)
+# Hermite shape functions (Calcpad notation, fem.hermite)
 # xi = x/a_e, eta = y/b_e in [0,1]
-
-def Phi_1a(xi): return 1 - xi**2 * (3 - 2*xi)
-def Phi_2a(xi): return xi * a_e * (1 - xi*(2 - xi))
-def Phi_3a(xi): return xi**2 * (3 - 2*xi)
-def Phi_4a(xi): return xi**2 * a_e * (-1 + xi)
-
-def Phi_1b(eta): return 1 - eta**2 * (3 - 2*eta)
-def Phi_2b(eta): return eta * b_e * (1 - eta*(2 - eta))
-def Phi_3b(eta): return eta**2 * (3 - 2*eta)
-def Phi_4b(eta): return eta**2 * b_e * (-1 + eta)
-
-# First derivatives
-def dPhi_1a(xi): return -6 * (xi/a_e) * (1 - xi)
-def dPhi_2a(xi): return 1 - xi*(4 - 3*xi)
-def dPhi_3a(xi): return 6 * (xi/a_e) * (1 - xi)
-def dPhi_4a(xi): return -xi * (2 - 3*xi)
-
-def dPhi_1b(eta): return -6 * (eta/b_e) * (1 - eta)
-def dPhi_2b(eta): return 1 - eta*(4 - 3*eta)
-def dPhi_3b(eta): return 6 * (eta/b_e) * (1 - eta)
-def dPhi_4b(eta): return -eta * (2 - 3*eta)
-
-# Second derivatives
-def ddPhi_1a(xi): return -(6/a_e**2) * (1 - 2*xi)
-def ddPhi_2a(xi): return -(2/a_e) * (2 - 3*xi)
-def ddPhi_3a(xi): return (6/a_e**2) * (1 - 2*xi)
-def ddPhi_4a(xi): return -(2/a_e) * (1 - 3*xi)
-
-def ddPhi_1b(eta): return -(6/b_e**2) * (1 - 2*eta)
-def ddPhi_2b(eta): return -(2/b_e) * (2 - 3*eta)
-def ddPhi_3b(eta): return (6/b_e**2) * (1 - 2*eta)
-def ddPhi_4b(eta): return -(2/b_e) * (1 - 3*eta)
-
-# Shape functions N for displacement w
 # DOF order per node: w, theta_x, theta_y, psi (twist)
-# For node i: N_i,w, N_i,tx, N_i,ty, N_i,psi
-
-def get_N(i, xi, eta):
-    """Get shape function N_i for w interpolation"""
-    if i == 0: return Phi_1a(xi) * Phi_1b(eta)
-    if i == 1: return Phi_2a(xi) * Phi_1b(eta)
-    if i == 2: return Phi_1a(xi) * Phi_2b(eta)
-    if i == 3: return Phi_2a(xi) * Phi_2b(eta)
-    if i == 4: return Phi_3a(xi) * Phi_1b(eta)
-    if i == 5: return Phi_4a(xi) * Phi_1b(eta)
-    if i == 6: return Phi_3a(xi) * Phi_2b(eta)
-    if i == 7: return Phi_4a(xi) * Phi_2b(eta)
-    if i == 8: return Phi_3a(xi) * Phi_3b(eta)
-    if i == 9: return Phi_4a(xi) * Phi_3b(eta)
-    if i == 10: return Phi_3a(xi) * Phi_4b(eta)
-    if i == 11: return Phi_4a(xi) * Phi_4b(eta)
-    if i == 12: return Phi_1a(xi) * Phi_3b(eta)
-    if i == 13: return Phi_2a(xi) * Phi_3b(eta)
-    if i == 14: return Phi_1a(xi) * Phi_4b(eta)
-    if i == 15: return Phi_2a(xi) * Phi_4b(eta)
-
-# B matrix components (curvature-displacement)
-def get_B1(j, xi, eta):
-    """Row 1 of B: d2w/dx2"""
-    ddPhi_a = [ddPhi_1a, ddPhi_2a, ddPhi_1a, ddPhi_2a,
-               ddPhi_3a, ddPhi_4a, ddPhi_3a, ddPhi_4a,
-               ddPhi_3a, ddPhi_4a, ddPhi_3a, ddPhi_4a,
-               ddPhi_1a, ddPhi_2a, ddPhi_1a, ddPhi_2a]
-    Phi_b = [Phi_1b, Phi_1b, Phi_2b, Phi_2b,
-             Phi_1b, Phi_1b, Phi_2b, Phi_2b,
-             Phi_3b, Phi_3b, Phi_4b, Phi_4b,
-             Phi_3b, Phi_3b, Phi_4b, Phi_4b]
-    return ddPhi_a[j](xi) * Phi_b[j](eta)
-
-def get_B2(j, xi, eta):
-    """Row 2 of B: d2w/dy2"""
-    Phi_a = [Phi_1a, Phi_2a, Phi_1a, Phi_2a,
-             Phi_3a, Phi_4a, Phi_3a, Phi_4a,
-             Phi_3a, Phi_4a, Phi_3a, Phi_4a,
-             Phi_1a, Phi_2a, Phi_1a, Phi_2a]
-    ddPhi_b = [ddPhi_1b, ddPhi_1b, ddPhi_2b, ddPhi_2b,
-               ddPhi_1b, ddPhi_1b, ddPhi_2b, ddPhi_2b,
-               ddPhi_3b, ddPhi_3b, ddPhi_4b, ddPhi_4b,
-               ddPhi_3b, ddPhi_3b, ddPhi_4b, ddPhi_4b]
-    return Phi_a[j](xi) * ddPhi_b[j](eta)
-
-def get_B3(j, xi, eta):
-    """Row 3 of B: 2*d2w/dxdy"""
-    dPhi_a = [dPhi_1a, dPhi_2a, dPhi_1a, dPhi_2a,
-              dPhi_3a, dPhi_4a, dPhi_3a, dPhi_4a,
-              dPhi_3a, dPhi_4a, dPhi_3a, dPhi_4a,
-              dPhi_1a, dPhi_2a, dPhi_1a, dPhi_2a]
-    dPhi_b = [dPhi_1b, dPhi_1b, dPhi_2b, dPhi_2b,
-              dPhi_1b, dPhi_1b, dPhi_2b, dPhi_2b,
-              dPhi_3b, dPhi_3b, dPhi_4b, dPhi_4b,
-              dPhi_3b, dPhi_3b, dPhi_4b, dPhi_4b]
-    return 2 * dPhi_a[j](xi) * dPhi_b[j](eta)
-
-def get_B(xi, eta):
-    """Full B matrix at point (xi, eta)"""
-    B = np.zeros((3, 16))
-    for j in range(16):
-        B[0, j] = get_B1(j, xi, eta)
-        B[1, j] = get_B2(j, xi, eta)
-        B[2, j] = get_B3(j, xi, eta)
-    return B
-
-# Element stiffness matrix using numerical integration
-from scipy.integrate import dblquad
-
-def compute_K_element():
-    """Compute element stiffness matrix"""
-    K = np.zeros((16, 16))
 
-    def integrand(eta, xi, i, j):
-        B = get_B(xi, eta)
-        return a_e * b_e * B[:, i].T @ D @ B[:, j]
+# Element matrices using Gauss-Legendre quadrature
+# 4x4 points integrate B^T D B and N exactly (cubic Hermite polynomials)
+N_GAUSS = 4
 
-    for i in range(16):
-        for j in range(i, 16):
-            val, _ = dblquad(lambda eta, xi: integrand(eta, xi, i, j),
-                            0, 1, 0, 1, epsabs=1e-6)
-            K[i, j] = val
-            K[j, i] = val
-
-    return K
+def compute_K_element(n_points=N_GAUSS):
+    """Compute element stiffness matrix"""
+    points, weights = tensor_gauss(n_points)
+    _, B = shape_tables(points[:, 0], points[:, 1], a_e, b_e)
+    return integrate_stiffness(B, D, weights * a_e * b_e)
 
 print("\nComputing element stiffness matrix K_e...")
 K_e = compute_K_element()
@@ -223,17 +108,11 @@ print("\nK_e[0,:4] (first row, first 4 columns):")
 print(f"  {K_e[0,0]:.6e}  {K_e[0,1]:.6e}  {K_e[0,2]:.6e}  {K_e[0,3]:.6e}")
 
 # Element load vector
-def compute_F_element():
+def compute_F_element(n_points=N_GAUSS):
     """Compute element load vector"""
-    F = np.zeros(16)
-
-    for i in range(16):
-        def integrand(eta, xi):
-            return a_e * b_e * get_N(i, xi, eta) * q
-        val, _ = dblquad(integrand, 0, 1, 0, 1, epsabs=1e-6)
-        F[i] = val
-
-    return F
+    points, weights = tensor_gauss(n_points)
+    N, _ = shape_tables(points[:, 0], points[:, 1], a_e, b_e)
+    return integrate_load(N, weights * a_e * b_e, q)
 
 print("\nComputing element load vector F_e...")
 F_e = compute_F_element()
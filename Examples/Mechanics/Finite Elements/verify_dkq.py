@@ -4,9 +4,18 @@ Based on Batoz & Tahar (1982)
 Compare with Calcpad implementation
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
-from scipy.integrate import dblquad
-import sympy as sp
+
+# Shared FEM core (repository root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from fem.dkq import (dkq_edge_coefficients, dkq_shape_functions, dkq_h_functions,
+                     dkq_B_matrices, dkq_stiffness, dkt_B_matrices, dkt_stiffness,
+                     plate_bending_D)
+from fem.assembly import element_dof_map, assemble_coo
+from fem.kernels import get_kernel
 
 # Element parameters
 a_e = 1.0  # Element width (normalized)
@@ -15,229 +24,55 @@ b_e = 1.0  # Element height (for initial testing, use 1x1)
 # For comparison with Calcpad: a=6, b=4, n_a=6, n_b=4
 # a_e = 6/6 = 1.0, b_e = 4/4 = 1.0
 
-# Edge geometry for rectangular element
 # Node numbering: 1(-1,-1), 2(1,-1), 3(1,1), 4(-1,1) in natural coords
-# Edge numbering: 5(1-2), 6(2-3), 7(3-4), 8(4-1)
-
-# Edge vectors (in physical coordinates)
-edges = {
-    5: {'x': a_e, 'y': 0},      # 1->2: horizontal bottom
-    6: {'x': 0, 'y': b_e},      # 2->3: vertical right
-    7: {'x': -a_e, 'y': 0},     # 3->4: horizontal top
-    8: {'x': 0, 'y': -b_e}      # 4->1: vertical left
-}
+# Mid-side nodes: 5(1-2), 6(2-3), 7(3-4), 8(4-1)
+# DOF per node: [w, theta_x, theta_y], theta_x = dw/dy, theta_y = -dw/dx
+coords = np.array([[[0, 0], [a_e, 0], [a_e, b_e], [0, b_e]]], dtype=float)
 
-# Calculate edge lengths
-for k in edges:
-    edges[k]['L'] = np.sqrt(edges[k]['x']**2 + edges[k]['y']**2)
+# Edge vectors x_ij = x_i - x_j (in physical coordinates)
+edge_vec = coords[0] - np.roll(coords[0], -1, axis=0)
+edge_len = np.hypot(edge_vec[:, 0], edge_vec[:, 1])
 
 print("Edge properties:")
-for k in edges:
-    x = edges[k]['x']
-    y = edges[k]['y']
-    L = edges[k]['L']
-    print(f"  Edge {k}: x={x:6.3f}, y={y:6.3f}, L={L:6.3f}")
-
-# DKQ coefficients (Batoz & Tahar 1982, Eq. 35)
-def calc_coefficients(x, y, L):
-    a = -6*x / L**2
-    b = 3*x*y / L**2
-    c = 3*y**2 / L**2 - 1
-    d = -3*x**2 / L**2 + 1
-    e = -3*x*y / L**2
-    return {'a': a, 'b': b, 'c': c, 'd': d, 'e': e}
-
-coefs = {}
-print("\nDKQ Coefficients:")
-for k in edges:
-    coefs[k] = calc_coefficients(edges[k]['x'], edges[k]['y'], edges[k]['L'])
-    print(f"  Edge {k}: a={coefs[k]['a']:7.3f}, b={coefs[k]['b']:7.3f}, "
-          f"c={coefs[k]['c']:7.3f}, d={coefs[k]['d']:7.3f}, e={coefs[k]['e']:7.3f}")
-
-# Quadratic edge functions P_k (bubble functions on edges)
-def P5(xi, eta):
-    return (1 - xi**2) * (1 - eta) / 4
-
-def P6(xi, eta):
-    return (1 + xi) * (1 - eta**2) / 4
-
-def P7(xi, eta):
-    return (1 - xi**2) * (1 + eta) / 4
-
-def P8(xi, eta):
-    return (1 - xi) * (1 - eta**2) / 4
-
-# Derivatives of P_k
-def dP5_dxi(xi, eta):
-    return -xi * (1 - eta) / 2
-
-def dP5_deta(xi, eta):
-    return -(1 - xi**2) / 4
-
-def dP6_dxi(xi, eta):
-    return (1 - eta**2) / 4
-
-def dP6_deta(xi, eta):
-    return -eta * (1 + xi) / 2
-
-def dP7_dxi(xi, eta):
-    return -xi * (1 + eta) / 2
-
-def dP7_deta(xi, eta):
-    return (1 - xi**2) / 4
-
-def dP8_dxi(xi, eta):
-    return -(1 - eta**2) / 4
-
-def dP8_deta(xi, eta):
-    return -eta * (1 - xi) / 2
-
-# Bilinear shape functions N_i
-def N1(xi, eta):
-    return (1 - xi) * (1 - eta) / 4
-
-def N2(xi, eta):
-    return (1 + xi) * (1 - eta) / 4
-
-def N3(xi, eta):
-    return (1 + xi) * (1 + eta) / 4
+for k in range(4):
+    x, y = edge_vec[k]
+    print(f"  Edge {k+5}: x={x:6.3f}, y={y:6.3f}, L={edge_len[k]:6.3f}")
 
-def N4(xi, eta):
-    return (1 - xi) * (1 + eta) / 4
-
-# Derivatives of N_i
-def dN1_dxi(xi, eta):
-    return -(1 - eta) / 4
-
-def dN1_deta(xi, eta):
-    return -(1 - xi) / 4
-
-def dN2_dxi(xi, eta):
-    return (1 - eta) / 4
-
-def dN2_deta(xi, eta):
-    return -(1 + xi) / 4
-
-def dN3_dxi(xi, eta):
-    return (1 + eta) / 4
-
-def dN3_deta(xi, eta):
-    return (1 + xi) / 4
-
-def dN4_dxi(xi, eta):
-    return -(1 + eta) / 4
-
-def dN4_deta(xi, eta):
-    return (1 - xi) / 4
+# DKQ coefficients (Batoz & Tahar 1982), arrays (n_elem, 4)
+coefs = dkq_edge_coefficients(coords)
+print("\nDKQ Coefficients:")
+for k in range(4):
+    print(f"  Edge {k+5}: a={coefs['a'][0, k]:7.3f}, b={coefs['b'][0, k]:7.3f}, "
+          f"c={coefs['c'][0, k]:7.3f}, d={coefs['d'][0, k]:7.3f}, e={coefs['e'][0, k]:7.3f}")
 
-# Test: verify P functions at Gauss points
-print("\nP functions at Gauss points (+/-1/sqrt(3)):")
+# Test: verify mid-side serendipity functions at Gauss points
+print("\nMid-side functions at Gauss points (+/-1/sqrt(3)):")
 gp = 1/np.sqrt(3)
-gauss_pts = [(-gp, -gp), (gp, -gp), (gp, gp), (-gp, gp)]
-for xi, eta in gauss_pts:
-    print(f"  (xi,eta)=({xi:6.4f},{eta:6.4f}): P5={P5(xi,eta):7.4f}, P6={P6(xi,eta):7.4f}, "
-          f"P7={P7(xi,eta):7.4f}, P8={P8(xi,eta):7.4f}")
-
-# DKQ interpolation functions for betax (Batoz & Tahar 1982, Eq. 34a)
-# Node 1 uses edges 5 and 8
-def Hx_1(xi, eta):
-    return 1.5 * (coefs[5]['a'] * P5(xi, eta) - coefs[8]['a'] * P8(xi, eta))
-
-def Hxx_1(xi, eta):
-    return coefs[5]['b'] * P5(xi, eta) + coefs[8]['b'] * P8(xi, eta)
-
-def Hxy_1(xi, eta):
-    return N1(xi, eta) - coefs[5]['c'] * P5(xi, eta) - coefs[8]['c'] * P8(xi, eta)
-
-# Node 2 uses edges 6 and 5
-def Hx_2(xi, eta):
-    return 1.5 * (coefs[6]['a'] * P6(xi, eta) - coefs[5]['a'] * P5(xi, eta))
-
-def Hxx_2(xi, eta):
-    return coefs[6]['b'] * P6(xi, eta) + coefs[5]['b'] * P5(xi, eta)
-
-def Hxy_2(xi, eta):
-    return N2(xi, eta) - coefs[6]['c'] * P6(xi, eta) - coefs[5]['c'] * P5(xi, eta)
-
-# Node 3 uses edges 7 and 6
-def Hx_3(xi, eta):
-    return 1.5 * (coefs[7]['a'] * P7(xi, eta) - coefs[6]['a'] * P6(xi, eta))
-
-def Hxx_3(xi, eta):
-    return coefs[7]['b'] * P7(xi, eta) + coefs[6]['b'] * P6(xi, eta)
-
-def Hxy_3(xi, eta):
-    return N3(xi, eta) - coefs[7]['c'] * P7(xi, eta) - coefs[6]['c'] * P6(xi, eta)
-
-# Node 4 uses edges 8 and 7
-def Hx_4(xi, eta):
-    return 1.5 * (coefs[8]['a'] * P8(xi, eta) - coefs[7]['a'] * P7(xi, eta))
-
-def Hxx_4(xi, eta):
-    return coefs[8]['b'] * P8(xi, eta) + coefs[7]['b'] * P7(xi, eta)
-
-def Hxy_4(xi, eta):
-    return N4(xi, eta) - coefs[8]['c'] * P8(xi, eta) - coefs[7]['c'] * P7(xi, eta)
-
-# DKQ interpolation functions for betay (Batoz & Tahar 1982, Eq. 34b)
-# Node 1
-def Hy_1(xi, eta):
-    return 1.5 * (coefs[5]['d'] * P5(xi, eta) - coefs[8]['d'] * P8(xi, eta))
-
-def Hyx_1(xi, eta):
-    return -N1(xi, eta) + coefs[5]['e'] * P5(xi, eta) + coefs[8]['e'] * P8(xi, eta)
-
-def Hyy_1(xi, eta):
-    return -coefs[5]['b'] * P5(xi, eta) - coefs[8]['b'] * P8(xi, eta)
-
-# Node 2
-def Hy_2(xi, eta):
-    return 1.5 * (coefs[6]['d'] * P6(xi, eta) - coefs[5]['d'] * P5(xi, eta))
-
-def Hyx_2(xi, eta):
-    return -N2(xi, eta) + coefs[6]['e'] * P6(xi, eta) + coefs[5]['e'] * P5(xi, eta)
-
-def Hyy_2(xi, eta):
-    return -coefs[6]['b'] * P6(xi, eta) - coefs[5]['b'] * P5(xi, eta)
-
-# Node 3
-def Hy_3(xi, eta):
-    return 1.5 * (coefs[7]['d'] * P7(xi, eta) - coefs[6]['d'] * P6(xi, eta))
-
-def Hyx_3(xi, eta):
-    return -N3(xi, eta) + coefs[7]['e'] * P7(xi, eta) + coefs[6]['e'] * P6(xi, eta)
-
-def Hyy_3(xi, eta):
-    return -coefs[7]['b'] * P7(xi, eta) - coefs[6]['b'] * P6(xi, eta)
-
-# Node 4
-def Hy_4(xi, eta):
-    return 1.5 * (coefs[8]['d'] * P8(xi, eta) - coefs[7]['d'] * P7(xi, eta))
-
-def Hyx_4(xi, eta):
-    return -N4(xi, eta) + coefs[8]['e'] * P8(xi, eta) + coefs[7]['e'] * P7(xi, eta)
-
-def Hyy_4(xi, eta):
-    return -coefs[8]['b'] * P8(xi, eta) - coefs[7]['b'] * P7(xi, eta)
-
-# Test interpolation property: at node i, Hxx_i should equal 1 for betax interpolation
+gauss_pts = np.array([(-gp, -gp), (gp, -gp), (gp, gp), (-gp, gp)])
+N, _ = dkq_shape_functions(gauss_pts[:, 0], gauss_pts[:, 1])
+for (xi, eta), (n5, n6, n7, n8) in zip(gauss_pts, N[:, 4:]):
+    print(f"  (xi,eta)=({xi:6.4f},{eta:6.4f}): N5={n5:7.4f}, N6={n6:7.4f}, "
+          f"N7={n7:7.4f}, N8={n8:7.4f}")
+print(f"  Partition of unity: max |sum N - 1| = {np.max(np.abs(N.sum(axis=1) - 1)):.2e}")
+
+# Interpolation property at node i: betax = theta_y_i and betay = -theta_x_i
+# DKQ interpolation functions (Batoz & Tahar 1982), 12 columns per field:
+#   betax: [Hx_w, Hx_thx, Hx_thy] per node, betay: [Hy_w, Hy_thx, Hy_thy] per node
 print("\nInterpolation test at nodes:")
-nodes = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
-Hxx = [Hxx_1, Hxx_2, Hxx_3, Hxx_4]
-Hxy = [Hxy_1, Hxy_2, Hxy_3, Hxy_4]
-Hyy = [Hyy_1, Hyy_2, Hyy_3, Hyy_4]
-Hyx = [Hyx_1, Hyx_2, Hyx_3, Hyx_4]
-
-for i, (xi, eta) in enumerate(nodes):
-    print(f"  Node {i+1} at ({xi:2},{eta:2}):")
-    for j in range(4):
-        hxx = Hxx[j](xi, eta)
-        hxy = Hxy[j](xi, eta)
-        hyy = Hyy[j](xi, eta)
-        hyx = Hyx[j](xi, eta)
-        if abs(hxx) > 1e-10 or abs(hxy) > 1e-10 or abs(hyy) > 1e-10 or abs(hyx) > 1e-10:
-            print(f"    Hxx_{j+1}={hxx:7.4f}, Hxy_{j+1}={hxy:7.4f}, "
-                  f"Hyx_{j+1}={hyx:7.4f}, Hyy_{j+1}={hyy:7.4f}")
+nodes = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=float)
+N, _ = dkq_shape_functions(nodes[:, 0], nodes[:, 1])
+Hbx, Hby = dkq_h_functions(coefs, N)
+Hbx, Hby = Hbx[0].reshape(4, 4, 3), Hby[0].reshape(4, 4, 3)
+
+expected_x = np.zeros((4, 4, 3))
+expected_y = np.zeros((4, 4, 3))
+expected_x[np.arange(4), np.arange(4), 2] = 1.0
+expected_y[np.arange(4), np.arange(4), 1] = -1.0
+for i, (xi, eta) in enumerate(nodes.astype(int)):
+    print(f"  Node {i+1} at ({xi:2},{eta:2}): Hx_thy_{i+1}={Hbx[i, i, 2]:7.4f}, "
+          f"Hy_thx_{i+1}={Hby[i, i, 1]:7.4f}")
+print(f"  Max deviation from nodal interpolation: "
+      f"{max(np.max(np.abs(Hbx - expected_x)), np.max(np.abs(Hby - expected_y))):.2e}")
 
 # Jacobian for rectangular element
 J11 = a_e / 2
@@ -246,73 +81,12 @@ det_J = J11 * J22
 
 print(f"\nJacobian: J11={J11}, J22={J22}, det_J={det_J}")
 
-# Build B matrix at a point
+# B matrix at a point (analytic derivatives of the H functions, fem.dkq)
+#   kappax = dbetax/dx, kappay = dbetay/dy, kappaxy = dbetax/dy + dbetay/dx
+#   d = [w1, thx1, thy1, w2, thx2, thy2, w3, thx3, thy3, w4, thx4, thy4]^T
 def get_B_matrix(xi, eta):
-    """
-    B matrix: curvature = B * d
-    where d = [w1, betax1, betay1, w2, betax2, betay2, w3, betax3, betay3, w4, betax4, betay4]^T
-
-    kappax = ∂betax/∂x
-    kappay = ∂betay/∂y
-    kappaxy = ∂betax/∂y + ∂betay/∂x
-    """
-    B = np.zeros((3, 12))
-
-    # Node data structure: [(Hx, Hxx, Hxy), derivatives...]
-    # We need derivatives of Hx functions for betax interpolation
-    # and derivatives of Hy functions for betay interpolation
-
-    # This requires derivatives of all H functions
-    # For now, let's use numerical differentiation for testing
-    h = 1e-6
-
-    # Row 1: kappax = ∂betax/∂x = (1/J11) * ∂betax/∂xi
-    # betax = Sum (Hx_i*w_i + Hxx_i*betax_i + Hxy_i*betay_i)
-    Hx_funcs = [Hx_1, Hx_2, Hx_3, Hx_4]
-    Hxx_funcs = [Hxx_1, Hxx_2, Hxx_3, Hxx_4]
-    Hxy_funcs = [Hxy_1, Hxy_2, Hxy_3, Hxy_4]
-
-    Hy_funcs = [Hy_1, Hy_2, Hy_3, Hy_4]
-    Hyx_funcs = [Hyx_1, Hyx_2, Hyx_3, Hyx_4]
-    Hyy_funcs = [Hyy_1, Hyy_2, Hyy_3, Hyy_4]
-
-    for i in range(4):
-        col = 3 * i
-
-        # Numerical derivatives for ∂/∂xi and ∂/∂eta
-        # d(Hx)/dxi
-        dHx_dxi = (Hx_funcs[i](xi+h, eta) - Hx_funcs[i](xi-h, eta)) / (2*h)
-        dHxx_dxi = (Hxx_funcs[i](xi+h, eta) - Hxx_funcs[i](xi-h, eta)) / (2*h)
-        dHxy_dxi = (Hxy_funcs[i](xi+h, eta) - Hxy_funcs[i](xi-h, eta)) / (2*h)
-
-        dHx_deta = (Hx_funcs[i](xi, eta+h) - Hx_funcs[i](xi, eta-h)) / (2*h)
-        dHxx_deta = (Hxx_funcs[i](xi, eta+h) - Hxx_funcs[i](xi, eta-h)) / (2*h)
-        dHxy_deta = (Hxy_funcs[i](xi, eta+h) - Hxy_funcs[i](xi, eta-h)) / (2*h)
-
-        dHy_dxi = (Hy_funcs[i](xi+h, eta) - Hy_funcs[i](xi-h, eta)) / (2*h)
-        dHyx_dxi = (Hyx_funcs[i](xi+h, eta) - Hyx_funcs[i](xi-h, eta)) / (2*h)
-        dHyy_dxi = (Hyy_funcs[i](xi+h, eta) - Hyy_funcs[i](xi-h, eta)) / (2*h)
-
-        dHy_deta = (Hy_funcs[i](xi, eta+h) - Hy_funcs[i](xi, eta-h)) / (2*h)
-        dHyx_deta = (Hyx_funcs[i](xi, eta+h) - Hyx_funcs[i](xi, eta-h)) / (2*h)
-        dHyy_deta = (Hyy_funcs[i](xi, eta+h) - Hyy_funcs[i](xi, eta-h)) / (2*h)
-
-        # Row 1: kappax = ∂betax/∂x = (1/J11) * ∂betax/∂xi
-        B[0, col] = dHx_dxi / J11      # w_i
-        B[0, col+1] = dHxx_dxi / J11   # betax_i
-        B[0, col+2] = dHxy_dxi / J11   # betay_i
-
-        # Row 2: kappay = ∂betay/∂y = (1/J22) * ∂betay/∂eta
-        B[1, col] = dHy_deta / J22     # w_i
-        B[1, col+1] = dHyx_deta / J22  # betax_i
-        B[1, col+2] = dHyy_deta / J22  # betay_i
-
-        # Row 3: kappaxy = ∂betax/∂y + ∂betay/∂x = (1/J22)*∂betax/∂eta + (1/J11)*∂betay/∂xi
-        B[2, col] = dHx_deta / J22 + dHy_dxi / J11
-        B[2, col+1] = dHxx_deta / J22 + dHyx_dxi / J11
-        B[2, col+2] = dHxy_deta / J22 + dHyy_dxi / J11
-
-    return B
+    B, _ = dkq_B_matrices(coords, np.atleast_1d(xi), np.atleast_1d(eta))
+    return B[0, 0]
 
 # Test B matrix at center
 print("\nB matrix at center (xi=0, eta=0):")
@@ -323,35 +97,31 @@ print("\nB matrix at Gauss point 1 (xi=-1/sqrt3, eta=-1/sqrt3):")
 B_gp1 = get_B_matrix(-1/np.sqrt(3), -1/np.sqrt(3))
 print(B_gp1)
 
+# Cross-check: central differences of the H functions
+h = 1e-6
+xi0, eta0 = np.array([-gp]), np.array([-gp])
+def beta_fields(xi, eta):
+    N, _ = dkq_shape_functions(xi, eta)
+    return dkq_h_functions(coefs, N)
+dbx_dxi, dby_dxi = [(p - m) / (2*h) for p, m in zip(beta_fields(xi0 + h, eta0), beta_fields(xi0 - h, eta0))]
+dbx_deta, dby_deta = [(p - m) / (2*h) for p, m in zip(beta_fields(xi0, eta0 + h), beta_fields(xi0, eta0 - h))]
+B_fd = np.vstack([dbx_dxi[0] / J11, dby_deta[0] / J22, dbx_deta[0] / J22 + dby_dxi[0] / J11])
+print(f"Max |B - B_finite_diff| at Gauss point 1: {np.max(np.abs(B_gp1 - B_fd)):.3e}")
+
 # Material properties
 E = 35000e6  # Pa (35000 MPa)
 nu = 0.15
 t = 0.1  # m
 
 # Constitutive matrix for bending
-D = E * t**3 / (12 * (1 - nu**2)) * np.array([
-    [1, nu, 0],
-    [nu, 1, 0],
-    [0, 0, (1-nu)/2]
-])
+D = plate_bending_D(E, nu, t)
 
 print(f"\nConstitutive matrix D (for t={t}, E={E/1e6}MPa, nu={nu}):")
 print(D)
 
-# Element stiffness matrix using 2x2 Gauss quadrature
+# Element stiffness matrix using 2x2 Gauss quadrature (batched, (n_elem, 12, 12))
 def compute_K_element():
-    K = np.zeros((12, 12))
-
-    # 2x2 Gauss points
-    gp = 1/np.sqrt(3)
-    gauss_pts = [(-gp, -gp), (gp, -gp), (gp, gp), (-gp, gp)]
-    weights = [1, 1, 1, 1]
-
-    for (xi, eta), w in zip(gauss_pts, weights):
-        B = get_B_matrix(xi, eta)
-        K += w * det_J * B.T @ D @ B
-
-    return K
+    return dkq_stiffness(coords, D, n_points=2)[0]
 
 K_e = compute_K_element()
 
@@ -364,10 +134,123 @@ print(f"Max asymmetry: {np.max(np.abs(K_e - K_e.T))}")
 
 print("\nChecking eigenvalues (should be non-negative for positive semi-definite):")
 eigenvalues = np.linalg.eigvalsh(K_e)
+tol = 1e-9 * eigenvalues.max()
 print(f"Eigenvalues: {eigenvalues}")
-print(f"Number of zero eigenvalues: {np.sum(np.abs(eigenvalues) < 1e-6)}")
-print(f"Number of negative eigenvalues: {np.sum(eigenvalues < -1e-6)}")
+print(f"Number of zero eigenvalues: {np.sum(np.abs(eigenvalues) < tol)}")
+print(f"Number of negative eigenvalues: {np.sum(eigenvalues < -tol)}")
 
-if np.any(eigenvalues < -1e-6):
+if np.any(eigenvalues < -tol):
     print("\nWARNING: Matrix has negative eigenvalues - NOT positive definite!")
     print("This explains the Calcpad error 'Matrix is not positive definite'")
+
+# ============================================================
+# Rigid-body modes and constant-curvature patch test (DKQ and DKT)
+# ============================================================
+# Quadratic fields w = c1 x^2/2 + c2 y^2/2 + c3 x y plus rigid terms, with
+# theta_x = dw/dy, theta_y = -dw/dx and exact curvature kappa = -[c1, c2, 2 c3]
+def nodal_dofs(points, w, dw_dx, dw_dy):
+    x, y = points[..., 0], points[..., 1]
+    return np.stack([w(x, y), dw_dy(x, y), -dw_dx(x, y)], axis=-1).reshape(points.shape[:-2] + (-1,))
+
+RIGID_MODES = [
+    (lambda x, y: np.ones_like(x), lambda x, y: 0 * x, lambda x, y: 0 * x),
+    (lambda x, y: x, lambda x, y: np.ones_like(x), lambda x, y: 0 * x),
+    (lambda x, y: y, lambda x, y: 0 * x, lambda x, y: np.ones_like(x)),
+]
+
+def quadratic_field(c1, c2, c3):
+    return (lambda x, y: 0.5 * c1 * x**2 + 0.5 * c2 * y**2 + c3 * x * y + 0.3 * x - 0.2 * y + 1.0,
+            lambda x, y: c1 * x + c3 * y + 0.3,
+            lambda x, y: c2 * y + c3 * x - 0.2)
+
+CURVATURE_CASES = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0), (0.7, -0.4, 0.25)]
+
+def rigid_body_check(stiffness, element_coords):
+    """Number of zero eigenvalues and max |K r| / max|K| over the three rigid modes"""
+    K = stiffness(element_coords[None])[0]
+    ev = np.linalg.eigvalsh(K)
+    n_zero = int(np.sum(np.abs(ev) < 1e-9 * ev.max()))
+    R = np.column_stack([nodal_dofs(element_coords, *mode) for mode in RIGID_MODES])
+    return n_zero, np.max(np.abs(K @ R)) / np.max(np.abs(K))
+
+def curvature_check(B_matrices, element_coords, xi, eta):
+    """Max |B u - kappa| for quadratic fields at arbitrary points of one element"""
+    B, _ = B_matrices(element_coords[None], xi, eta)
+    error = 0.0
+    for c1, c2, c3 in CURVATURE_CASES:
+        u = nodal_dofs(element_coords, *quadratic_field(c1, c2, c3))
+        error = max(error, np.max(np.abs(B[0] @ u + np.array([c1, c2, 2 * c3]))))
+    return error
+
+def patch_check(stiffness, nodes, elements):
+    """Patch test: boundary DOFs from a quadratic field, interior DOFs solved
+
+    Returns max relative error of the interior DOFs against the exact field.
+    """
+    dofs = element_dof_map(elements, 3)
+    K = assemble_coo(stiffness(nodes[elements]), dofs, 3 * len(nodes)).toarray()
+    interior = np.zeros(len(nodes), dtype=bool)
+    interior[PATCH_INTERIOR] = True
+    free = np.repeat(interior, 3)
+
+    error = 0.0
+    for c1, c2, c3 in CURVATURE_CASES:
+        u_exact = nodal_dofs(nodes, *quadratic_field(c1, c2, c3))
+        u = u_exact.copy()
+        u[free] = np.linalg.solve(K[np.ix_(free, free)], -K[np.ix_(free, ~free)] @ u_exact[~free])
+        error = max(error, np.max(np.abs(u[free] - u_exact[free])) / np.max(np.abs(u_exact)))
+    return error
+
+# Distorted patch (MacNeal-Harder style): 4 quads around one interior node
+# and the same patch split into 8 triangles
+PATCH_NODES = np.array([[0.0, 0.0], [1.1, 0.0], [2.0, 0.0], [0.0, 0.9], [0.8, 1.2],
+                        [2.0, 1.0], [0.0, 2.0], [1.2, 2.0], [2.0, 2.0]])
+PATCH_INTERIOR = [4]
+PATCH_QUADS = np.array([[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]])
+PATCH_TRIS = np.concatenate([PATCH_QUADS[:, [0, 1, 2]], PATCH_QUADS[:, [0, 2, 3]]])
+
+GENERAL_QUAD = np.array([[0.0, 0.0], [2.0, 0.3], [1.7, 1.4], [0.2, 1.1]])
+GENERAL_TRI = np.array([[0.0, 0.0], [2.0, 0.3], [0.6, 1.4]])
+sample_xi, sample_eta = np.array([-0.5, 0.3, 0.7]), np.array([0.2, -0.6, 0.9])
+sample_r, sample_s = np.array([0.2, 0.5, 0.1]), np.array([0.3, 0.1, 0.6])
+
+def dkq(c):
+    return dkq_stiffness(c, D)
+
+def dkt(c):
+    return dkt_stiffness(c, D)
+
+# Same elements through the kernel registry used by fem.model
+MATERIAL = {"E": 1.0, "nu": 0.3, "t": 1.0, "rho": 1.0}
+
+def registered(name):
+    return lambda c: get_kernel(name).stiffness(c, MATERIAL)
+
+print("\nRigid-body modes (w = 1, w = x, w = y); exactly 3 zero eigenvalues expected:")
+checks = []
+for label, stiffness, element_coords in [
+    ("DKQ 1x1 square", dkq, coords[0]),
+    ("DKQ 2x1 rectangle", dkq, np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 1.0], [0.0, 1.0]])),
+    ("DKQ general convex quad", dkq, GENERAL_QUAD),
+    ("DKT general triangle", dkt, GENERAL_TRI),
+    ("kernel quad4-dkq", registered("quad4-dkq"), GENERAL_QUAD),
+    ("kernel tri3-dkt", registered("tri3-dkt"), GENERAL_TRI),
+]:
+    n_zero, residual = rigid_body_check(stiffness, element_coords)
+    ok = n_zero == 3 and residual < 1e-12
+    checks.append(ok)
+    print(f"  {label:<26} zero eigenvalues: {n_zero}, max|K r|/max|K| = {residual:.1e}  "
+          f"{'OK' if ok else 'ERROR'}")
+
+print("\nConstant-curvature patch test:")
+for label, error in [
+    ("DKQ B u = kappa (general quad)", curvature_check(dkq_B_matrices, GENERAL_QUAD, sample_xi, sample_eta)),
+    ("DKT B u = kappa (general tri)", curvature_check(dkt_B_matrices, GENERAL_TRI, sample_r, sample_s)),
+    ("DKQ distorted 4-element patch", patch_check(dkq, PATCH_NODES, PATCH_QUADS)),
+    ("DKT distorted 8-element patch", patch_check(dkt, PATCH_NODES, PATCH_TRIS)),
+]:
+    ok = error < 1e-10
+    checks.append(ok)
+    print(f"  {label:<32} max error = {error:.1e}  {'OK' if ok else 'ERROR'}")
+
+print(f"\nRigid-body and patch checks: {'all passed' if all(checks) else 'FAILED'}")
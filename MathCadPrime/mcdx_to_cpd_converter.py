@@ -9,6 +9,9 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
 import base64
+import hashlib
+import time
+import argparse
 
 # Namespaces de MathCad Prime
 NS = {
@@ -27,6 +30,16 @@ class McdxToCalcpadConverter:
         self.variables = {}  # Variable definitions
         self.images = {}     # Image data
 
+        # Cache de regiones por archivo fuente:
+        #     ruta .mcdx -> {hash del subarbol XML: (lineas, warnings, variables)}
+        # Se conserva entre llamadas a convert() para el modo watch; cada
+        # conversion deja en el cache solo las regiones del archivo actual
+        self.region_cache = {}
+        self._file_cache = {}   # cache previo del archivo en conversion
+        self._seen_cache = {}   # regiones vistas en la conversion actual
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def convert(self, mcdx_path, output_path=None):
         """Convierte .mcdx a .cpd"""
 
@@ -39,6 +52,11 @@ class McdxToCalcpadConverter:
         self.warnings = []
         self.variables = {}
         self.images = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        cache_key = str(mcdx_file.resolve())
+        self._file_cache = self.region_cache.get(cache_key, {})
+        self._seen_cache = {}
 
         # Header
         self.output.append("' " + "="*60)
@@ -59,19 +77,70 @@ class McdxToCalcpadConverter:
             regions = root.find('ws:regions', NS)
             if regions is not None:
                 for region in regions.findall('ws:region', NS):
-                    self._process_region(region)
+                    self._process_region_cached(region)
+
+        # Las regiones que ya no estan en el archivo salen del cache
+        self.region_cache[cache_key] = self._seen_cache
+        self._file_cache = {}
+        self._seen_cache = {}
 
         # Generar output
         cpd_content = "\n".join(self.output)
 
-        # Guardar si se especificó ruta
+        # Guardar si se especificó ruta (solo si el contenido cambió)
         if output_path:
             output_file = Path(output_path)
-            output_file.write_text(cpd_content, encoding='utf-8')
-            print(f"Convertido: {mcdx_file.name} -> {output_file.name}")
+            if output_file.exists() and output_file.read_text(encoding='utf-8') == cpd_content:
+                print(f"Sin cambios: {mcdx_file.name} -> {output_file.name}")
+            else:
+                output_file.write_text(cpd_content, encoding='utf-8')
+                print(f"Convertido: {mcdx_file.name} -> {output_file.name}")
 
         return cpd_content
 
+    def _region_hash(self, region):
+        """Hash del subarbol XML de una region (incluye imagenes referenciadas)"""
+        h = hashlib.sha1(ET.tostring(region))
+
+        # Las regiones de imagen dependen del contenido del PNG, no solo del XML
+        for png_elem in region.iter('{' + NS['ws'] + '}png'):
+            h.update(self.images.get(png_elem.get('item-idref'), '').encode('ascii'))
+
+        return h.hexdigest()
+
+    def _process_region_cached(self, region):
+        """Procesa una región reutilizando la conversión previa si su XML no cambió"""
+        key = self._region_hash(region)
+
+        cached = self._file_cache.get(key, self._seen_cache.get(key))
+        if cached is not None:
+            self._seen_cache[key] = cached
+            lines, warnings, variables = cached
+            self.output.extend(lines)
+            self.warnings.extend(warnings)
+            self.variables.update(variables)
+            self.cache_hits += 1
+            return
+
+        # Convertir y registrar solo lo que agregó esta región
+        out_start = len(self.output)
+        warn_start = len(self.warnings)
+        vars_before = dict(self.variables)
+
+        self._process_region(region)
+
+        variables = {k: v for k, v in self.variables.items() if vars_before.get(k) != v}
+        self._seen_cache[key] = (
+            self.output[out_start:],
+            self.warnings[warn_start:],
+            variables
+        )
+        self.cache_misses += 1
+
+    def forget(self, mcdx_path):
+        """Descarta el cache de regiones de un archivo (p. ej. borrado)"""
+        self.region_cache.pop(str(Path(mcdx_path).resolve()), None)
+
     def _extract_images(self, zip_ref):
         """Extrae imágenes del archivo .mcdx"""
         try:
@@ -433,11 +502,87 @@ class McdxToCalcpadConverter:
 
         return name
 
+def _snapshot(mcdx_dir):
+    """Estado (mtime, tamaño) de los .mcdx de un directorio"""
+    state = {}
+    for mcdx_file in mcdx_dir.glob('*.mcdx'):
+        try:
+            st = mcdx_file.stat()
+        except OSError:
+            continue  # Archivo borrado durante el escaneo
+        state[mcdx_file] = (st.st_mtime_ns, st.st_size)
+    return state
+
+def _poll(mcdx_dir, converter, known):
+    """Una pasada de watch: convierte los .mcdx nuevos o modificados
+
+    known ({archivo: (mtime, tamaño)}) se actualiza solo tras una conversión
+    exitosa, así un archivo que falló (p. ej. a medio escribir) se reintenta
+    en la siguiente pasada aunque su mtime no cambie.
+    """
+    current = _snapshot(mcdx_dir)
+
+    for mcdx_file in sorted(current):
+        if known.get(mcdx_file) == current[mcdx_file]:
+            continue
+
+        try:
+            converter.convert(str(mcdx_file), str(mcdx_file.with_suffix('.cpd')))
+        except Exception as e:
+            print(f"ERROR en {mcdx_file.name}: {e} (se reintenta en la siguiente pasada)")
+            continue
+
+        known[mcdx_file] = current[mcdx_file]
+        print(f"  Regiones: {converter.cache_hits} en cache, "
+              f"{converter.cache_misses} reconvertidas")
+        for warning in converter.warnings:
+            print(f"    - {warning}")
+
+    for mcdx_file in set(known) - set(current):
+        converter.forget(mcdx_file)
+        del known[mcdx_file]
+
+def watch(mcdx_dir, interval=1.0, converter=None):
+    """Vigila un directorio y reconvierte solo los .mcdx modificados
+
+    Usa polling de (mtime, tamaño). Dentro de cada archivo, las regiones cuyo
+    subarbol XML no cambió se toman del cache del convertidor. El cache es
+    por archivo y guarda solo las regiones de la última conversión, así que
+    la memoria queda acotada por los archivos vigilados. Una conversión que
+    falla se reintenta en cada pasada hasta que tenga éxito.
+    """
+
+    converter = converter or McdxToCalcpadConverter()
+    mcdx_dir = Path(mcdx_dir)
+    known = {}
+
+    print(f"Vigilando {mcdx_dir.resolve()} (Ctrl+C para salir)")
+
+    try:
+        while True:
+            _poll(mcdx_dir, converter, known)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nModo watch detenido")
+
 def main():
     """Convierte todos los archivos .mcdx en el directorio actual"""
 
+    parser = argparse.ArgumentParser(description="Convierte .mcdx (MathCad Prime) a .cpd (Calcpad)")
+    parser.add_argument('directory', nargs='?', default=Path(__file__).parent,
+                        help="Directorio con archivos .mcdx")
+    parser.add_argument('--watch', action='store_true',
+                        help="Vigilar el directorio y reconvertir al detectar cambios")
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help="Intervalo de polling en segundos (modo watch)")
+    args = parser.parse_args()
+
     converter = McdxToCalcpadConverter()
-    mcdx_dir = Path(__file__).parent
+    mcdx_dir = Path(args.directory)
+
+    if args.watch:
+        watch(mcdx_dir, args.interval, converter)
+        return
 
     mcdx_files = list(mcdx_dir.glob('*.mcdx'))
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Prueba del cache de regiones de mcdx_to_cpd_converter.py
+
+Crea un .mcdx mínimo con dos regiones de texto y comprueba que:
+    1. La primera conversión convierte todas las regiones
+    2. Sin cambios, todas las regiones se toman del cache
+    3. Al editar una región solo esa se reconvierte y la salida cambia
+    4. El cache del archivo guarda solo las regiones de la última conversión
+    5. En modo watch, una conversión fallida se reintenta en la siguiente
+       pasada aunque el archivo no cambie
+
+Ejecutar: python test_mcdx_cache.py
+"""
+
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from mcdx_to_cpd_converter import McdxToCalcpadConverter, NS, _poll
+
+def text_region(region_id, text):
+    return (f'<region region-id="{region_id}"><text><FlowDocument>'
+            f'<Paragraph>{text}</Paragraph></FlowDocument></text></region>')
+
+def write_mcdx(path, texts):
+    """Worksheet con una región de texto por elemento de texts"""
+    regions = "".join(text_region(i, text) for i, text in enumerate(texts))
+    worksheet = (f'<worksheet xmlns="{NS["ws"]}" xmlns:ml="{NS["ml"]}">'
+                 f'<regions>{regions}</regions></worksheet>')
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('mathcad/worksheet.xml', worksheet)
+
+class FlakyConverter(McdxToCalcpadConverter):
+    """Convertidor cuya primera conversión falla (archivo a medio escribir)"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def convert(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise OSError("archivo a medio escribir")
+        return super().convert(*args, **kwargs)
+
+def check(name, ok):
+    print(f"  {name:<52} {'OK' if ok else 'ERROR'}")
+    return ok
+
+if __name__ == '__main__':
+    converter = McdxToCalcpadConverter()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mcdx = Path(tmp) / 'hoja.mcdx'
+
+        write_mcdx(mcdx, ["Datos de la losa", "Cargas"])
+        first = converter.convert(str(mcdx))
+        results.append(check("Primera conversion: 2 regiones convertidas",
+                             (converter.cache_hits, converter.cache_misses) == (0, 2)))
+
+        again = converter.convert(str(mcdx))
+        results.append(check("Sin cambios: 2 regiones del cache, misma salida",
+                             (converter.cache_hits, converter.cache_misses) == (2, 0) and again == first))
+
+        write_mcdx(mcdx, ["Datos de la losa", "Cargas de servicio"])
+        edited = converter.convert(str(mcdx))
+        results.append(check("Region editada: 1 del cache, 1 reconvertida",
+                             (converter.cache_hits, converter.cache_misses) == (1, 1)))
+        results.append(check("Salida con el texto editado",
+                             "' Cargas de servicio" in edited and "' Cargas\n" not in edited))
+
+        file_cache = converter.region_cache[str(mcdx.resolve())]
+        results.append(check("Cache del archivo: solo las 2 regiones vigentes", len(file_cache) == 2))
+
+        converter.forget(mcdx)
+        results.append(check("forget() descarta el cache del archivo", not converter.region_cache))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mcdx = Path(tmp) / 'hoja.mcdx'
+        write_mcdx(mcdx, ["Datos de la losa"])
+        flaky, known = FlakyConverter(), {}
+
+        _poll(Path(tmp), flaky, known)
+        results.append(check("watch: conversion fallida no queda registrada",
+                             mcdx not in known and not mcdx.with_suffix('.cpd').exists()))
+        _poll(Path(tmp), flaky, known)
+        results.append(check("watch: reintento sin cambios en el archivo",
+                             flaky.calls == 2 and mcdx in known and mcdx.with_suffix('.cpd').exists()))
+        _poll(Path(tmp), flaky, known)
+        results.append(check("watch: sin cambios no se vuelve a convertir", flaky.calls == 2))
+
+        mcdx.unlink()
+        _poll(Path(tmp), flaky, known)
+        results.append(check("watch: archivo borrado sale de known y del cache",
+                             not known and not flaky.region_cache))
+
+    print("\nTodas las pruebas OK" if all(results) else "\nHAY ERRORES")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+adaptive_plate_fem.py - Refinamiento adaptativo contra refinamiento uniforme
+
+Placa en voladizo Lx x Ly empotrada en x = 0 con una carga puntual en el
+centro del borde libre (x = Lx). El momento se concentra en las esquinas
+del empotramiento y bajo la carga, de modo que la malla uniforme gasta la
+mayoria de los DOF donde el error ya es pequeno.
+
+    uniforme:   mallas 3k x 2k (k = 1, 2, 4, ...)
+    adaptativa: resolver -> estimador ZZ -> marcado de Dorfler -> biseccion
+                por el lado mas largo (fem.adapt), desde la malla 3 x 2
+
+La referencia de la flecha en la punta es la extrapolacion de Richardson
+de los tres niveles uniformes mas finos. Se usa el triangulo DKT: el
+triangulo Mindlin de plate_fem_example.py sufre bloqueo por cortante en
+placas delgadas, que es un error global y no se corrige refinando solo
+donde el estimador es grande.
+
+Ejecutar: python adaptive_plate_fem.py [max_dof] [--kernel tri3-dkt] [--theta 0.5]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import rectangular_mesh
+from fem.model import Model, assemble_stiffness, solve
+from fem.adapt import zz_error, mark_elements, refine_triangles, observed_order
+
+Lx, Ly = 6.0, 4.0
+MATERIAL = {"E": 210e9, "nu": 0.3, "t": 0.1, "rho": 0.0}
+P = -10e3     # N, en (Lx, Ly/2)
+
+def cantilever_model(nodes, elements, kernel):
+    """Modelo en voladizo: empotrado en x = 0, carga puntual en el centro de x = Lx"""
+    model = Model(nodes, elements, kernel, MATERIAL)
+    model.fix(np.flatnonzero(np.isclose(nodes[:, 0], 0.0)))
+
+    tip = np.flatnonzero(np.isclose(nodes[:, 0], Lx) & np.isclose(nodes[:, 1], Ly / 2))
+    model.add_nodal_loads(tip, 0, P)
+    return model, tip[0]
+
+def analyze_mesh(nodes, elements, kernel):
+    """Resuelve y estima: (modelo, w en la punta, eta por elemento, error ZZ relativo)"""
+    model, tip = cantilever_model(nodes, elements, kernel)
+    U, _, _ = solve(model, assemble_stiffness(model))
+    u = U[:, 0]
+    eta, norm = zz_error(model, u)
+    return model, u[model.node_dofs([tip], 0)[0]], eta, np.sqrt(np.sum(eta**2)) / norm
+
+def uniform_study(kernel, max_dof):
+    rows = []
+    k = 1
+    while True:
+        nodes, elements = rectangular_mesh(Lx, Ly, 3 * k, 2 * k)
+        if 3 * len(nodes) > max_dof:
+            break
+        model, w_tip, _, zz = analyze_mesh(nodes, elements, kernel)
+        rows.append({"dof": model.num_dof, "elements": len(elements), "w": w_tip, "zz": zz})
+        k *= 2
+    return rows
+
+def adaptive_study(kernel, max_dof, theta):
+    rows = []
+    nodes, elements = rectangular_mesh(Lx, Ly, 3, 2)
+    while 3 * len(nodes) <= max_dof:
+        model, w_tip, eta, zz = analyze_mesh(nodes, elements, kernel)
+        rows.append({"dof": model.num_dof, "elements": len(elements), "w": w_tip, "zz": zz})
+        nodes, elements, _ = refine_triangles(nodes, elements, mark_elements(eta, theta))
+    return rows
+
+def print_rows(title, rows, w_ref):
+    print(title)
+    print(f"{'DOF':>9} {'Elementos':>10} {'w punta (mm)':>14} {'Error %':>10} {'ZZ %':>8}")
+    for r in rows:
+        r["error"] = abs(r["w"] - w_ref) / abs(w_ref)
+        print(f"{r['dof']:9d} {r['elements']:10d} {r['w'] * 1000:14.6f} {100 * r['error']:10.4f} "
+              f"{100 * r['zz']:8.3f}")
+    print()
+
+def dof_to_reach(rows, tol):
+    """Menor numero de DOF con error <= tol desde ese nivel en adelante"""
+    for i, r in enumerate(rows):
+        if all(s["error"] <= tol for s in rows[i:]):
+            return r["dof"]
+    return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("max_dof", nargs="?", type=int, default=60_000)
+    parser.add_argument("--kernel", default="tri3-dkt", choices=["tri3-dkt", "tri3-mindlin"])
+    parser.add_argument("--theta", type=float, default=0.5, help="fraccion de Dorfler")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"  Placa en voladizo {Lx} x {Ly} m, P = {P / 1e3} kN en la punta ({args.kernel})")
+    print("=" * 60)
+    print()
+
+    uniform = uniform_study(args.kernel, args.max_dof)
+    adaptive = adaptive_study(args.kernel, args.max_dof, args.theta)
+
+    p, w_ref = observed_order([r["w"] for r in uniform])
+    if np.isnan(w_ref):
+        w_ref = uniform[-1]["w"]
+        print(f"Referencia: malla uniforme mas fina, w = {w_ref * 1000:.6f} mm")
+    else:
+        print(f"Referencia (Richardson, p = {p:.2f}): w = {w_ref * 1000:.6f} mm")
+    print()
+
+    print_rows("Refinamiento uniforme:", uniform, w_ref)
+    print_rows(f"Refinamiento adaptativo (ZZ, Dorfler theta = {args.theta}):", adaptive, w_ref)
+
+    print("DOF necesarios para un error dado en la flecha de la punta:")
+    print(f"{'Error %':>9} {'Uniforme':>10} {'Adaptativo':>11} {'Razon':>7}")
+    for tol in (1e-3, 5e-4, 2e-4, 1e-4):
+        n_u, n_a = dof_to_reach(uniform, tol), dof_to_reach(adaptive, tol)
+        ratio = f"{n_a / n_u:7.2f}" if n_u and n_a else f"{'-':>7}"
+        print(f"{100 * tol:9.3f} {n_u or '-':>10} {n_a or '-':>11} {ratio}")
@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+"""
+benchmark_plate_fem.py - Benchmarks de rendimiento para plate_fem_example.py
+
+Ejecutar: python benchmark_plate_fem.py [benchmark ...] [--full] [--max-elements N]
+
+Sin nombres se ejecutan todos con tamanos reducidos (segundos); --full usa
+los tamanos completos (hasta 10^6 elementos y ~100k DOF en modos, varios
+minutos). --list muestra los nombres disponibles.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse.linalg import spsolve, cg, splu
+
+from plate_fem_example import (
+    generate_rectangular_mesh,
+    assemble_global_stiffness,
+    assemble_global_stiffness_coo,
+    get_local_stiffness_matrix,
+    apply_boundary_conditions,
+    assemble_global_mass_coo,
+)
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mindlin_tri import get_local_stiffness_matrices
+from fem.solvers import DofElimination, IterativeSolver, solve_load_cases
+from fem.mesh import rectangular_mesh
+from fem.renumber import NodeRenumbering, bandwidth_profile
+from fem.elemcache import ElementMatrixCache
+from fem.modal import ModalSolver
+from fem.store import ModelStore
+from fem.assembly import element_dof_map
+from fem.frame import frame_stiffness, frame_uniform_load, assemble_banded, banded_to_dense, BandedSolver
+
+# Por encima de este tamano los bucles por elemento (lil_matrix, Ke uno a
+# uno) tardan minutos; su tiempo se extrapola con un ajuste t = c n sobre los
+# tamanos medidos (ambos son O(n)) y se marca con "~"
+LOOP_MAX_ELEMENTS = 20_000
+
+E, nu, t = 210e9, 0.3, 0.1
+
+def mesh_for_elements(n_elem):
+    """Malla rectangular con aproximadamente n_elem triangulos"""
+    n = max(1, int(round(np.sqrt(n_elem / 2))))
+    return generate_rectangular_mesh(6.0, 4.0, n, n)
+
+def linear_estimate(sizes, times, n):
+    """Tiempo estimado para n con el ajuste por minimos cuadrados t = c n"""
+    sizes, times = np.asarray(sizes, dtype=float), np.asarray(times, dtype=float)
+    return n * (sizes @ times) / (sizes @ sizes)
+
+def print_loop_estimate_note(largest):
+    if largest > LOOP_MAX_ELEMENTS:
+        print(f"  ~ bucle no medido sobre {LOOP_MAX_ELEMENTS} elementos: estimado con t = c n "
+              f"ajustado a los tamanos medidos")
+
+def timed(func, *args):
+    """Ejecuta func(*args) y retorna (resultado, segundos)"""
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+# ============================================================
+# ENSAMBLAJE: LIL (bucle) vs COO (vectorizado)
+# ============================================================
+def benchmark_assembly(max_elements=10**6):
+    """Compara el ensamblaje con bucle lil_matrix contra el ensamblaje COO"""
+    print("=" * 72)
+    print("  Ensamblaje global: lil_matrix (bucle) vs COO (vectorizado)")
+    print("=" * 72)
+    print(f"{'Elementos':>10} {'DOF':>10} {'LIL (s)':>12} {'COO (s)':>12} {'Speedup':>10} {'Max |dK|':>12}")
+
+    sizes, loop_times = [], []
+    n_elem = 100
+    while n_elem <= max_elements:
+        nodes, elements = mesh_for_elements(n_elem)
+        K_coo, t_coo = timed(assemble_global_stiffness_coo, nodes, elements, E, nu, t)
+
+        if len(elements) <= LOOP_MAX_ELEMENTS:
+            K_lil, t_lil = timed(assemble_global_stiffness, nodes, elements, E, nu, t)
+            sizes.append(len(elements))
+            loop_times.append(t_lil)
+            diff = abs(K_lil - K_coo).max()
+            print(f"{len(elements):10d} {K_coo.shape[0]:10d} {t_lil:12.4f} {t_coo:12.4f} "
+                  f"{t_lil / t_coo:9.1f}x {diff:12.3e}")
+        else:
+            t_lil = linear_estimate(sizes, loop_times, len(elements))
+            print(f"{len(elements):10d} {K_coo.shape[0]:10d} {'~' + f'{t_lil:.4f}':>12} {t_coo:12.4f} "
+                  f"{'~' + f'{t_lil / t_coo:.1f}x':>10} {'-':>12}")
+
+        n_elem *= 10
+    print_loop_estimate_note(n_elem // 10)
+    print()
+
+# ============================================================
+# MATRICES DE ELEMENTO: una por llamada vs en lote (einsum)
+# ============================================================
+def element_matrices_loop(coords):
+    """Ke de todos los elementos llamando a la version escalar"""
+    return np.array([get_local_stiffness_matrix(c[0], c[1], c[2], E, nu, t) for c in coords])
+
+def benchmark_kernels(max_elements=10**6):
+    """Compara el calculo de Ke elemento por elemento contra el calculo en lote"""
+    print("=" * 72)
+    print("  Matrices de elemento: bucle Python vs lote (einsum)")
+    print("=" * 72)
+    print(f"{'Elementos':>10} {'Bucle (s)':>12} {'Lote (s)':>12} {'Speedup':>10} {'Max rel':>12}")
+
+    sizes, loop_times = [], []
+    n_elem = 100
+    while n_elem <= max_elements:
+        nodes, elements = mesh_for_elements(n_elem)
+        coords = nodes[elements][:, :, :2]
+        Ke, t_batch = timed(get_local_stiffness_matrices, coords, E, nu, t)
+
+        if len(elements) <= LOOP_MAX_ELEMENTS:
+            Ke_loop, t_loop = timed(element_matrices_loop, coords)
+            sizes.append(len(elements))
+            loop_times.append(t_loop)
+            rel = np.abs(Ke - Ke_loop).max() / np.abs(Ke_loop).max()
+            print(f"{len(elements):10d} {t_loop:12.4f} {t_batch:12.4f} {t_loop / t_batch:9.1f}x {rel:12.3e}")
+        else:
+            t_loop = linear_estimate(sizes, loop_times, len(elements))
+            print(f"{len(elements):10d} {'~' + f'{t_loop:.4f}':>12} {t_batch:12.4f} "
+                  f"{'~' + f'{t_loop / t_batch:.1f}x':>10} {'-':>12}")
+
+        n_elem *= 10
+    print_loop_estimate_note(n_elem // 10)
+    print()
+
+# ============================================================
+# CACHE DE MATRICES DE ELEMENTO: malla regular vs perturbada
+# ============================================================
+def jittered(nodes, amplitude, seed=0):
+    """Copia de nodes con los nodos desplazados al azar en el plano (malla no estructurada)"""
+    nodes = nodes.copy()
+    nodes[:, :2] += amplitude * np.random.default_rng(seed).uniform(-1, 1, (len(nodes), 2))
+    return nodes
+
+def benchmark_element_cache(max_elements=10**6):
+    """Compara el calculo de Ke en lote contra el cache por geometria canonica"""
+    print("=" * 72)
+    print("  Cache de matrices de elemento (geometria canonica)")
+    print("=" * 72)
+    print(f"{'Elementos':>10} {'Malla':>10} {'Lote (s)':>10} {'Cache (s)':>10} {'Unicas':>10} {'Aciertos':>10} {'Max rel':>10}")
+
+    n_elem = 100
+    while n_elem <= max_elements:
+        nodes, elements = mesh_for_elements(n_elem)
+        h = 6.0 / np.sqrt(len(elements) / 2)
+
+        for label, mesh_nodes in (("regular", nodes), ("perturbada", jittered(nodes, 0.05 * h))):
+            coords = mesh_nodes[elements][:, :, :2]
+            Ke, t_batch = timed(get_local_stiffness_matrices, coords, E, nu, t)
+
+            cache = ElementMatrixCache()
+            Ke_cache, t_cache = timed(
+                cache.element_matrices, coords,
+                lambda c: get_local_stiffness_matrices(c, E, nu, t), "tri-mindlin", (E, nu, t))
+            rel = np.abs(Ke - Ke_cache).max() / np.abs(Ke).max()
+            print(f"{len(elements):10d} {label:>10} {t_batch:10.4f} {t_cache:10.4f} "
+                  f"{len(cache):10d} {100 * cache.hit_rate:9.1f}% {rel:10.2e}")
+
+        n_elem *= 10
+    print()
+
+# ============================================================
+# CONDICIONES DE FRONTERA: penalizacion 1e20 vs eliminacion
+# ============================================================
+def plate_problem(n):
+    """Placa empotrada n x n con carga uniforme: (K, F, fixed_dofs)"""
+    Lx, Ly = 6.0, 4.0
+    nodes, elements = generate_rectangular_mesh(Lx, Ly, n, n)
+    K = assemble_global_stiffness_coo(nodes, elements, E, nu, t)
+
+    F = np.zeros(K.shape[0])
+    F[::3] = -1000.0 * Lx * Ly / len(nodes)
+
+    x, y = nodes[:, 0], nodes[:, 1]
+    edge = (np.abs(x) < 1e-6) | (np.abs(x - Lx) < 1e-6) | (np.abs(y) < 1e-6) | (np.abs(y - Ly) < 1e-6)
+    fixed_dofs = (np.flatnonzero(edge)[:, None] * 3 + np.arange(3)).ravel()
+    return K, F, fixed_dofs
+
+def cg_iterations(A, b, maxiter):
+    """Resuelve con CG sin precondicionar y retorna (x, iteraciones, convergio)"""
+    count = [0]
+    def callback(xk):
+        count[0] += 1
+    x, info = cg(A, b, rtol=1e-8, maxiter=maxiter, callback=callback)
+    return x, count[0], info == 0
+
+def benchmark_boundary_conditions(max_divisions=128):
+    """Compara penalizacion + spsolve contra eliminacion + spsolve / CG"""
+    print("=" * 72)
+    print("  Condiciones de frontera: penalizacion 1e20 vs eliminacion de DOF")
+    print("=" * 72)
+    print(f"{'n':>5} {'DOF':>8} {'Penal (s)':>10} {'Elim (s)':>10} {'CG penal':>12} {'CG elim':>12} {'Max |dU|':>10}")
+
+    n = 8
+    while n <= max_divisions:
+        K, F, fixed_dofs = plate_problem(n)
+        maxiter = 5000
+
+        t0 = time.perf_counter()
+        Kp, Fp = apply_boundary_conditions(K, F.copy(), fixed_dofs)
+        U_pen = spsolve(Kp, Fp)
+        t_pen = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        bc = DofElimination(K.shape[0], fixed_dofs)
+        K_ff, F_f = bc.reduce(K, F)
+        U = bc.expand(spsolve(K_ff, F_f))
+        t_elim = time.perf_counter() - t0
+
+        _, it_pen, ok_pen = cg_iterations(Kp, Fp, maxiter)
+        _, it_elim, ok_elim = cg_iterations(K_ff, F_f, maxiter)
+
+        cg_pen = f"{it_pen}" + ("" if ok_pen else " (no)")
+        cg_elim = f"{it_elim}" + ("" if ok_elim else " (no)")
+        print(f"{n:5d} {K.shape[0]:8d} {t_pen:10.4f} {t_elim:10.4f} {cg_pen:>12} {cg_elim:>12} "
+              f"{np.abs(U - U_pen).max():10.2e}")
+
+        n *= 2
+    print()
+
+# ============================================================
+# MULTIPLES CASOS DE CARGA: spsolve por caso vs factorizar una vez
+# ============================================================
+def benchmark_load_cases(n=96, max_cases=32):
+    """Tiempo de resolver n_cases casos con spsolve repetido vs una factorizacion"""
+    print("=" * 72)
+    print(f"  Casos de carga (malla {n}x{n}): spsolve por caso vs factorizar una vez")
+    print("=" * 72)
+    print(f"{'Casos':>6} {'spsolve (s)':>12} {'Factor (s)':>12} {'Cache (s)':>12} {'Max |dU|':>10}")
+
+    K, F, fixed_dofs = plate_problem(n)
+    bc = DofElimination(K.shape[0], fixed_dofs)
+    K_ff, _ = bc.reduce(K, F)
+    rng = np.random.default_rng(0)
+
+    n_cases = 1
+    while n_cases <= max_cases:
+        F_cases = F[:, None] * rng.random(n_cases)
+
+        t0 = time.perf_counter()
+        U_ref = np.column_stack([bc.expand(spsolve(K_ff, bc.reduce(K, F_cases[:, c])[1]))
+                                 for c in range(n_cases)])
+        t_spsolve = time.perf_counter() - t0
+
+        # La primera llamada factoriza y llena el cache; la segunda lo reutiliza
+        key = f"benchmark-{n}-{n_cases}"
+        (U, _), t_factor = timed(solve_load_cases, K, F_cases, bc, key)
+        _, t_cached = timed(solve_load_cases, K, F_cases, bc, key)
+
+        print(f"{n_cases:6d} {t_spsolve:12.4f} {t_factor:12.4f} {t_cached:12.4f} "
+              f"{np.abs(U - U_ref).max():10.2e}")
+        n_cases *= 2
+    print()
+
+# ============================================================
+# GENERACION DE MALLAS ESTRUCTURADAS
+# ============================================================
+def benchmark_mesh(max_nodes=10**7):
+    """Tiempo de generar mallas de triangulos y cuadrilateros hasta max_nodes nodos"""
+    print("=" * 72)
+    print("  Generacion de mallas estructuradas (fem.mesh)")
+    print("=" * 72)
+    print(f"{'Nodos':>10} {'Triangulos':>12} {'Tri (s)':>10} {'Quads':>12} {'Quad (s)':>10}")
+
+    n_nodes = 10**4
+    while n_nodes <= max_nodes:
+        n = int(round(np.sqrt(n_nodes))) - 1
+        (nodes, tris), t_tri = timed(rectangular_mesh, 6.0, 4.0, n, n, "tri")
+        (_, quads), t_quad = timed(rectangular_mesh, 6.0, 4.0, n, n, "quad", "y", 1)
+        print(f"{len(nodes):10d} {len(tris):12d} {t_tri:10.4f} {len(quads):12d} {t_quad:10.4f}")
+        del nodes, tris, quads
+        n_nodes *= 10
+    print()
+
+# ============================================================
+# RENUMERACION RCM: ancho de banda, perfil y factorizacion
+# ============================================================
+def factorization_stats(K_ff, permc_spec):
+    """Tiempo y memoria (MB de L+U) de splu con el ordenamiento de columnas dado"""
+    t0 = time.perf_counter()
+    lu = splu(K_ff.tocsc(), permc_spec=permc_spec)
+    elapsed = time.perf_counter() - t0
+    nnz = lu.L.nnz + lu.U.nnz
+    return elapsed, nnz * (8 + 4) / 1e6
+
+def renumbering_cases():
+    """Mallas de prueba: franja larga numerada a lo largo y malla con nodos barajados"""
+    nodes, elements = rectangular_mesh(20.0, 0.5, 400, 10, ndim=3)
+    yield "Franja 400x10", nodes, elements
+
+    nodes, elements = rectangular_mesh(6.0, 4.0, 30, 30, ndim=3)
+    shuffle = np.random.default_rng(0).permutation(len(nodes))
+    yield "Barajada 30x30", nodes[shuffle], np.argsort(shuffle)[elements]
+
+def benchmark_renumbering():
+    """Ancho de banda, perfil y costo de factorizacion antes/despues de RCM"""
+    print("=" * 72)
+    print("  Renumeracion RCM de nodos")
+    print("=" * 72)
+
+    for name, nodes, elements in renumbering_cases():
+        num_nodes = len(nodes)
+        rn = NodeRenumbering.rcm(elements, num_nodes)
+
+        print(f"{name} ({3 * num_nodes} DOF):")
+        print(f"  {'':>10} {'Banda':>8} {'Perfil':>12} {'NATURAL (s)':>12} {'MB':>8} {'COLAMD (s)':>11} {'MB':>8}")
+
+        for label, renumbering in (("Original", NodeRenumbering.identity(num_nodes)), ("RCM", rn)):
+            K = assemble_global_stiffness_coo(renumbering.nodes(nodes), renumbering.elements(elements), E, nu, t)
+            fixed = renumbering.dofs_to_new(np.arange(3), 3)
+            K_ff, _ = DofElimination(K.shape[0], fixed).reduce(K, np.zeros(K.shape[0]))
+
+            bandwidth, profile = bandwidth_profile(K)
+            t_nat, mb_nat = factorization_stats(K_ff, "NATURAL")
+            t_col, mb_col = factorization_stats(K_ff, "COLAMD")
+            print(f"  {label:>10} {bandwidth:8d} {profile:12d} {t_nat:12.4f} {mb_nat:8.1f} {t_col:11.4f} {mb_col:8.1f}")
+        print()
+
+# ============================================================
+# MODOS DE VIBRACION: eigsh shift-invert con factorizacion reutilizada
+# ============================================================
+def benchmark_modal(max_divisions=184, n_modes=10, budget=60.0):
+    """Tiempo de factorizar K_ff y extraer n_modes modos (masa consistente y concentrada)
+
+    La masa concentrada reutiliza el OPinv de la consistente (una sola
+    factorizacion por malla); "Sin reuso" es el tiempo que costaria volver a
+    factorizar. Se detiene al pasar budget segundos acumulados.
+    """
+    print("=" * 84)
+    print(f"  Modos de vibracion: {n_modes} modos, eigsh shift-invert (sigma = 0)")
+    print("=" * 84)
+    print(f"{'n':>5} {'DOF libres':>11} {'Factor (s)':>11} {'Consist (s)':>12} {'Concent (s)':>12} "
+          f"{'Sin reuso (s)':>14} {'f1 (Hz)':>10} {'Reuso':>6}")
+
+    total = 0.0
+    n = 23
+    while n <= max_divisions:
+        K, _, fixed_dofs = plate_problem(n)
+        nodes, elements = generate_rectangular_mesh(6.0, 4.0, n, n)
+        bc = DofElimination(K.shape[0], fixed_dofs)
+        zeros = np.zeros(K.shape[0])
+        K_ff, _ = bc.reduce(K, zeros)
+        M_ff, _ = bc.reduce(assemble_global_mass_coo(nodes, elements, 7850.0, t), zeros)
+        M_l_ff, _ = bc.reduce(assemble_global_mass_coo(nodes, elements, 7850.0, t, lumped=True), zeros)
+
+        solver, t_factor = timed(ModalSolver, K_ff, M_ff)
+        (f, _), t_cons = timed(solver.modes, n_modes)
+        lumped = ModalSolver(K_ff, M_l_ff, OPinv=solver.OPinv)
+        _, t_lump = timed(lumped.modes, n_modes)
+        shared = lumped.OPinv is solver.OPinv
+        print(f"{n:5d} {K_ff.shape[0]:11d} {t_factor:11.4f} {t_cons:12.4f} {t_lump:12.4f} "
+              f"{t_factor + t_lump:14.4f} {f[0]:10.3f} {'OK' if shared else 'ERROR':>6}")
+
+        total += t_factor + t_cons + t_lump
+        if total > budget:
+            print(f"  Presupuesto de {budget:.0f} s superado ({total:.1f} s); mallas mayores omitidas")
+            break
+        n *= 2
+    print()
+
+# ============================================================
+# ENSAMBLAJE POR TRAMOS EN UN POOL DE HILOS
+# ============================================================
+def traced(func, *args, **kwargs):
+    """Ejecuta func y retorna (resultado, segundos, pico de memoria en MB segun tracemalloc)"""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+def benchmark_chunked_assembly(max_elements=10**6, chunk_sizes=(1024, 4096, 16384)):
+    """Pico de memoria y elementos/s del ensamblaje en una llamada vs por tramos"""
+    workers = os.cpu_count()
+    print("=" * 72)
+    print(f"  Ensamblaje por tramos: una llamada vs tramos en {workers} hilos")
+    print("=" * 72)
+    print(f"{'Elementos':>10} {'Modo':>16} {'Tiempo (s)':>11} {'Elem/s':>12} {'Pico (MB)':>10} {'Max |dK|':>10}")
+
+    n_elem = 10**4
+    while n_elem <= max_elements:
+        nodes, elements = mesh_for_elements(n_elem)
+        K_ref, t_ref, mb_ref = traced(assemble_global_stiffness_coo, nodes, elements, E, nu, t)
+        print(f"{len(elements):10d} {'una llamada':>16} {t_ref:11.4f} {len(elements) / t_ref:12.0f} {mb_ref:10.1f} {'-':>10}")
+
+        for chunk_size in chunk_sizes:
+            K, t_chunk, mb_chunk = traced(assemble_global_stiffness_coo, nodes, elements, E, nu, t,
+                                          chunk_size=chunk_size, workers=workers)
+            diff = abs(K - K_ref).max()
+            print(f"{'':10} {f'tramos {chunk_size}':>16} {t_chunk:11.4f} {len(elements) / t_chunk:12.0f} "
+                  f"{mb_chunk:10.1f} {diff:10.2e}")
+
+        n_elem *= 10
+    print()
+
+# ============================================================
+# SOLVER ITERATIVO: PCG con precondicionador reutilizable vs splu
+# ============================================================
+# Por encima de este tamano spilu (SuperLU) tarda mas de 10 minutos en preparar
+ILU_MAX_DOF = 100_000
+
+def benchmark_iterative(max_divisions=256, preconditioners=("jacobi", "block-jacobi", "ilu")):
+    """Tiempo, iteraciones y memoria de CG precondicionado contra la factorizacion directa"""
+    print("=" * 72)
+    print("  Solver iterativo: CG precondicionado vs splu (COLAMD)")
+    print("=" * 72)
+    print(f"{'n':>5} {'DOF libres':>11} {'Metodo':>18} {'Prep (s)':>9} {'Sol (s)':>9} {'Iter':>6} "
+          f"{'Mem (MB)':>9} {'Max |dU|':>10}")
+
+    n = 32
+    while n <= max_divisions:
+        K, F, fixed_dofs = plate_problem(n)
+        bc = DofElimination(K.shape[0], fixed_dofs)
+        K_ff, F_f = bc.reduce(K, F)
+
+        lu, t_lu = timed(splu, K_ff.tocsc())
+        U_d, t_d = timed(lu.solve, F_f)
+        mb_lu = (lu.L.nnz + lu.U.nnz) * (8 + 4) / 1e6
+        print(f"{n:5d} {K_ff.shape[0]:11d} {'splu':>18} {t_lu:9.4f} {t_d:9.4f} {'-':>6} {mb_lu:9.1f} {'-':>10}")
+        del lu
+
+        for name in preconditioners:
+            if name == "ilu" and K_ff.shape[0] > ILU_MAX_DOF:
+                continue
+            solver = IterativeSolver(K_ff, "cg", name, blocks=bc.free // 3, maxiter=20_000)
+            U, t_s = timed(solver.solve, F_f)
+            h = solver.history[-1]
+            # Precondicionador (CSR o factor incompleto) + 4 vectores de CG
+            mb = (getattr(solver.M, "nnz", 0) * (8 + 4) + 4 * 8 * K_ff.shape[0]) / 1e6
+            its = f"{h['iterations']}" + ("" if h["converged"] else "!")
+            print(f"{'':5} {'':11} {'cg + ' + name:>18} {solver.setup_time:9.4f} {t_s:9.4f} {its:>6} "
+                  f"{mb:9.1f} {np.max(np.abs(U - U_d)):10.2e}")
+        n *= 2
+    print()
+
+def benchmark_warm_start(n=64, steps=8, preconditioner="block-jacobi"):
+    """Pasos de carga (carga puntual que recorre la placa): CG desde cero vs warm start"""
+    print("=" * 72)
+    print(f"  Warm start: {steps} pasos de carga, cg + {preconditioner}, malla {n}x{n}")
+    print("=" * 72)
+
+    K, F, fixed_dofs = plate_problem(n)
+    bc = DofElimination(K.shape[0], fixed_dofs)
+    nodes, _ = generate_rectangular_mesh(6.0, 4.0, n, n)
+
+    # Carga uniforme + carga puntual que avanza sobre la linea media
+    targets = np.column_stack([np.linspace(1.0, 5.0, steps), np.full(steps, 2.0)])
+    F_steps = np.repeat(F[:, None], steps, axis=1)
+    for k, (x, y) in enumerate(targets):
+        node = np.argmin((nodes[:, 0] - x)**2 + (nodes[:, 1] - y)**2)
+        F_steps[3 * node, k] += -10e3
+    K_ff, F_f = bc.reduce(K, F_steps)
+
+    print(f"{'Arranque':>10} {'Iter total':>11} {'Iter/paso':>10} {'Tiempo (s)':>11}")
+    for warm in (False, True):
+        solver = IterativeSolver(K_ff, "cg", preconditioner, blocks=bc.free // 3, warm_start=warm)
+        _, elapsed = timed(solver.solve, F_f)
+        its = [h["iterations"] for h in solver.history]
+        print(f"{'warm' if warm else 'cero':>10} {sum(its):11d} {np.mean(its):10.1f} {elapsed:11.4f}")
+    print()
+
+# ============================================================
+# ALMACEN EN DISCO: ensamblar vs recargar con mmap
+# ============================================================
+def benchmark_store(max_elements=10**6):
+    """Tiempo de ensamblar K contra guardarla y reabrirla mapeada en memoria"""
+    print("=" * 72)
+    print("  Almacen de modelos: ensamblaje vs recarga .npy con mmap_mode='r'")
+    print("=" * 72)
+    print(f"{'Elementos':>10} {'nnz':>11} {'Ensamb (s)':>11} {'Guardar (s)':>12} {'Recarga (s)':>12} "
+          f"{'K x (s)':>9} {'Max |dKx|':>10}")
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ModelStore(root)
+        n_elem = 10**4
+        while n_elem <= max_elements:
+            nodes, elements = mesh_for_elements(n_elem)
+            K, t_asm = timed(assemble_global_stiffness_coo, nodes, elements, E, nu, t)
+            key = f"plate-{len(elements)}"
+            _, t_save = timed(store.save_csr, key, "K", K)
+            K_mm, t_load = timed(store.load_csr, key, "K")
+
+            # Primer producto sobre el mmap: incluye leer las paginas del disco/cache
+            x = np.ones(K.shape[0])
+            Kx, t_mv = timed(K_mm.dot, x)
+            diff = np.max(np.abs(Kx - K @ x))
+            print(f"{len(elements):10d} {K.nnz:11d} {t_asm:11.4f} {t_save:12.4f} {t_load:12.5f} "
+                  f"{t_mv:9.4f} {diff:10.2e}")
+            n_elem *= 10
+    print()
+
+# ============================================================
+# PORTICOS 2D: banda simetrica vs solve denso
+# ============================================================
+# Por encima de este numero de DOF el solve denso ocupa demasiada memoria
+DENSE_MAX_DOF = 6_000
+
+def frame_problem(n_bays, n_stories, bay=6.0, story=3.0):
+    """Portico de n_bays vanos y n_stories pisos (n_stories = 0: viga continua)
+
+    Nodos numerados por nivel, de modo que el semi-ancho de banda es
+    3 (n_bays + 1) + 2 en porticos y 5 en la viga continua.
+    """
+    per_level = n_bays + 1
+    x, y = np.meshgrid(np.arange(per_level) * bay, np.arange(n_stories + 1) * story)
+    nodes = np.column_stack([x.ravel(), y.ravel()])
+    ids = np.arange(len(nodes)).reshape(n_stories + 1, per_level)
+
+    beams = np.column_stack([ids[1:, :-1].ravel(), ids[1:, 1:].ravel()]) if n_stories else \
+        np.column_stack([ids[0, :-1], ids[0, 1:]])
+    columns = np.column_stack([ids[:-1].ravel(), ids[1:].ravel()])
+    elements = np.vstack([beams, columns])
+
+    num_dof = 3 * len(nodes)
+    dofs = element_dof_map(elements, 3)
+    Ke = frame_stiffness(nodes, elements, 210e9, 0.01, 833.3e-8)
+
+    # Carga uniforme en las vigas
+    q = np.where(np.arange(len(elements)) < len(beams), -10e3, 0.0)
+    p_global, _ = frame_uniform_load(nodes, elements, q)
+    F = np.zeros(num_dof)
+    np.add.at(F, dofs, p_global)
+
+    if n_stories:
+        fixed = 3 * ids[0][:, None] + np.arange(3)
+    else:
+        fixed = np.r_[0, 3 * ids[0] + 1]
+    return Ke, dofs, num_dof, F, np.ravel(fixed)
+
+def benchmark_frame(max_members=10**6):
+    """Viga continua y portico: ensamblaje en banda + Cholesky en banda vs solve denso"""
+    print("=" * 72)
+    print("  Porticos 2D: banda simetrica (cholesky_banded) vs np.linalg.solve denso")
+    print("=" * 72)
+    print(f"{'Modelo':>16} {'Barras':>8} {'DOF':>9} {'u':>4} {'Ensamb (s)':>11} {'Banda (s)':>10} "
+          f"{'Denso (s)':>10} {'Max |dU|':>10}")
+
+    cases = [(n, 0) for n in (100, 1_000, 10_000, 100_000, 1_000_000)]
+    cases += [(n, n) for n in (5, 10, 20, 40, 80)]
+    for n_bays, n_stories in cases:
+        Ke, dofs, num_dof, F, fixed = frame_problem(n_bays, n_stories)
+        if len(Ke) > max_members:
+            continue
+
+        ab, t_asm = timed(assemble_banded, Ke, dofs, num_dof)
+        solver, t_factor = timed(BandedSolver, ab, fixed)
+        U, t_solve = timed(solver.solve, F)
+
+        dense, diff = "-", "-"
+        if num_dof <= DENSE_MAX_DOF:
+            K = banded_to_dense(ab)
+            free = np.setdiff1d(np.arange(num_dof), fixed)
+            U_d = np.zeros(num_dof)
+            U_d[free], t_dense = timed(np.linalg.solve, K[np.ix_(free, free)], F[free])
+            dense, diff = f"{t_dense:10.4f}", f"{np.max(np.abs(U - U_d)):10.2e}"
+
+        label = f"viga {n_bays}" if n_stories == 0 else f"portico {n_bays}x{n_stories}"
+        print(f"{label:>16} {len(Ke):8d} {num_dof:9d} {solver.bandwidth:4d} {t_asm:11.4f} "
+              f"{t_factor + t_solve:10.4f} {dense:>10} {diff:>10}")
+    print()
+
+# ============================================================
+# SELECCION DE BENCHMARKS
+# ============================================================
+QUICK_ELEMENTS = 10_000
+FULL_ELEMENTS = 10**6
+
+def benchmark_suite(full=False, max_elements=None):
+    """{nombre: funcion sin argumentos} con tamanos reducidos o completos (full)"""
+    if max_elements is None:
+        max_elements = FULL_ELEMENTS if full else QUICK_ELEMENTS
+    return {
+        "mesh": lambda: benchmark_mesh(10**7 if full else 10**5),
+        "kernels": lambda: benchmark_kernels(max_elements),
+        "cache": lambda: benchmark_element_cache(max_elements),
+        "assembly": lambda: benchmark_assembly(max_elements),
+        "chunked": lambda: benchmark_chunked_assembly(max_elements),
+        "bc": lambda: benchmark_boundary_conditions(128 if full else 32),
+        "load-cases": lambda: benchmark_load_cases(*((96, 32) if full else (32, 8))),
+        "renumbering": benchmark_renumbering,
+        "modal": lambda: benchmark_modal(184 if full else 46),
+        "iterative": lambda: benchmark_iterative(256 if full else 64),
+        "warm-start": lambda: benchmark_warm_start(64 if full else 32),
+        "store": lambda: benchmark_store(max_elements),
+        "frame": lambda: benchmark_frame(max_elements),
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help="benchmarks a ejecutar (por defecto: todos); ver --list")
+    parser.add_argument("--full", action="store_true",
+                        help="tamanos completos (varios minutos) en lugar de los reducidos")
+    parser.add_argument("--max-elements", type=lambda v: int(float(v)), default=None,
+                        help=f"tope de elementos (por defecto {QUICK_ELEMENTS}, {FULL_ELEMENTS} con --full)")
+    parser.add_argument("--list", action="store_true", help="muestra los benchmarks disponibles")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.benchmarks if name not in benchmark_suite()]
+    if unknown:
+        parser.error(f"benchmark desconocido {unknown[0]!r}; disponibles: {', '.join(benchmark_suite())}")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    suite = benchmark_suite(args.full, args.max_elements)
+    if args.list:
+        print("\n".join(suite))
+        sys.exit(0)
+
+    for name in args.benchmarks or suite:
+        suite[name]()
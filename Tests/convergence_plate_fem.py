@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+convergence_plate_fem.py - Estudio de convergencia de malla para plate_fem_example.py
+
+Resuelve la placa empotrada con una escalera de refinamiento (2 -> 256
+divisiones por lado) en un pool de procesos. Por nivel registra DOF,
+tiempos de ensamblaje y solucion, memoria pico y error de w_max contra la
+referencia, y ajusta la tasa de convergencia (error ~ h^p) y el escalado del
+costo (tiempo ~ DOF^s). El orden observado y el valor extrapolado de
+Richardson se calculan con los tres niveles mas finos, sin la referencia.
+
+Ejecutar: python convergence_plate_fem.py [max_divisiones] [--workers N] [--reference w_mm]
+
+La referencia por defecto es la del ejemplo, 0.00126 q a^4 / D; con
+--reference se usa otro valor de w_max en mm (Calcpad, SAP2000).
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse.linalg import splu
+
+from plate_fem_example import generate_rectangular_mesh, assemble_global_stiffness_coo
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import boundary_nodes
+from fem.elemcache import ElementMatrixCache
+from fem.solvers import DofElimination
+from fem.adapt import observed_order
+
+# Mismo problema que plate_fem_example.py
+Lx, Ly = 6.0, 4.0
+E, nu, t = 210e9, 0.3, 0.1
+q = -1000.0
+
+def analytical_w_max():
+    """Deflexion maxima de referencia del ejemplo (mm): 0.00126 q a^4 / D"""
+    D = E * t**3 / (12.0 * (1.0 - nu**2))
+    a = min(Lx, Ly)
+    return 0.00126 * abs(q) * a**4 / D * 1000
+
+def run_level(n):
+    """Resuelve la malla n x n y retorna las metricas del nivel (en un proceso del pool)"""
+    tracemalloc.start()
+
+    t0 = time.perf_counter()
+    nodes, elements = generate_rectangular_mesh(Lx, Ly, n, n)
+    num_dof = 3 * len(nodes)
+    K = assemble_global_stiffness_coo(nodes, elements, E, nu, t, ElementMatrixCache())
+    t_assembly = time.perf_counter() - t0
+
+    F = np.zeros(num_dof)
+    F[::3] = q * Lx * Ly / len(nodes)
+    edge = boundary_nodes(nodes, Lx, Ly)
+    fixed_dofs = (edge[:, None] * 3 + np.arange(3)).ravel()
+
+    t0 = time.perf_counter()
+    bc = DofElimination(num_dof, fixed_dofs)
+    K_ff, F_f = bc.reduce(K, F)
+    lu = splu(K_ff.tocsc())
+    U = bc.expand(lu.solve(F_f))
+    t_solve = time.perf_counter() - t0
+
+    # tracemalloc no ve la memoria interna de SuperLU: se reporta aparte (L+U)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lu_mb = (lu.L.nnz + lu.U.nnz) * (8 + 4) / 1e6
+
+    return {
+        "n": n,
+        "h": Lx / n,
+        "dof": num_dof,
+        "assembly": t_assembly,
+        "solve": t_solve,
+        "peak_mb": peak / 1e6,
+        "lu_mb": lu_mb,
+        "w_max": abs(np.min(U[::3])) * 1000,
+    }
+
+def refinement_ladder(n_min=2, n_max=256):
+    """Divisiones por lado n_min, 2*n_min, ... <= n_max"""
+    levels = []
+    n = n_min
+    while n <= n_max:
+        levels.append(n)
+        n *= 2
+    return levels
+
+def run_study(levels, workers=None):
+    """Ejecuta los niveles en un pool de procesos y los retorna ordenados por n"""
+    # Los niveles mas caros primero para no dejar el mas grande al final
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run_level, sorted(levels, reverse=True)))
+    return sorted(results, key=lambda r: r["n"])
+
+def fit_power_law(x, y):
+    """Exponente p y constante C de y ~ C x^p (minimos cuadrados en log-log)"""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    ok = (x > 0) & (y > 0)
+    if np.count_nonzero(ok) < 2:
+        return np.nan, np.nan
+    p, logC = np.polyfit(np.log(x[ok]), np.log(y[ok]), 1)
+    return p, np.exp(logC)
+
+def print_study(results, w_ref):
+    """Tabla por nivel y ajustes de convergencia y costo"""
+    print("=" * 92)
+    print(f"  Convergencia de malla - placa empotrada {Lx} x {Ly} m (w_ref = {w_ref:.6f} mm)")
+    print("=" * 92)
+    print(f"{'n':>5} {'h (m)':>8} {'DOF':>9} {'Ensamb (s)':>11} {'Solucion (s)':>13} "
+          f"{'Pico (MB)':>10} {'L+U (MB)':>9} {'w_max (mm)':>11} {'Error %':>9}")
+
+    for r in results:
+        r["error"] = abs(r["w_max"] - w_ref) / w_ref
+        print(f"{r['n']:5d} {r['h']:8.4f} {r['dof']:9d} {r['assembly']:11.4f} {r['solve']:13.4f} "
+              f"{r['peak_mb']:10.1f} {r['lu_mb']:9.1f} {r['w_max']:11.6f} {100 * r['error']:9.3f}")
+    print()
+
+    h = [r["h"] for r in results]
+    dof = [r["dof"] for r in results]
+    p, _ = fit_power_law(h, [r["error"] for r in results])
+    s_asm, _ = fit_power_law(dof, [r["assembly"] for r in results])
+    s_sol, _ = fit_power_law(dof, [r["solve"] for r in results])
+    s_mem, _ = fit_power_law(dof, [r["peak_mb"] + r["lu_mb"] for r in results])
+
+    # Las mallas gruesas distorsionan el ajuste de costo: se reporta tambien la mitad fina
+    fine = results[len(results) // 2:]
+    s_fine, _ = fit_power_law([r["dof"] for r in fine], [r["assembly"] + r["solve"] for r in fine])
+
+    p_obs, w_extrap = observed_order([r["w_max"] for r in results])
+
+    print("Ajustes (minimos cuadrados log-log):")
+    print(f"  Error vs h:            p = {p:6.3f}   (error ~ h^p)")
+    if np.isnan(p_obs):
+        print("  Orden observado:       -        (3 niveles finos fuera del rango asintotico)")
+    else:
+        print(f"  Orden observado:       p = {p_obs:6.3f}   (3 niveles finos, sin referencia)")
+        print(f"  w_max extrapolado:     {w_extrap:.6f} mm (Richardson)")
+    print(f"  Ensamblaje vs DOF:     s = {s_asm:6.3f}")
+    print(f"  Solucion vs DOF:       s = {s_sol:6.3f}")
+    print(f"  Memoria vs DOF:        s = {s_mem:6.3f}")
+    print(f"  Total vs DOF (finas):  s = {s_fine:6.3f}")
+    print()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("max_divisions", nargs="?", type=int, default=256)
+    parser.add_argument("--min-divisions", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool (por defecto: CPUs)")
+    parser.add_argument("--reference", type=float, default=None,
+                        help="w_max de referencia en mm (Calcpad/SAP2000); por defecto la analitica")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    w_ref = args.reference if args.reference is not None else analytical_w_max()
+    levels = refinement_ladder(args.min_divisions, args.max_divisions)
+
+    t0 = time.perf_counter()
+    results = run_study(levels, args.workers)
+    print_study(results, w_ref)
+    print(f"Tiempo total del estudio: {time.perf_counter() - t0:.2f} s")
@@ -6,40 +6,28 @@ Basado en Awatif-FEM (elementos shell triangulares)
 Ejecutar: python plate_fem_example.py
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
-from scipy.sparse import lil_matrix, csr_matrix
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import lil_matrix
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import rectangular_mesh
+from fem.renumber import NodeRenumbering, node_adjacency, bandwidth_profile
+from fem.elemcache import ElementMatrixCache
+from fem.modal import ModalSolver, modal_mass_participation
+from fem.solvers import DofElimination, cached_solver, solve_load_cases, combine_load_cases
+from fem.model import Model, assemble_stiffness, assemble_mass, resultants
+from fem.store import ModelStore, array_hash
 
 # ============================================================
 # GENERACION DE MALLA
 # ============================================================
 def generate_rectangular_mesh(Lx, Ly, nx, ny):
-    """Genera malla triangular para rectangulo"""
-    nodes = []
-    elements = []
-
-    dx = Lx / nx
-    dy = Ly / ny
-
-    # Generar nodos
-    for j in range(ny + 1):
-        for i in range(nx + 1):
-            nodes.append([i * dx, j * dy, 0])
-
-    # Generar elementos triangulares
-    for j in range(ny):
-        for i in range(nx):
-            n1 = j * (nx + 1) + i
-            n2 = j * (nx + 1) + i + 1
-            n3 = (j + 1) * (nx + 1) + i + 1
-            n4 = (j + 1) * (nx + 1) + i
-
-            # Triangulo 1: n1-n2-n4
-            elements.append([n1, n2, n4])
-            # Triangulo 2: n2-n3-n4
-            elements.append([n2, n3, n4])
-
-    return np.array(nodes), np.array(elements)
+    """Genera malla triangular para rectangulo (nodos con z = 0, base 0)"""
+    return rectangular_mesh(Lx, Ly, nx, ny, element="tri", order="x", base=0, ndim=3)
 
 # ============================================================
 # MATRIZ DE RIGIDEZ DE PLACA (MINDLIN-REISSNER SIMPLIFICADO)
@@ -188,6 +176,39 @@ def assemble_global_stiffness(nodes, elements, E, nu, t):
 
     return K.tocsr()
 
+def plate_model(nodes, elements, E, nu, t, rho=0.0):
+    """Model de fem con el triangulo de placa de este ejemplo (tri3-mindlin)"""
+    return Model(nodes, elements, "tri3-mindlin", {"E": E, "nu": nu, "t": t, "rho": rho})
+
+def assemble_global_stiffness_coo(nodes, elements, E, nu, t, cache=None, chunk_size=None, workers=None):
+    """Ensambla matriz de rigidez global (version vectorizada COO)
+
+    Con cache (ElementMatrixCache) solo se calculan las Ke de las geometrias
+    distintas; en mallas estructuradas son dos triangulos. Con chunk_size
+    los bloques se calculan por tramos en un pool de workers hilos.
+    """
+    return assemble_stiffness(plate_model(nodes, elements, E, nu, t), cache, chunk_size, workers)
+
+def assemble_global_mass_coo(nodes, elements, rho, t, lumped=False):
+    """Ensambla matriz de masa global (consistente o concentrada HRZ)"""
+    return assemble_mass(plate_model(nodes, elements, 0.0, 0.0, t, rho), lumped)
+
+# ============================================================
+# ESFUERZOS RESULTANTES (POST-PROCESO EN LOTE)
+# ============================================================
+RESULTANT_NAMES = ("Mx", "My", "Mxy", "Qx", "Qy")
+
+def stress_resultants(nodes, elements, U, E, nu, t, incidence=None):
+    """Mx, My, Mxy, Qx, Qy de todos los elementos y promediados en los nodos
+
+    Los triangulos tienen curvatura y cortante constantes (un punto, el
+    centroide), asi que la extrapolacion da el mismo valor en sus 3 nodos.
+    incidence: matriz de node_element_incidence, reutilizable entre casos.
+    Retorna un dict con "gauss" (n_elem, 1, 5), "element_nodes" (n_elem, 3, 5),
+    como AreaForceShell de SAP2000, y "nodal" (num_nodes, 5).
+    """
+    return resultants(plate_model(nodes, elements, E, nu, t), U, incidence)
+
 # ============================================================
 # APLICAR CONDICIONES DE FRONTERA
 # ============================================================
@@ -202,10 +223,20 @@ def apply_boundary_conditions(K, F, fixed_dofs):
 
     return K.tocsr(), F
 
+# ============================================================
+# SOLVER MULTI-CASO (FACTORIZAR UNA VEZ)
+# ============================================================
+def model_hash(nodes, elements, E, nu, t, fixed_dofs):
+    """Hash de malla + material + apoyos para reutilizar factorizaciones y el almacen en disco"""
+    return array_hash(nodes, elements, np.unique(np.asarray(fixed_dofs)), params=(E, nu, t))
+
 # ============================================================
 # MAIN
 # ============================================================
 if __name__ == "__main__":
+    # Directorio opcional del almacen de K y resultados: python plate_fem_example.py [dir]
+    store = ModelStore(sys.argv[1]) if len(sys.argv) > 1 else None
+
     print("=" * 60)
     print("  Ejemplo de Placa FEM - Elementos Shell Triangulares")
     print("  (Similar al ejemplo plate de Awatif)")
@@ -247,7 +278,16 @@ if __name__ == "__main__":
     num_nodes = len(nodes)
     dof = num_nodes * 3
 
-    K = assemble_global_stiffness(nodes, elements, E, nu, t)
+    # Renumeracion RCM: se ensambla y resuelve con la numeracion nueva y los
+    # resultados se devuelven en la numeracion original de la malla
+    rn = NodeRenumbering.rcm(elements, num_nodes)
+    bw_before, _ = bandwidth_profile(node_adjacency(elements, num_nodes))
+    bw_after, _ = bandwidth_profile(node_adjacency(rn.elements(elements), num_nodes))
+
+    print("Renumeracion RCM de nodos:")
+    print(f"  Ancho de banda (nodos): {bw_before} -> {bw_after}")
+    print()
+
 
     # Vector de fuerzas (carga distribuida convertida a nodal)
     F = np.zeros(dof)
@@ -270,11 +310,46 @@ if __name__ == "__main__":
     print(f"  Nodos fijos en bordes: {len(fixed_dofs) // 3}")
     print()
 
-    # Aplicar condiciones de frontera
-    K, F = apply_boundary_conditions(K, F, fixed_dofs)
+    # K del almacen (mmap) si ya se ensamblo este modelo; si no, se ensambla.
+    # Todos los elementos son traslaciones de dos triangulos: se calculan dos Ke
+    key = model_hash(nodes, elements, E, nu, t, fixed_dofs)
+    K = store.load_csr(key, "K") if store else None
+    if K is None:
+        ke_cache = ElementMatrixCache()
+        K = assemble_global_stiffness_coo(rn.nodes(nodes), rn.elements(elements), E, nu, t, ke_cache)
+        if store:
+            store.save_csr(key, "K", K)
+
+        print("Cache de matrices de elemento:")
+        print(f"  {ke_cache.report()}")
+    else:
+        print(f"Rigidez cargada del almacen: {store.path(key)}")
+    print()
 
-    # Resolver sistema
-    U = spsolve(K, F)
+    # Segundo caso de carga: carga puntual en el nodo mas cercano al centro
+    P = -10000    # N
+    node_center = np.argmin((nodes[:, 0] - Lx / 2)**2 + (nodes[:, 1] - Ly / 2)**2)
+    F_P = np.zeros(dof)
+    F_P[node_center * 3] = P
+
+    case_names = ["q", "P"]
+    F_cases = np.column_stack([F, F_P])
+
+    # Aplicar condiciones de frontera (eliminacion de DOF fijos)
+    bc = DofElimination(dof, rn.dofs_to_new(fixed_dofs, 3))
+
+    # Resolver todos los casos con una sola factorizacion y recuperar reacciones
+    results = store.load_results(key, F_cases) if store else None
+    if results is None:
+        U_cases, R_cases = solve_load_cases(K, rn.to_new(F_cases, 3), bc, key)
+        U_cases = rn.to_old(U_cases, 3)
+        factor_method = cached_solver(key).method
+        if store:
+            store.save_results(key, F_cases, U_cases, R_cases, cached_solver(key))
+    else:
+        U_cases, R_cases = results
+        factor_method = store.meta(key)["factorization"]["method"]
+    U, R = U_cases[:, 0], R_cases[:, 0]
 
     # Resultados
     print("=" * 60)
@@ -292,6 +367,13 @@ if __name__ == "__main__":
     print(f"  w_max = {w_max * 1000:.6f} mm")
     print()
 
+    # Equilibrio vertical: reacciones en w contra carga total
+    R_w = R[np.asarray(bc.fixed) % 3 == 0]
+    print("Equilibrio vertical:")
+    print(f"  Carga total   = {np.sum(F[::3]):.3f} N")
+    print(f"  Suma reacc. w = {np.sum(R_w):.3f} N")
+    print()
+
     # Solucion analitica para placa rectangular empotrada (aproximacion)
     D = E * t**3 / (12.0 * (1.0 - nu**2))
     a = min(Lx, Ly)
@@ -312,3 +394,51 @@ if __name__ == "__main__":
         # Solo nodos interiores
         if x > 0.5 and x < Lx - 0.5 and y > 0.5 and y < Ly - 0.5:
             print(f"{i:6d} {x:10.1f} {y:10.1f} {U[i*3]*1000:15.6f} {U[i*3+1]:15.6f} {U[i*3+2]:15.6f}")
+
+    # Esfuerzos resultantes promediados en los nodos (caso q)
+    nodal_resultants = stress_resultants(nodes, elements, U, E, nu, t)["nodal"]
+
+    print()
+    print("Esfuerzos resultantes promediados en nodos centrales (caso q):")
+    print(f"{'Nodo':>6} " + " ".join(f"{name:>12}" for name in RESULTANT_NAMES))
+    for i, node in enumerate(nodes):
+        x, y = node[0], node[1]
+        if x > 0.5 and x < Lx - 0.5 and y > 0.5 and y < Ly - 0.5:
+            print(f"{i:6d} " + " ".join(f"{v:12.4f}" for v in nodal_resultants[i]))
+
+    # Combinaciones de carga a partir de los resultados por caso
+    combinations = {
+        "1.4q": {"q": 1.4},
+        "1.2q+1.6P": {"q": 1.2, "P": 1.6},
+    }
+    U_combos = combine_load_cases(U_cases, case_names, combinations)
+
+    print()
+    print(f"Casos de carga (factorizacion: {factor_method}):")
+    for name, U_case in zip(case_names + list(combinations), np.hstack([U_cases, U_combos]).T):
+        print(f"  {name:>10}: w_min = {np.min(U_case[::3]) * 1000:.6f} mm")
+
+    # Modos de vibracion: la factorizacion de K_ff - sigma*M_ff se reutiliza
+    # para la masa consistente y la concentrada
+    rho = 7850.0  # kg/m3
+    n_modes = 4
+    K_ff, _ = bc.reduce(K, np.zeros(dof))
+    w_dir = np.zeros(dof)
+    w_dir[::3] = 1.0
+
+    print()
+    print(f"Modos de vibracion (rho = {rho} kg/m3):")
+    print(f"{'Modo':>6} {'Consistente (Hz)':>18} {'Concentrada (Hz)':>18} {'Masa efectiva w':>16}")
+
+    M = assemble_global_mass_coo(rn.nodes(nodes), rn.elements(elements), rho, t)
+    M_ff, _ = bc.reduce(M, np.zeros(dof))
+    modal = ModalSolver(K_ff, M_ff)
+    f_cons, phi = modal.modes(n_modes)
+    participation = modal_mass_participation(phi, M_ff, w_dir[bc.free])
+
+    M_l = assemble_global_mass_coo(rn.nodes(nodes), rn.elements(elements), rho, t, lumped=True)
+    M_l_ff, _ = bc.reduce(M_l, np.zeros(dof))
+    f_lump, _ = modal.with_mass(M_l_ff).modes(n_modes)
+
+    for i in range(n_modes):
+        print(f"{i + 1:6d} {f_cons[i]:18.3f} {f_lump[i]:18.3f} {100 * participation[i]:15.2f}%")
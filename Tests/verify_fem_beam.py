@@ -4,8 +4,17 @@ Verificacion de matriz de rigidez viga 2D
 Ejecutar: python verify_fem_beam.py
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.assembly import element_dof_map
+from fem.frame import (frame_stiffness, frame_uniform_load, assemble_banded,
+                       member_end_forces, BandedSolver)
+
 # Parametros (igual que en Mathcad)
 E = 210e9       # Pa (210 GPa)
 A = 0.01        # m2 (100 cm2)
@@ -132,3 +141,49 @@ print(f"  Comparacion:")
 print(f"    v2 FEM    = {U_red[1]*1000:.6f} mm")
 print(f"    v2 Teoria = {-defl_teorica*1000:.6f} mm")
 print(f"    Error     = {abs(U_red[1] + defl_teorica)/defl_teorica*100:.6f} %")
+
+# Mismo cantilever con el solver en banda (fem.frame)
+print()
+print("=== Cantilever con fem.frame (banda simetrica) ===")
+nodes = np.array([[0.0, 0.0], [L, 0.0]])
+elements = np.array([[0, 1]])
+dofs = element_dof_map(elements, 3)
+Ke = frame_stiffness(nodes, elements, E, A, I)
+print(f"  Max |K_e - K|  = {np.max(np.abs(Ke[0] - K)):.3e}")
+
+F = np.zeros(6)
+F[4] = -P
+solver = BandedSolver(assemble_banded(Ke, dofs, 6), [0, 1, 2])
+U = solver.solve(F)
+print(f"  v2 banda  = {U[4]*1000:.6f} mm")
+print(f"  Reacciones: {solver.reactions(U, F)}")
+
+# Viga continua de 3 tramos iguales con carga uniforme
+print()
+print("=== Viga continua (3 tramos, carga uniforme) ===")
+spans, per_span, q = 3, 10, -10e3     # q en N/m
+span = 6.0
+x = np.linspace(0.0, spans * span, spans * per_span + 1)
+nodes = np.column_stack([x, np.zeros_like(x)])
+elements = np.column_stack([np.arange(len(x) - 1), np.arange(1, len(x))])
+dofs = element_dof_map(elements, 3)
+num_dof = 3 * len(x)
+
+Ke = frame_stiffness(nodes, elements, E, A, I)
+p_global, p_local = frame_uniform_load(nodes, elements, q)
+F = np.zeros(num_dof)
+np.add.at(F, dofs, p_global)
+
+supports = np.arange(0, len(x), per_span)
+fixed = np.r_[0, 3 * supports + 1]          # u en el primer apoyo, v en todos
+solver = BandedSolver(assemble_banded(Ke, dofs, num_dof), fixed)
+U = solver.solve(F)
+forces = member_end_forces(nodes, elements, E, A, I, U, dofs, p_local)
+
+M_support = -forces[per_span - 1, 5]
+M_teorico = abs(q) * span**2 / 10
+print(f"  Semi-ancho de banda: {solver.bandwidth}")
+print(f"  M apoyo interior FEM    = {M_support/1e3:.4f} kN-m")
+print(f"  M apoyo interior Teoria = {M_teorico/1e3:.4f} kN-m (qL2/10)")
+print(f"  Reacciones verticales (kN): {np.round(solver.reactions(U, F)[1:] / 1e3, 4)}")
+print(f"  Teoria (kN): {np.round(np.array([0.4, 1.1, 1.1, 0.4]) * abs(q) * span / 1e3, 4)}")
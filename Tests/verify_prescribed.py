@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+verify_prescribed.py - Desplazamientos impuestos distintos de cero (DofElimination)
+
+Compara U y las reacciones recuperadas contra valores a mano:
+
+    1. Cadena de 3 resortes iguales: extremo derecho desplazado delta, con
+       y sin carga P en el nodo 1 (dos casos en una sola solucion)
+    2. Viga biempotrada (fem.frame, 4 barras) con asentamiento Delta del
+       apoyo derecho y carga uniforme q: V = 12 EI Delta / L^3,
+       M = 6 EI Delta / L^2 mas qL/2 y qL^2/12
+    3. Placa (fem.model, tri3-dkt y quad4-dkq) con el borde impuesto segun
+       un movimiento de cuerpo rigido: U rigido en todos los nodos y
+       reacciones nulas
+
+Ejecutar: python verify_prescribed.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.assembly import element_dof_map, assemble_coo
+from fem.frame import frame_stiffness, frame_uniform_load
+from fem.mesh import rectangular_mesh, boundary_nodes
+from fem.model import Model, solve
+from fem.solvers import DofElimination, solve_load_cases
+
+def check(name, ok):
+    print(f"  {name:<52} {'OK' if ok else 'ERROR'}")
+
+def verify_spring_chain():
+    k, delta, P = 2.0e3, 0.01, 30.0
+    K = csr_matrix(k * np.array([[1, -1, 0, 0], [-1, 2, -1, 0], [0, -1, 2, -1], [0, 0, -1, 1]], dtype=float))
+    F = np.zeros((4, 2))
+    F[1, 1] = P
+
+    bc = DofElimination(4, [0], {3: delta})
+    U, R = solve_load_cases(K, F, bc)
+
+    # Solo asentamiento: N = k delta / 3 en los tres resortes
+    U_delta = np.array([0.0, delta / 3, 2 * delta / 3, delta])
+    R_delta = np.array([-k * delta / 3, k * delta / 3])
+    # Carga P con ambos extremos fijos: rigidez 1.5 k en el nodo 1
+    U_P = np.array([0.0, 2 * P / (3 * k), P / (3 * k), 0.0])
+    R_P = np.array([-2 * P / 3, -P / 3])
+
+    check("Caso 1 (delta): U = [0, delta/3, 2delta/3, delta]", np.allclose(U[:, 0], U_delta, rtol=1e-12))
+    check("Caso 1 (delta): R = [-k delta/3, k delta/3]", np.allclose(R[:, 0], R_delta, rtol=1e-12))
+    check("Caso 2 (delta + P): U por superposicion", np.allclose(U[:, 1], U_delta + U_P, rtol=1e-12))
+    check("Caso 2 (delta + P): R por superposicion", np.allclose(R[:, 1], R_delta + R_P, rtol=1e-12))
+    check("Equilibrio: suma de reacciones = -P", np.isclose(R[:, 1].sum(), -P))
+
+def verify_beam_settlement(n_members=4):
+    E, A, I, L = 210e9, 0.01, 833.3e-8, 6.0
+    Delta, q = 0.005, -12e3
+    nodes = np.column_stack([np.linspace(0.0, L, n_members + 1), np.zeros(n_members + 1)])
+    elements = np.column_stack([np.arange(n_members), np.arange(1, n_members + 1)])
+    dofs = element_dof_map(elements, 3)
+    num_dof = 3 * len(nodes)
+    K = assemble_coo(frame_stiffness(nodes, elements, E, A, I), dofs, num_dof)
+
+    F = np.zeros((num_dof, 2))
+    p_global, _ = frame_uniform_load(nodes, elements, q)
+    np.add.at(F[:, 1], dofs, p_global)
+
+    # Empotrado en ambos extremos; el apoyo derecho baja Delta
+    right = 3 * n_members
+    bc = DofElimination(num_dof, [0, 1, 2, right, right + 2], {right + 1: -Delta})
+    U, R = solve_load_cases(K, F, bc)
+
+    # Flecha exacta de la viga con asentamiento: v = -Delta (3 s^2 - 2 s^3), s = x / L
+    s = nodes[:, 0] / L
+    v = -Delta * (3 * s**2 - 2 * s**3)
+    theta = -Delta * (6 * s - 6 * s**2) / L
+    V, M = 12 * E * I * Delta / L**3, 6 * E * I * Delta / L**2
+    # Reacciones en [Fx0, Fy0, M0, FxL, FyL, ML] (orden de bc.fixed)
+    R_Delta = np.array([0.0, V, M, 0.0, -V, M])
+    R_q = np.array([0.0, -q * L / 2, -q * L**2 / 12, 0.0, -q * L / 2, q * L**2 / 12])
+
+    check("Viga: orden de DOF fijos", list(bc.fixed) == [0, 1, 2, right, right + 1, right + 2])
+    check("Viga: v y theta = solucion cubica exacta",
+          np.allclose(U[1::3, 0], v, rtol=1e-10, atol=1e-15) and np.allclose(U[2::3, 0], theta, rtol=1e-10, atol=1e-15))
+    check("Viga: V = 12EI Delta/L^3, M = 6EI Delta/L^2", np.allclose(R[:, 0], R_Delta, rtol=1e-9, atol=1e-6))
+    check("Viga + q: reacciones = asentamiento + qL/2, qL^2/12",
+          np.allclose(R[:, 1], R_Delta + R_q, rtol=1e-9, atol=1e-6))
+
+def verify_plate_rigid(kernel, element):
+    a, b, n = 6.0, 4.0, 8
+    nodes, elements = rectangular_mesh(a, b, n, n, element=element)
+    border = boundary_nodes(nodes, a, b)
+
+    # w = w0 + c x + d y, theta_x = dw/dy = d, theta_y = -dw/dx = -c
+    w0, c, d = 0.01, -0.002, 0.003
+    rigid = np.column_stack([w0 + c * nodes[:, 0] + d * nodes[:, 1],
+                             np.full(len(nodes), d), np.full(len(nodes), -c)]).ravel()
+    model = Model(nodes, elements, kernel, {"E": 30e9, "nu": 0.2, "t": 0.2, "rho": 2500.0})
+    border_dofs = model.node_dofs(border)
+    model.prescribed = dict(zip(border_dofs.tolist(), rigid[border_dofs]))
+
+    U, R, bc = solve(model)
+    K_scale = 30e9 * 0.2**3 / 12
+    check(f"Placa {kernel}: U = movimiento rigido", np.allclose(U[:, 0], rigid, rtol=1e-10, atol=1e-14))
+    check(f"Placa {kernel}: reacciones nulas", np.max(np.abs(R)) < 1e-9 * K_scale * np.max(np.abs(rigid)))
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("  1. Cadena de resortes con desplazamiento impuesto")
+    print("=" * 60)
+    verify_spring_chain()
+    print()
+
+    print("=" * 60)
+    print("  2. Viga biempotrada con asentamiento de apoyo")
+    print("=" * 60)
+    verify_beam_settlement()
+    print()
+
+    print("=" * 60)
+    print("  3. Placa con borde en movimiento de cuerpo rigido")
+    print("=" * 60)
+    verify_plate_rigid("tri3-dkt", "tri")
+    verify_plate_rigid("quad4-dkq", "quad")
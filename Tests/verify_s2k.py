@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+verify_s2k.py - Lectura de los modelos .$2k del repositorio con fem.s2k
+
+    1. Cada .$2k de la raiz: numero de tablas, nodos, areas y unidades
+    2. La malla de SAP2000_Losa_Final.$2k contra rectangular_mesh
+    3. Ida y vuelta write_model -> S2KFile: malla con triangulos, apoyos,
+       cargas nodales y de area; etiquetas "010" y "10" como nodos distintos
+    4. Modelo sintetico grande escrito con write_model: escritura, indice
+       y lectura de una sola tabla contra interpretar todas
+
+Ejecutar: python verify_s2k.py [nx]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Nucleo FEM compartido (raiz del repositorio)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from fem.mesh import rectangular_mesh
+from fem.s2k import S2KFile, read_mesh, write_model, model_tables, DOF_NAMES, FORCE_NAMES
+
+MESH_TABLES = ("JOINT COORDINATES", "CONNECTIVITY - AREA")
+
+def survey(paths):
+    print(f"{'Archivo':<34} {'Tablas':>6} {'Nodos':>6} {'Areas':>6}  Unidades")
+    for path in paths:
+        s2k = S2KFile(path)
+        if all(t in s2k for t in MESH_TABLES):
+            mesh = read_mesh(path)
+            n_nodes, n_areas = len(mesh["nodes"]), len(mesh["elements"])
+            assert (mesh["elements"] >= 0).all(), path
+        else:
+            n_nodes = n_areas = "-"
+        print(f"{path.name:<34} {len(s2k.tables()):6d} {n_nodes:>6} {n_areas:>6}  {s2k.units()}")
+    print()
+
+def slab_model(nx, ny):
+    """Losa 6 x 4 con cuadrilateros (la mitad partidos en triangulos), bordes x apoyados"""
+    nodes, quads = rectangular_mesh(6.0, 4.0, nx, ny, element="quad", ndim=3)
+    elements = quads.copy()
+    elements[1::2, 3] = -1
+    restraints = np.zeros((len(nodes), 6), dtype=bool)
+    edge = np.isclose(nodes[:, 0], 0.0) | np.isclose(nodes[:, 0], 6.0)
+    restraints[edge, 2] = restraints[edge, 3] = True
+    F = np.zeros((len(nodes), 6))
+    F[len(nodes) // 2, 2] = -12.5
+    F[len(nodes) // 3, 4] = 1 / 3
+    q = -10.0 - 0.1 * np.arange(len(elements))
+    return nodes, elements, restraints, F, q
+
+def round_trip(path):
+    nodes, elements, restraints, F, q = slab_model(6, 4)
+    options = dict(restraints=restraints, joint_loads={"P": F}, area_loads={"DEAD": q})
+    write_model(path, nodes, elements, {"E": 35e6, "nu": 0.15, "t": 0.1}, **options)
+    s2k = S2KFile(path)
+    expected_order = list(model_tables(nodes, elements, {"E": 35e6, "nu": 0.15, "t": 0.1}, **options))
+    mesh = read_mesh(path)
+    index = mesh["joints"].astype(int) - 1
+
+    R = np.zeros_like(restraints)
+    t = s2k.table("JOINT RESTRAINT ASSIGNMENTS")
+    R[t["Joint"] - 1] = np.column_stack([t[d] == "Yes" for d in DOF_NAMES])
+
+    F_read = np.zeros_like(F)
+    t = s2k.table("JOINT LOADS - FORCE")
+    F_read[t["Joint"] - 1] = np.column_stack([t[f] for f in FORCE_NAMES])
+
+    t = s2k.table("AREA LOADS - UNIFORM")
+    section = s2k.table("AREA SECTION PROPERTIES")
+    checks = {
+        "Nodos": np.array_equal(mesh["nodes"][index], nodes),
+        "Conectividad (con triangulos)": np.array_equal(mesh["elements"], elements),
+        "Apoyos": np.array_equal(R, restraints),
+        "Cargas nodales (valores exactos)": np.array_equal(F_read, F),
+        "Carga de area": np.array_equal(t["UnifLoad"], q) and (t["LoadPat"] == "DEAD").all(),
+        "Seccion": section["Thickness"][0] == 0.1 and section["Type"][0] == "Plate-Thick",
+        "Orden de tablas (PROGRAM CONTROL primero)": s2k.tables() == expected_order
+                                                     and expected_order[0] == "PROGRAM CONTROL",
+    }
+    for name, ok in checks.items():
+        print(f"  {name:<44} {'OK' if ok else 'ERROR'}")
+    print()
+
+LABELS_S2K = """TABLE:  "JOINT COORDINATES"
+   Joint=10   CoordSys=GLOBAL   CoordType=Cartesian   XorR=0   Y=0   Z=0
+   Joint=010   CoordSys=GLOBAL   CoordType=Cartesian   XorR=1   Y=0   Z=0
+   Joint=2   CoordSys=GLOBAL   CoordType=Cartesian   XorR=1   Y=1   Z=0
+   Joint=02   CoordSys=GLOBAL   CoordType=Cartesian   XorR=0   Y=1   Z=0
+
+TABLE:  "CONNECTIVITY - AREA"
+   Area=1   NumJoints=3   Joint1=10   Joint2=010   Joint3=2
+   Area=01   NumJoints=3   Joint1=10   Joint2=2   Joint3=02
+   Area=001   NumJoints=4   Joint1=10   Joint2=010   Joint3=2   Joint4=02
+
+END TABLE DATA
+"""
+
+def text_labels(path):
+    """Nodos "10"/"010" y "2"/"02" y areas "1"/"01"/"001": nombres distintos en SAP2000"""
+    path.write_text(LABELS_S2K, encoding="latin-1")
+    mesh = read_mesh(path)
+    checks = {
+        "Etiquetas de nodos como texto (010 != 10)": list(mesh["joints"]) == ["10", "010", "2", "02"],
+        "Etiquetas de areas como texto (01 != 1)": list(mesh["areas"]) == ["1", "01", "001"],
+        "Conectividad con 010 y 02": mesh["elements"].tolist() == [[0, 1, 2, -1], [0, 2, 3, -1], [0, 1, 2, 3]],
+    }
+    for name, ok in checks.items():
+        print(f"  {name:<44} {'OK' if ok else 'ERROR'}")
+    print()
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    nx = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    print("=" * 60)
+    print("  1. Modelos .$2k del repositorio")
+    print("=" * 60)
+    survey(sorted(ROOT.glob("*.$2k")))
+
+    print("=" * 60)
+    print("  2. Malla de SAP2000_Losa_Final.$2k")
+    print("=" * 60)
+    mesh = read_mesh(ROOT / "SAP2000_Losa_Final.$2k")
+    nodes, elements = mesh["nodes"], mesh["elements"]
+    span = nodes.max(axis=0) - nodes.min(axis=0)
+    print(f"Nodos {len(nodes)}, areas {len(elements)}, extension {span[0]:g} x {span[1]:g} ({mesh['units']})")
+    xy = nodes[elements][:, :, :2]
+    area = 0.5 * np.abs(np.sum(xy[:, :, 0] * np.roll(xy[:, :, 1], -1, axis=1)
+                               - np.roll(xy[:, :, 0], -1, axis=1) * xy[:, :, 1], axis=1))
+    print(f"Suma de areas {area.sum():.6g} = {span[0] * span[1]:.6g}: "
+          f"{'OK' if np.isclose(area.sum(), span[0] * span[1]) else 'ERROR'}")
+    section = S2KFile(ROOT / "SAP2000_Losa_Final.$2k").table("AREA SECTION PROPERTIES")
+    print(f"Fila con continuacion ' _': Section={section['Section'][0]}, WMod={section['WMod'][0]}")
+    print()
+
+    print("=" * 60)
+    print("  3. Ida y vuelta write_model -> S2KFile")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        round_trip(Path(tmp) / "round_trip.$2k")
+        text_labels(Path(tmp) / "labels.$2k")
+
+    print("=" * 60)
+    print(f"  4. Modelo sintetico {nx} x {nx}")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "synthetic.$2k"
+        nodes, elements, restraints, F, q = slab_model(nx, nx)
+        _, t_write = timed(lambda: write_model(path, nodes, elements, {"E": 35e6, "nu": 0.15, "t": 0.1},
+                                               restraints=restraints, area_loads={"DEAD": q}))
+        print(f"Archivo: {path.stat().st_size / 2**20:.1f} MB ({len(nodes)} nodos, {len(elements)} areas)")
+
+        s2k, t_index = timed(lambda: S2KFile(path))
+        joints, t_joints = timed(lambda: s2k.table("JOINT COORDINATES", ["Joint", "XorR", "Y"]))
+        everything, t_all = timed(lambda: {name: s2k.table(name) for name in s2k.tables()})
+        mesh, t_mesh = timed(lambda: read_mesh(path))
+
+        assert len(joints["Joint"]) == len(nodes)
+        assert np.array_equal(mesh["elements"], elements)
+        assert (everything["AREA SECTION ASSIGNMENTS"]["Section"] == "LOSA").all()
+        print(f"Escritura (write_model):   {1e3 * t_write:9.2f} ms")
+        print(f"Indice de {len(s2k.tables())} tablas:     {1e3 * t_index:9.2f} ms")
+        print(f"Solo JOINT COORDINATES:    {1e3 * t_joints:9.2f} ms")
+        print(f"Malla (nodos + areas):     {1e3 * t_mesh:9.2f} ms")
+        print(f"Todas las tablas:          {1e3 * t_all:9.2f} ms")
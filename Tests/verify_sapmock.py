@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+verify_sapmock.py - SapModel falso, perfil de llamadas COM y grabacion/reproduccion
+
+    1. Losa 6 x 4 creada como rectangular_slab_fea_sap2000.py (una llamada
+       por punto, area, apoyo y carga) contra write_model + un solo
+       File.OpenFile: mismo modelo, perfil de llamadas de cada camino
+    2. Resultados: Results.JointDispl nodo por nodo contra la tabla
+       completa (fem.saptables), mismos valores
+    3. Sesion grabada a JSON y reproducida sin SapModel
+
+Ejecutar: python verify_sapmock.py [n_a n_b]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import rectangular_mesh
+from fem.s2k import write_model
+from fem.saptables import joint_displacements
+from fem.sapmock import FakeSapModel, InstrumentedProxy, save_recording, load_recording
+
+a, b, t, q = 6.0, 4.0, 0.1, 10.0
+E, nu = 35000, 0.15
+
+def build_per_call(SapModel, n_a, n_b):
+    """Losa con el patron de llamadas de rectangular_slab_fea_sap2000.py"""
+    SapModel.InitializeNewModel(6)
+    SapModel.File.NewBlank()
+    SapModel.PropMaterial.SetMaterial('MAT', 2)
+    SapModel.PropMaterial.SetMPIsotropic('MAT', E * 1000, nu, 0.00001)
+    SapModel.PropArea.SetShell_1('LOSA', 3, False, 'MAT', 0, t, t, -1, "", "")
+
+    dx, dy = a / n_a, b / n_b
+    for i in range(n_a + 1):
+        for j in range(n_b + 1):
+            SapModel.PointObj.AddCartesian(i * dx, j * dy, 0, "", f"P{i}_{j}")
+
+    for i in range(n_a):
+        for j in range(n_b):
+            pts = [f"P{i}_{j}", f"P{i + 1}_{j}", f"P{i + 1}_{j + 1}", f"P{i}_{j + 1}"]
+            SapModel.AreaObj.AddByPoint(4, pts, "", "LOSA", f"A{i}_{j}")
+
+    for i in range(n_a + 1):
+        for j in range(n_b + 1):
+            x_border, y_border = i in (0, n_a), j in (0, n_b)
+            if x_border or y_border:
+                SapModel.PointObj.SetRestraint(f"P{i}_{j}", [False, False, True, x_border, y_border, False])
+
+    SapModel.LoadPatterns.Add('DEAD', 8, 1, True)
+    for i in range(n_a):
+        for j in range(n_b):
+            SapModel.AreaObj.SetLoadUniform(f"A{i}_{j}", 'DEAD', -q, 6, False, "Global", 0)
+
+def build_bulk(SapModel, path, n_a, n_b):
+    """La misma losa escrita con write_model y abierta con una llamada"""
+    nodes, elements = rectangular_mesh(a, b, n_a, n_b, element="quad", ndim=3)
+    x_border = np.isclose(nodes[:, 0], 0.0) | np.isclose(nodes[:, 0], a)
+    y_border = np.isclose(nodes[:, 1], 0.0) | np.isclose(nodes[:, 1], b)
+    restraints = np.zeros((len(nodes), 6), dtype=bool)
+    restraints[:, 2] = x_border | y_border
+    restraints[:, 3] = x_border
+    restraints[:, 4] = y_border
+    write_model(path, nodes, elements, {"E": E * 1000, "nu": nu, "t": t}, shell_type="Plate-Thin",
+                restraints=restraints, area_loads={"DEAD": -q})
+    return SapModel.File.OpenFile(str(path))
+
+def model_summary(fake):
+    """Coordenadas de nodos, de esquinas de areas y de nodos con apoyo, ordenadas"""
+    xyz = np.array(sorted(fake.points.values()))
+    corners = np.array(sorted(tuple(np.round(np.mean([fake.points[p] for p in pts], axis=0), 9))
+                              for pts in fake.areas.values()))
+    supports = sorted((fake.points[name], tuple(r)) for name, r in fake.restraints.items())
+    return xyz, corners, supports
+
+def navier_table(fake, cases=("DEAD",)):
+    """Tabla Joint Displacements con w = sin(pi x / a) sin(pi y / b) por caso"""
+    labels = list(fake.points)
+    xyz = np.array([fake.points[p] for p in labels])
+    w = np.sin(np.pi * xyz[:, 0] / a) * np.sin(np.pi * xyz[:, 1] / b)
+    n = len(labels)
+    values = {f: np.zeros(n * len(cases)) for f in ("U1", "U2", "U3", "R1", "R2", "R3")}
+    values["U3"] = np.concatenate([-(c + 1) * 1e-3 * w for c in range(len(cases))])
+    fake.add_table("Joint Displacements", {
+        "Joint": np.tile(labels, len(cases)), "OutputCase": np.repeat(list(cases), n),
+        "CaseType": "LinStatic", **values})
+    return labels, values["U3"][:n]
+
+def per_joint_u3(SapModel):
+    SapModel.Results.Setup.DeselectAllCasesAndCombosForOutput()
+    SapModel.Results.Setup.SetCaseSelectedForOutput("DEAD")
+    names = SapModel.PointObj.GetNameList()[1]
+    return np.array([SapModel.Results.JointDispl(name, 0)[8][0] for name in names])
+
+def table_u3(SapModel):
+    disp = joint_displacements(SapModel, cases=["DEAD"])
+    return disp["values"][:, 0, 2]
+
+def check(name, ok):
+    print(f"  {name:<48} {'OK' if ok else 'ERROR'}")
+
+if __name__ == "__main__":
+    n_a, n_b = (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) > 2 else (30, 20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        print("=" * 70)
+        print(f"  1. Creacion del modelo ({n_a} x {n_b} areas)")
+        print("=" * 70)
+        fake_calls, fake_bulk = FakeSapModel(), FakeSapModel()
+        per_call = InstrumentedProxy(fake_calls)
+        build_per_call(per_call, n_a, n_b)
+        bulk = InstrumentedProxy(fake_bulk)
+        ret = build_bulk(bulk, tmp / "slab.$2k", n_a, n_b)
+
+        print("Llamada por objeto:")
+        print(per_call.profile.report(top=6))
+        print()
+        print("Archivo .$2k + File.OpenFile:")
+        print(bulk.profile.report())
+        print()
+        same = [np.array_equal(x, y) if isinstance(x, np.ndarray) else x == y
+                for x, y in zip(model_summary(fake_calls), model_summary(fake_bulk))]
+        check("OpenFile correcto", ret == 0)
+        check("Mismos nodos, areas y apoyos", all(same))
+        check("Carga de area en todas las areas",
+              len(fake_calls.area_loads["DEAD"]) == len(fake_bulk.table("AREA LOADS - UNIFORM")["Area"]))
+        print()
+
+        print("=" * 70)
+        print("  2. Resultados nodo por nodo contra tabla completa")
+        print("=" * 70)
+        labels, u3 = navier_table(fake_bulk, cases=("DEAD", "LIVE"))
+        recorder = []
+        session = InstrumentedProxy(fake_bulk, recorder=recorder)
+        u3_joint = per_joint_u3(session)
+        n_joint_calls = session.profile.total_calls
+        u3_table = table_u3(session)
+        print(session.profile.report())
+        print()
+        check("JointDispl nodo por nodo = valores de la tabla", np.array_equal(u3_joint, u3))
+        check("joint_displacements (1 llamada) = nodo por nodo", np.array_equal(u3_table, u3_joint))
+        check("Llamadas de la tabla", session.profile.total_calls - n_joint_calls == 2)
+        print()
+
+        print("=" * 70)
+        print("  3. Grabacion y reproduccion")
+        print("=" * 70)
+        save_recording(tmp / "session.jsonl", recorder)
+        replay = InstrumentedProxy(None, replay=load_recording(tmp / "session.jsonl"))
+        print(f"Grabadas {len(recorder)} llamadas ({(tmp / 'session.jsonl').stat().st_size / 1024:.1f} kB)")
+        check("Nodo por nodo reproducido sin SapModel", np.array_equal(per_joint_u3(replay), u3))
+        check("Tabla reproducida sin SapModel", np.array_equal(table_u3(replay), u3))
+        try:
+            replay.Results.JointDispl("no-grabado", 0)
+            check("Llamada no grabada -> KeyError", False)
+        except KeyError:
+            check("Llamada no grabada -> KeyError", True)
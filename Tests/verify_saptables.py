@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+verify_saptables.py - Extraccion por tablas (fem.saptables) contra un SapModel local
+
+TablesStandIn imita DatabaseTables.GetTableForDisplayArray con tablas de
+valores conocidos, en el mismo formato que SAP2000: textos planos fila por
+fila y la salida de comtypes [FieldKeyList, TableVersion,
+FieldsKeysIncluded, NumberRecords, TableData, ret].
+
+    1. Desplazamientos y reacciones de varios casos: valores, orden de los
+       nodos y NaN en combinaciones sin fila
+    2. Fuerzas de lamina por (area, nodo)
+    3. Tiempo de table_columns + keyed_results para tablas grandes
+
+Ejecutar: python verify_saptables.py [n_joints]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.saptables import (joint_displacements, joint_reactions, area_shell_forces, get_table,
+                           DISPLACEMENT_FIELDS, REACTION_FIELDS, SHELL_FORCE_FIELDS)
+
+class TablesStandIn:
+    """DatabaseTables local: {clave: (campos, filas de textos)}"""
+
+    def __init__(self, tables, code_first=False):
+        self.tables = tables
+        self.code_first = code_first
+        self.calls = 0
+        self.selected_cases = None
+
+    def SetLoadCasesSelectedForDisplay(self, cases):
+        self.selected_cases = list(cases)
+        return 0
+
+    def GetTableForDisplayArray(self, table_key, field_key_list, group_name):
+        self.calls += 1
+        if table_key not in self.tables:
+            return [field_key_list, 0, [], 0, [], 1]
+        fields, rows = self.tables[table_key]
+        if self.selected_cases is not None:
+            case = fields.index("OutputCase")
+            rows = [r for r in rows if r[case] in self.selected_cases]
+        data = [value for row in rows for value in row]
+        if self.code_first:
+            return [0, 1, list(fields), len(rows), data]
+        return [field_key_list, 1, list(fields), len(rows), data, 0]
+
+class SapModelStandIn:
+    def __init__(self, tables, code_first=False):
+        self.DatabaseTables = TablesStandIn(tables, code_first)
+
+def joint_table(labels, cases, values, names):
+    """Filas de texto de una tabla de nodos: values (n_joint, n_case, 6)"""
+    fields = ["Joint", "OutputCase", "CaseType", "StepType", *names]
+    rows = [[label, case, "LinStatic", "", *(repr(float(v)) for v in values[i, c])]
+            for c, case in enumerate(cases) for i, label in enumerate(labels)]
+    return fields, rows
+
+def check(name, ok):
+    print(f"  {name:<44} {'OK' if ok else 'ERROR'}")
+
+def verify_joints():
+    rng = np.random.default_rng(0)
+    labels = ["1", "2", "9", "10", "11", "100", "010"]     # "10" despues de "9"; "010" != "10"
+    cases = ["DEAD", "LIVE"]
+    U = rng.normal(size=(len(labels), len(cases), 6))
+    R = rng.normal(size=(len(labels), len(cases), 6))
+
+    disp_fields, disp_rows = joint_table(labels, cases, U, DISPLACEMENT_FIELDS)
+    reac_fields, reac_rows = joint_table(labels, cases, R, REACTION_FIELDS)
+    del reac_rows[-1]                                          # nodo 010 sin reaccion en LIVE
+    tables = {"Joint Displacements": (disp_fields, disp_rows),
+              "Joint Reactions": (reac_fields, reac_rows)}
+
+    for code_first in (False, True):
+        sap = SapModelStandIn(tables, code_first)
+        disp = joint_displacements(sap)
+        reac = joint_reactions(sap)
+        layout = "codigo primero" if code_first else "comtypes"
+        check(f"Desplazamientos exactos ({layout})", np.array_equal(disp["values"], U))
+        check(f"Orden de nodos y casos ({layout})",
+              list(disp["keys"]) == labels and list(disp["cases"]) == cases)
+        check(f"Reacciones, NaN sin fila ({layout})",
+              np.isnan(reac["values"][-1, 1]).all()
+              and np.array_equal(reac["values"][:-1], R[:-1]) and np.array_equal(reac["values"][-1, 0], R[-1, 0]))
+        check(f"Una llamada por tabla ({layout})", sap.DatabaseTables.calls == 2)
+
+    # Envolvente: filas Max y Min de cada nodo; se conserva la ultima (Min)
+    env_fields, env_max = joint_table(labels, ["ENV"], U[:, :1], DISPLACEMENT_FIELDS)
+    _, env_min = joint_table(labels, ["ENV"], R[:, :1], DISPLACEMENT_FIELDS)
+    step = env_fields.index("StepType")
+    env_rows = []
+    for row_max, row_min in zip(env_max, env_min):
+        row_max[step], row_min[step] = "Max", "Min"
+        env_rows += [row_max, row_min]
+    envelope = joint_displacements(SapModelStandIn({"Joint Displacements": (env_fields, env_rows)}))
+    check("Envolvente Max/Min: queda la ultima fila", np.array_equal(envelope["values"][:, 0], R[:, 0]))
+
+    sap = SapModelStandIn(tables)
+    live = joint_displacements(sap, cases=["LIVE"])
+    check("Filtro de casos", list(live["cases"]) == ["LIVE"] and np.array_equal(live["values"][:, 0], U[:, 1]))
+
+    try:
+        get_table(sap, "Joint Velocities")
+        check("Tabla inexistente -> RuntimeError", False)
+    except RuntimeError:
+        check("Tabla inexistente -> RuntimeError", True)
+
+def verify_shells():
+    rng = np.random.default_rng(1)
+    areas = [(a, j) for a in ("1", "01") for j in ("1", "2", "5", "4")]
+    forces = rng.normal(size=(len(areas), 1, len(SHELL_FORCE_FIELDS)))
+    fields = ["Area", "AreaElem", "ShellType", "Joint", "OutputCase", "CaseType", "StepType",
+              *SHELL_FORCE_FIELDS]
+    rows = [[a, a, "Shell-Thick", j, "DEAD", "LinStatic", "", *(repr(float(v)) for v in forces[k, 0])]
+            for k, (a, j) in enumerate(areas)]
+    sap = SapModelStandIn({"Element Forces - Area Shells": (fields, rows)})
+    shell = area_shell_forces(sap)
+    check("Fuerzas de lamina por (area, nodo)",
+          [tuple(k) for k in shell["keys"]] == areas and np.array_equal(shell["values"], forces))
+
+def benchmark(n_joints, n_cases=3):
+    rng = np.random.default_rng(2)
+    labels = [str(j) for j in range(1, n_joints + 1)]
+    cases = [f"CASE{c}" for c in range(n_cases)]
+    U = rng.normal(size=(n_joints, n_cases, 6))
+    sap = SapModelStandIn({"Joint Displacements": joint_table(labels, cases, U, DISPLACEMENT_FIELDS)})
+
+    t0 = time.perf_counter()
+    disp = joint_displacements(sap)
+    elapsed = time.perf_counter() - t0
+    assert np.array_equal(disp["values"], U)
+    print(f"  {n_joints} nodos x {n_cases} casos: {1e3 * elapsed:.1f} ms, "
+          f"{sap.DatabaseTables.calls} llamada (por nodo serian {n_joints * n_cases})")
+
+if __name__ == "__main__":
+    n_joints = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("=" * 60)
+    print("  1. Desplazamientos y reacciones")
+    print("=" * 60)
+    verify_joints()
+    print()
+
+    print("=" * 60)
+    print("  2. Element Forces - Area Shells")
+    print("=" * 60)
+    verify_shells()
+    print()
+
+    print("=" * 60)
+    print("  3. Tablas grandes")
+    print("=" * 60)
+    benchmark(n_joints)
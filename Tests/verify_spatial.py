@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+verify_spatial.py - Indice espacial de nodos (fem.spatial) contra busquedas lineales
+
+    1. Malla con ruido de redondeo (+-1e-7) y nodos faltantes: find, in_box,
+       on_segment, on_boundary y to_grid contra los recorridos de los
+       scripts de comparacion (abs(nx - x) < tol sobre todos los nodos)
+    2. Grilla de resultados: bucle triple de los scripts contra to_grid,
+       tiempo y escalamiento hasta 10^5 nodos
+
+Ejecutar: python verify_spatial.py [max_nodes]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import grid_nodes
+from fem.spatial import NodeIndex
+
+TOL = 1e-3
+
+def noisy_grid(Lx, Ly, nx, ny, seed=0):
+    """Nodos de una grilla con ruido de redondeo, desordenados y con etiquetas de SAP2000"""
+    rng = np.random.default_rng(seed)
+    nodes = grid_nodes(Lx, Ly, nx, ny) + rng.uniform(-1e-7, 1e-7, ((nx + 1) * (ny + 1), 2))
+    order = rng.permutation(len(nodes))
+    return {str(k + 1): tuple(nodes[i]) for k, i in enumerate(order)}
+
+def loop_grid(nodos, values):
+    """Grilla como en sap2000_leer_nodo_por_nodo.py: for y, for x, for nodo"""
+    xs = sorted(set(round(x, 6) for x, y in nodos.values()))
+    ys = sorted(set(round(y, 6) for x, y in nodos.values()))
+    grid = np.full((len(ys), len(xs)), np.nan)
+    for j, y in enumerate(ys):
+        for i, x in enumerate(xs):
+            for nodo, (nx, ny) in nodos.items():
+                if abs(nx - x) < TOL and abs(ny - y) < TOL:
+                    grid[j, i] = values[nodo]
+                    break
+    return grid
+
+def check(name, ok):
+    print(f"  {name:<44} {'OK' if ok else 'ERROR'}")
+
+def verify_queries():
+    a, b = 6.0, 4.0
+    nodos = noisy_grid(a, b, 12, 8)
+    for x0, y0 in ((1.0, 4.0), (4.5, 1.0)):           # nodos faltantes en la grilla
+        del nodos[next(n for n, (x, y) in nodos.items() if abs(x - x0) < TOL and abs(y - y0) < TOL)]
+    index = NodeIndex.from_dict(nodos, TOL)
+    names = np.array(list(nodos))
+    xy = np.array(list(nodos.values()))
+
+    # Nodo central y punto sin nodo
+    center = [n for n, (x, y) in nodos.items() if abs(x - a / 2) < TOL and abs(y - b / 2) < TOL]
+    check("find_labels: nodo central", index.find_labels([a / 2, b / 2]) == center[0])
+    check("find: punto sin nodo -> -1", index.find([a / 2 + 0.1, b / 2]) == -1)
+    queries = xy + 2e-4
+    check("find en lote (desplazados 2e-4)", np.array_equal(index.find(queries), np.arange(len(xy))))
+
+    # Bordes, caja y segmento
+    loop_border = {n for n, (x, y) in nodos.items()
+                   if abs(x) < TOL or abs(x - a) < TOL or abs(y) < TOL or abs(y - b) < TOL}
+    check("on_boundary = bordes por recorrido", set(names[index.on_boundary()]) == loop_border)
+    loop_box = {n for n, (x, y) in nodos.items() if 1 - TOL <= x <= 3 + TOL and 1 - TOL <= y <= 2 + TOL}
+    check("in_box = caja por recorrido", set(names[index.in_box([1, 1], [3, 2])]) == loop_box)
+    edge = index.on_segment([0, b], [a, b])
+    loop_edge = sorted((x, n) for n, (x, y) in nodos.items() if abs(y - b) < TOL)
+    check("on_segment (borde y = b) ordenado en x", list(names[edge]) == [n for _, n in loop_edge])
+    diagonal = index.on_segment([0, 0], [a, b])
+    check("on_segment (diagonal)", len(diagonal) == 5 and np.allclose(xy[diagonal, 1], xy[diagonal, 0] * b / a, atol=1e-6))
+
+    # Grilla
+    values = {n: x * 10 + y for n, (x, y) in nodos.items()}
+    xs, ys, grid = index.to_grid(np.array([values[n] for n in names]))
+    reference = loop_grid(nodos, values)
+    check("to_grid = bucle triple (con huecos NaN)",
+          grid.shape == (9, 13) and np.array_equal(np.isnan(grid), np.isnan(reference))
+          and np.allclose(grid[~np.isnan(grid)], reference[~np.isnan(reference)]))
+
+def benchmark(max_nodes):
+    print(f"{'Nodos':>8} {'Bucle triple (s)':>17} {'NodeIndex (ms)':>15}")
+    for n_side in (10, 20, 40, 100, 200, 315):
+        n = (n_side + 1) ** 2
+        if n > max_nodes:
+            break
+        nodos = noisy_grid(6.0, 4.0, n_side, n_side, seed=n_side)
+        values = {name: x + y for name, (x, y) in nodos.items()}
+        names = list(nodos)
+
+        t0 = time.perf_counter()
+        index = NodeIndex.from_dict(nodos, TOL)
+        _, _, grid = index.to_grid(np.array([values[name] for name in names]))
+        t_index = time.perf_counter() - t0
+
+        if n <= 2000:
+            t0 = time.perf_counter()
+            reference = loop_grid(nodos, values)
+            t_loop = f"{time.perf_counter() - t0:17.3f}"
+            assert np.allclose(grid, reference)
+        else:
+            t_loop = f"{'-':>17}"
+        print(f"{n:8d} {t_loop} {1e3 * t_index:15.2f}")
+
+if __name__ == "__main__":
+    max_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("=" * 60)
+    print("  1. Consultas contra recorridos lineales")
+    print("=" * 60)
+    verify_queries()
+    print()
+
+    print("=" * 60)
+    print("  2. Grilla de resultados")
+    print("=" * 60)
+    benchmark(max_nodes)
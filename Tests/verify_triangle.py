@@ -4,48 +4,23 @@ Verificacion de funciones de mallado triangular
 Para comparar con mathcad_triangle.dll en Mathcad Prime
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
 
+# Nucleo FEM compartido (raiz del repositorio)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from fem.mesh import grid_nodes, tri_connectivity
+from fem.quality import mesh_quality, format_quality_report
+
 def tri_nodes(Lx, Ly, nx, ny):
     """Genera coordenadas de nodos para malla rectangular"""
-    num_nodes = (nx + 1) * (ny + 1)
-    nodes = np.zeros((num_nodes, 2))
-
-    dx = Lx / nx
-    dy = Ly / ny
-
-    idx = 0
-    for j in range(ny + 1):
-        for i in range(nx + 1):
-            nodes[idx, 0] = i * dx  # x
-            nodes[idx, 1] = j * dy  # y
-            idx += 1
-
-    return nodes
+    return grid_nodes(Lx, Ly, nx, ny, order="x")
 
 def tri_elements(nx, ny):
     """Genera conectividad de elementos triangulares (base 1)"""
-    num_tri = 2 * nx * ny
-    elements = np.zeros((num_tri, 3), dtype=int)
-
-    tri_idx = 0
-    for j in range(ny):
-        for i in range(nx):
-            # Nodos del cuadrilatero (base 1)
-            n1 = j * (nx + 1) + i + 1
-            n2 = j * (nx + 1) + i + 2
-            n3 = (j + 1) * (nx + 1) + i + 2
-            n4 = (j + 1) * (nx + 1) + i + 1
-
-            # Triangulo 1: n1-n2-n4
-            elements[tri_idx, :] = [n1, n2, n4]
-            tri_idx += 1
-
-            # Triangulo 2: n2-n3-n4
-            elements[tri_idx, :] = [n2, n3, n4]
-            tri_idx += 1
-
-    return elements
+    return tri_connectivity(nx, ny, order="x", base=1)
 
 def tri_area(x1, y1, x2, y2, x3, y3):
     """Calcula el area de un triangulo"""
@@ -151,7 +126,15 @@ print(f"   Triangulo (0,0), (3,0), (0,3)")
 print(f"   Centroide = ({cx:.6f}, {cy:.6f}) (esperado: 1.0, 1.0)")
 print()
 
-# 6. Resumen para Mathcad
+# 6. Calidad de toda la malla (vectorizado)
+print("6. CALIDAD DE MALLA - Todos los elementos")
+print("-" * 40)
+metrics = mesh_quality(nodes, elements, base=1)
+for line in format_quality_report(metrics, base=1).splitlines():
+    print(f"   {line}")
+print()
+
+# 7. Resumen para Mathcad
 print("=" * 60)
 print("  VALORES PARA VERIFICAR EN MATHCAD PRIME")
 print("=" * 60)
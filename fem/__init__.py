@@ -0,0 +1,27 @@
+"""
+fem - Nucleo FEM compartido por los scripts de verificacion en Python
+
+Modulos:
+    mesh        Generadores vectorizados de mallas estructuradas
+    quality     Metricas de calidad de malla (area, calidad, aspecto, angulos, Jacobiano)
+    renumber    Renumeracion RCM de nodos (ancho de banda)
+    quadrature  Cuadratura de Gauss-Legendre precalculada e integracion por einsum
+    hermite     Funciones de forma del elemento de placa de Hermite (16 DOF)
+    dkq         Elementos de placa DKQ y DKT vectorizados
+    elemcache   Cache de matrices de elemento por geometria canonica
+    mass        Matrices de masa consistentes y concentradas (HRZ)
+    modal       Modos de vibracion (eigsh shift-invert con factorizacion reutilizable)
+    recovery    Esfuerzos resultantes en puntos de Gauss y promedio nodal
+    mindlin_tri Triangulo de placa de 3 nodos (flexion + cortante) en lote
+    assembly    Mapas de DOF y ensamblaje COO -> CSR
+    solvers     Eliminacion de DOF y factorizaciones reutilizables (splu / CHOLMOD)
+    kernels     Registro de kernels de elemento (rigidez, masa, resultantes)
+    model       Modelo como estructura de arreglos y tuberia ensamblar/resolver
+    frame       Porticos 2D y vigas continuas en banda simetrica (Cholesky en banda)
+    store       Almacen en disco (.npy con mmap) de K, cargas y resultados por hash del modelo
+    adapt       Estimador de error ZZ, refinamiento conforme y orden de convergencia observado
+    s2k         Lectura perezosa (indice por bytes) y escritura en bloque de modelos .$2k de SAP2000
+    saptables   Resultados de SAP2000 por tablas completas (DatabaseTables) en arreglos por nodo y caso
+    sapmock     SapModel falso en memoria y proxy que perfila, graba y reproduce llamadas COM
+    spatial     Indice espacial de nodos con tolerancia (punto, caja, segmento, contorno, grilla)
+"""
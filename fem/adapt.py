@@ -0,0 +1,179 @@
+"""
+adapt.py - Refinamiento adaptativo de mallas triangulares (estimador ZZ)
+
+Ciclo resolver -> estimar -> marcar -> refinar, todo en lote:
+
+    1. Estimador de Zienkiewicz-Zhu: el campo recuperado sigma* es el
+       promedio nodal de los esfuerzos resultantes (fem.recovery)
+       interpolado linealmente; el error del elemento es
+           eta_e^2 = integral (sigma* - sigma_h)^T C^-1 (sigma* - sigma_h) dA
+       con C^-1 la flexibilidad de la placa (norma de energia). Con
+       sigma* y sigma_h lineales en el triangulo la integral es exacta:
+           integral N_i N_j dA = A/12 (1 + delta_ij)
+    2. Marcado de Dorfler: el menor conjunto de elementos cuyo eta^2 suma
+       una fraccion theta del total.
+    3. Biseccion por el lado mas largo: cada elemento marcado marca su lado
+       mas largo; el cierre agrega el lado mas largo de todo elemento con
+       algun lado marcado hasta que no cambia. Cada lado marcado se parte
+       en sus dos elementos vecinos, de modo que la malla queda conforme
+       (sin nodos colgantes) y los angulos no degeneran.
+
+observed_order da el orden de convergencia observado y el valor
+extrapolado de Richardson de una escalera de mallas (h a la mitad por
+nivel), para medir el error sin solucion de referencia.
+"""
+
+import numpy as np
+
+from .mindlin_tri import plate_constitutive
+from .model import resultants
+
+# ============================================================
+# ESTIMADOR
+# ============================================================
+def energy_weight(model):
+    """Flexibilidad C^-1 (n_comp, n_comp) de los resultantes del kernel
+
+    Mx, My, Mxy con Db^-1 y, si el kernel tiene cortantes, Qx, Qy con Ds^-1.
+    """
+    Db, Ds = plate_constitutive(model.material["E"], model.material["nu"], model.material["t"])
+    n_comp = len(model.kernel.resultant_names)
+    W = np.zeros((n_comp, n_comp))
+    W[:3, :3] = np.linalg.inv(Db)
+    if n_comp == 5:
+        W[3:, 3:] = np.linalg.inv(Ds)
+    return W
+
+def triangle_areas(nodes, elements):
+    c = np.asarray(nodes)[np.asarray(elements)][:, :, :2]
+    d1 = c[:, 1] - c[:, 0]
+    d2 = c[:, 2] - c[:, 0]
+    return 0.5 * np.abs(d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0])
+
+def zz_error(model, U, weight=None):
+    """Indicadores eta_e (n_elem,) y norma de energia del campo recuperado
+
+    U: desplazamientos de un caso (num_dof,). weight: matriz de la norma
+    (por defecto energy_weight(model)).
+    Retorna (eta, norm) con el error relativo global sqrt(sum eta^2) / norm.
+    """
+    W = energy_weight(model) if weight is None else weight
+    res = resultants(model, U)
+    sigma_h = res["element_nodes"]                          # (n_elem, 3, n_comp)
+    sigma_star = res["nodal"][model.elements]               # (n_elem, 3, n_comp)
+
+    area = triangle_areas(model.nodes, model.elements)
+    NN = (np.ones((3, 3)) + np.eye(3)) / 12.0               # integral N_i N_j / A
+
+    e = sigma_star - sigma_h
+    eta2 = area * np.einsum('ij,nik,kl,njl->n', NN, e, W, e, optimize=True)
+    norm2 = np.sum(area * np.einsum('ij,nik,kl,njl->n', NN, sigma_star, W, sigma_star, optimize=True))
+    return np.sqrt(np.maximum(eta2, 0.0)), np.sqrt(norm2)
+
+def mark_elements(eta, theta=0.5):
+    """Marcado de Dorfler: mascara del menor conjunto con sum eta^2 >= theta * total"""
+    eta2 = np.asarray(eta) ** 2
+    order = np.argsort(eta2)[::-1]
+    cumulative = np.cumsum(eta2[order])
+    count = int(np.searchsorted(cumulative, theta * cumulative[-1])) + 1
+
+    marked = np.zeros(len(eta2), dtype=bool)
+    marked[order[:count]] = True
+    return marked
+
+# ============================================================
+# REFINAMIENTO
+# ============================================================
+# Lado local k une los vertices k y k+1
+_EDGE_VERTICES = np.array([[0, 1], [1, 2], [2, 0]])
+
+def triangle_edges(elements):
+    """Lados unicos (n_edges, 2) y lado de cada elemento (n_elem, 3)"""
+    elements = np.asarray(elements)
+    pairs = np.sort(elements[:, _EDGE_VERTICES], axis=2).reshape(-1, 2)
+    edges, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    return edges, inverse.reshape(-1, 3)
+
+def refine_triangles(nodes, elements, marked):
+    """Biseccion conforme por el lado mas largo de los elementos marcados
+
+    Retorna (nodes, elements, parent) con parent[k] = elemento original del
+    que proviene el elemento nuevo k. Los nodos nuevos son puntos medios de
+    lados y se agregan al final; los existentes conservan su numero.
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    elements = np.asarray(elements)
+    edges, elem_edges = triangle_edges(elements)
+
+    # Lado mas largo de cada elemento (indice local)
+    xy = nodes[:, :2]
+    edge_len = np.linalg.norm(xy[edges[:, 1]] - xy[edges[:, 0]], axis=1)
+    longest = np.argmax(edge_len[elem_edges], axis=1)
+    longest_edge = elem_edges[np.arange(len(elements)), longest]
+
+    # Marcado de lados y cierre de conformidad
+    edge_marked = np.zeros(len(edges), dtype=bool)
+    edge_marked[longest_edge[np.asarray(marked, dtype=bool)]] = True
+    while True:
+        touched = edge_marked[elem_edges].any(axis=1)
+        missing = touched & ~edge_marked[longest_edge]
+        if not missing.any():
+            break
+        edge_marked[longest_edge[missing]] = True
+
+    # Puntos medios de los lados marcados
+    split = np.flatnonzero(edge_marked)
+    midpoint = np.full(len(edges), -1, dtype=elements.dtype)
+    midpoint[split] = len(nodes) + np.arange(len(split))
+    new_nodes = 0.5 * (nodes[edges[split, 0]] + nodes[edges[split, 1]])
+
+    # Rotacion local: el lado mas largo pasa a ser el lado 0 = (a, b), c opuesto
+    rot = (longest[:, None] + np.arange(3)) % 3
+    rows = np.arange(len(elements))[:, None]
+    a, b, c = elements[rows, rot].T
+    m0, m1, m2 = midpoint[elem_edges[rows, rot]].T
+    s1, s2 = m1 >= 0, m2 >= 0
+    bisected = m0 >= 0
+
+    # Hijos por patron de lados partidos (conservan la orientacion)
+    patterns = [
+        (~bisected, [(a, b, c)]),
+        (bisected & ~s1 & ~s2, [(a, m0, c), (m0, b, c)]),
+        (bisected & s1 & ~s2, [(a, m0, c), (m0, b, m1), (m0, m1, c)]),
+        (bisected & ~s1 & s2, [(a, m0, m2), (m2, m0, c), (m0, b, c)]),
+        (bisected & s1 & s2, [(a, m0, m2), (m2, m0, c), (m0, b, m1), (m0, m1, c)]),
+    ]
+
+    children, parent = [], []
+    for mask, tris in patterns:
+        idx = np.flatnonzero(mask)
+        for tri in tris:
+            children.append(np.column_stack([v[idx] for v in tri]))
+            parent.append(idx)
+
+    parent = np.concatenate(parent)
+    order = np.argsort(parent, kind="stable")
+    new_elements = np.concatenate(children)[order]
+    return np.vstack([nodes, new_nodes]), new_elements, parent[order]
+
+# ============================================================
+# CONVERGENCIA
+# ============================================================
+def observed_order(w):
+    """Orden observado y valor extrapolado (Richardson) de los tres niveles mas finos
+
+    Con h reducido a la mitad en cada nivel: p = log2((w1 - w0) / (w2 - w1)),
+    sin depender de la referencia. Si las diferencias cambian de signo o no
+    decrecen (p <= 0) la escalera no esta en el rango asintotico y se
+    retorna (nan, nan).
+    """
+    if len(w) < 3:
+        return np.nan, np.nan
+    w0, w1, w2 = w[-3:]
+    d1, d2 = w1 - w0, w2 - w1
+    if d1 == 0 or d2 == 0 or d1 * d2 < 0:
+        return np.nan, np.nan
+    p = np.log2(d1 / d2)
+    if not p > 0:
+        return np.nan, np.nan
+    return p, w2 + d2 / (2**p - 1)
@@ -0,0 +1,309 @@
+"""
+dkq.py - Elementos de placa de Kirchhoff discreta DKQ y DKT vectorizados
+
+DKQ (cuadrilatero, Batoz & Tahar 1982): coeficientes de arista a..e por
+arista y funciones H sobre la base serendipita de 8 nodos N1..N8 en
+coordenadas naturales [-1, 1]^2; la geometria es bilineal.
+DKT (triangulo, Batoz, Bathe & Ho 1980) con derivadas explicitas en
+coordenadas de area.
+
+Todo se evalua para un lote de elementos: los coeficientes de arista son
+arreglos (n_elem, n_aristas), las funciones H se evaluan en todos los
+puntos de Gauss a la vez y las matrices de rigidez se devuelven como
+bloques (n_elem, m, m) integrados con fem.quadrature.
+
+DOF por nodo [w, theta_x, theta_y] en ambos (DKQ 12 DOF, DKT 9 DOF), con
+theta_x = dw/dy, theta_y = -dw/dx; beta_x = theta_y, beta_y = -theta_x.
+Curvaturas: [d(beta_x)/dx, d(beta_y)/dy, d(beta_x)/dy + d(beta_y)/dx]
+"""
+
+import numpy as np
+
+from .quadrature import tensor_gauss, integrate_stiffness
+
+# Nodos del cuadrilatero en coordenadas naturales (antihorario); los nodos
+# intermedios 5..8 son los puntos medios de las aristas 1-2, 2-3, 3-4, 4-1
+DKQ_NODES = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+
+# El nodo i usa la arista que sale de el (k = i) y la que llega a el (m = i - 1)
+_EDGE_OUT = np.arange(4)
+_EDGE_IN = np.roll(np.arange(4), 1)
+
+def plate_bending_D(E, nu, t):
+    """Matriz constitutiva de flexion D_b (3, 3)"""
+    return E * t**3 / (12 * (1 - nu**2)) * np.array([
+        [1, nu, 0],
+        [nu, 1, 0],
+        [0, 0, (1 - nu) / 2],
+    ])
+
+# ============================================================
+# DKQ
+# ============================================================
+def quad_bilinear_functions(xi, eta):
+    """Funciones bilineales N1..N4 (nq, 4) y sus derivadas naturales (nq, 2, 4)
+
+    Son las de la geometria (Jacobiano) y la masa del cuadrilatero.
+    """
+    xi = np.asarray(xi, dtype=float)[..., None]
+    eta = np.asarray(eta, dtype=float)[..., None]
+    sx, sy = DKQ_NODES[:, 0], DKQ_NODES[:, 1]
+
+    N = (1 + xi * sx) * (1 + eta * sy) / 4
+    dN = np.stack([
+        sx * (1 + eta * sy) / 4,
+        sy * (1 + xi * sx) / 4,
+    ], axis=-2)
+    return N, dN
+
+def dkq_shape_functions(xi, eta):
+    """Funciones serendipitas de 8 nodos N1..N8 (nq, 8) y sus derivadas naturales (nq, 2, 8)
+
+    El eje 1 de las derivadas es (d/dxi, d/deta).
+    """
+    xi = np.asarray(xi, dtype=float)
+    eta = np.asarray(eta, dtype=float)
+    x, y = xi[..., None], eta[..., None]
+    sx, sy = DKQ_NODES[:, 0], DKQ_NODES[:, 1]
+
+    corner = (1 + x * sx) * (1 + y * sy) * (x * sx + y * sy - 1) / 4
+    corner_dxi = sx * (1 + y * sy) * (2 * x * sx + y * sy) / 4
+    corner_deta = sy * (1 + x * sx) * (x * sx + 2 * y * sy) / 4
+
+    mid = np.stack([
+        (1 - xi**2) * (1 - eta) / 2,
+        (1 + xi) * (1 - eta**2) / 2,
+        (1 - xi**2) * (1 + eta) / 2,
+        (1 - xi) * (1 - eta**2) / 2,
+    ], axis=-1)
+    mid_dxi = np.stack([-xi * (1 - eta), (1 - eta**2) / 2, -xi * (1 + eta), -(1 - eta**2) / 2], axis=-1)
+    mid_deta = np.stack([-(1 - xi**2) / 2, -eta * (1 + xi), (1 - xi**2) / 2, -eta * (1 - xi)], axis=-1)
+
+    N = np.concatenate([corner, mid], axis=-1)
+    dN = np.stack([
+        np.concatenate([corner_dxi, mid_dxi], axis=-1),
+        np.concatenate([corner_deta, mid_deta], axis=-1),
+    ], axis=-2)
+    return N, dN
+
+def dkq_edge_coefficients(coords):
+    """Coeficientes a, b, c, d, e (cada uno (n_elem, 4)) de las aristas 5..8
+
+    Batoz & Tahar (1982), con x_ij = x_i - x_j de la arista k = ij:
+        a = -x_ij / L^2            d = -y_ij / L^2
+        b = 3/4 x_ij y_ij / L^2    e = (y_ij^2 / 4 - x_ij^2 / 2) / L^2
+        c = (x_ij^2 / 4 - y_ij^2 / 2) / L^2
+
+    coords: (n_elem, 4, 2) nodos en sentido antihorario
+    """
+    coords = np.asarray(coords, dtype=float)
+    edge = coords - np.roll(coords, -1, axis=1)     # p[i] - p[i+1]
+    x, y = edge[..., 0], edge[..., 1]
+    L2 = x**2 + y**2
+
+    return {
+        "a": -x / L2,
+        "b": 0.75 * x * y / L2,
+        "c": (0.25 * x**2 - 0.5 * y**2) / L2,
+        "d": -y / L2,
+        "e": (0.25 * y**2 - 0.5 * x**2) / L2,
+    }
+
+def dkq_h_coefficients(coef):
+    """Coeficientes (n_elem, 12, 8) de las funciones H sobre la base serendipita N1..N8
+
+    Retorna (Cx, Cy) para beta_x y beta_y. Fila 3*i + f: DOF f (w, theta_x,
+    theta_y) del nodo i. Con k la arista que sale del nodo i y m la que llega:
+        Hx = 1.5 (a_k N_k - a_m N_m)      Hy = 1.5 (d_k N_k - d_m N_m)
+        Hx = b_k N_k + b_m N_m            Hy = -N_i + e_k N_k + e_m N_m
+        Hx = N_i - c_k N_k - c_m N_m      Hy = -b_k N_k - b_m N_m
+    """
+    n_elem = coef["a"].shape[0]
+    Cx = np.zeros((n_elem, 4, 3, 8))
+    Cy = np.zeros((n_elem, 4, 3, 8))
+    node = np.arange(4)
+    k, m = _EDGE_OUT, _EDGE_IN
+    Nk, Nm = 4 + k, 4 + m
+
+    def edge(name, edges):
+        return coef[name][:, edges]
+
+    # beta_x
+    Cx[:, node, 0, Nk] = 1.5 * edge("a", k)
+    Cx[:, node, 0, Nm] = -1.5 * edge("a", m)
+    Cx[:, node, 1, Nk] = edge("b", k)
+    Cx[:, node, 1, Nm] = edge("b", m)
+    Cx[:, node, 2, node] = 1.0
+    Cx[:, node, 2, Nk] = -edge("c", k)
+    Cx[:, node, 2, Nm] = -edge("c", m)
+
+    # beta_y
+    Cy[:, node, 0, Nk] = 1.5 * edge("d", k)
+    Cy[:, node, 0, Nm] = -1.5 * edge("d", m)
+    Cy[:, node, 1, node] = -1.0
+    Cy[:, node, 1, Nk] = edge("e", k)
+    Cy[:, node, 1, Nm] = edge("e", m)
+    Cy[:, node, 2, Nk] = -edge("b", k)
+    Cy[:, node, 2, Nm] = -edge("b", m)
+
+    return Cx.reshape(n_elem, 12, 8), Cy.reshape(n_elem, 12, 8)
+
+def dkq_h_functions(coef, N):
+    """Funciones H de beta_x y beta_y, cada una (n_elem, ..., 12)
+
+    N pueden ser los valores (nq, 8) o las derivadas (nq, 2, 8) de
+    dkq_shape_functions; como las H son lineales en N, la misma expresion
+    da las derivadas.
+    """
+    Cx, Cy = dkq_h_coefficients(coef)
+    return (np.einsum('nim,...m->n...i', Cx, N),
+            np.einsum('nim,...m->n...i', Cy, N))
+
+def quad_jacobian(coords, dN):
+    """Jacobiano J (n_elem, nq, 2, 2), su inversa y su determinante
+
+    dN: derivadas bilineales (nq, 2, 4). J[a, b] = d x_b / d xi_a con
+    xi = (xi, eta), x = (x, y).
+    """
+    coords = np.asarray(coords, dtype=float)
+    J = np.einsum('qak,nkb->nqab', dN, coords)
+    det = J[..., 0, 0] * J[..., 1, 1] - J[..., 0, 1] * J[..., 1, 0]
+    inv = np.stack([
+        np.stack([J[..., 1, 1], -J[..., 0, 1]], axis=-1),
+        np.stack([-J[..., 1, 0], J[..., 0, 0]], axis=-1),
+    ], axis=-2) / det[..., None, None]
+    return J, inv, det
+
+def dkq_B_matrices(coords, xi, eta):
+    """Matrices B (n_elem, nq, 3, 12) y det(J) (n_elem, nq) en los puntos (xi, eta)"""
+    coords = np.asarray(coords, dtype=float)
+    coef = dkq_edge_coefficients(coords)
+    _, dN = dkq_shape_functions(xi, eta)
+    _, dG = quad_bilinear_functions(xi, eta)
+
+    _, J_inv, det = quad_jacobian(coords, dG)
+    dHbx, dHby = dkq_h_functions(coef, dN)          # (n, nq, 2, 12) naturales
+    dHbx = np.einsum('nqab,nqbi->nqai', J_inv, dHbx)
+    dHby = np.einsum('nqab,nqbi->nqai', J_inv, dHby)
+
+    B = np.stack([
+        dHbx[..., 0, :],
+        dHby[..., 1, :],
+        dHbx[..., 1, :] + dHby[..., 0, :],
+    ], axis=-2)
+    return B, det
+
+def dkq_stiffness(coords, D, n_points=2):
+    """Matrices de rigidez DKQ (n_elem, 12, 12) con regla de Gauss n_points x n_points"""
+    points, weights = tensor_gauss(n_points, -1.0, 1.0)
+    B, det = dkq_B_matrices(coords, points[:, 0], points[:, 1])
+    return integrate_stiffness(B, D, weights * det)
+
+# ============================================================
+# DKT
+# ============================================================
+def dkt_edge_coefficients(coords):
+    """Coeficientes P, t, q, r (cada uno (n_elem, 3)) de los lados 23, 31, 12
+
+    coords: (n_elem, 3, 2) nodos en sentido antihorario
+    """
+    coords = np.asarray(coords, dtype=float)
+    # x_ij = x_i - x_j para los lados k = 4, 5, 6 (ij = 23, 31, 12)
+    d = np.roll(coords, -1, axis=1) - np.roll(coords, -2, axis=1)
+    x, y = d[..., 0], d[..., 1]
+    L2 = x**2 + y**2
+
+    return {
+        "P": -6 * x / L2,
+        "t": -6 * y / L2,
+        "q": 3 * x * y / L2,
+        "r": 3 * y**2 / L2,
+    }
+
+def dkt_h_derivatives(coef, xi, eta):
+    """Derivadas de Hx, Hy respecto a las coordenadas de area (xi, eta)
+
+    Retorna (Hx_xi, Hx_eta, Hy_xi, Hy_eta), cada una (n_elem, nq, 9).
+    """
+    xi = np.asarray(xi, dtype=float)[None, :]
+    eta = np.asarray(eta, dtype=float)[None, :]
+    P4, P5, P6 = (coef["P"][:, k, None] for k in range(3))
+    t4, t5, t6 = (coef["t"][:, k, None] for k in range(3))
+    q4, q5, q6 = (coef["q"][:, k, None] for k in range(3))
+    r4, r5, r6 = (coef["r"][:, k, None] for k in range(3))
+    s, u = 1 - 2 * xi, 1 - 2 * eta
+
+    def stack(*terms):
+        return np.stack(np.broadcast_arrays(*terms), axis=-1)
+
+    Hx_xi = stack(
+        P6 * s + (P5 - P6) * eta,
+        q6 * s - (q5 + q6) * eta,
+        -4 + 6 * (xi + eta) + r6 * s - eta * (r5 + r6),
+        -P6 * s + eta * (P4 + P6),
+        q6 * s - eta * (q6 - q4),
+        -2 + 6 * xi + r6 * s + eta * (r4 - r6),
+        -eta * (P5 + P4),
+        eta * (q4 - q5),
+        -eta * (r5 - r4),
+    )
+    Hy_xi = stack(
+        t6 * s + eta * (t5 - t6),
+        1 + r6 * s - eta * (r5 + r6),
+        -q6 * s + eta * (q5 + q6),
+        -t6 * s + eta * (t4 + t6),
+        -1 + r6 * s + eta * (r4 - r6),
+        -q6 * s - eta * (q4 - q6),
+        -eta * (t4 + t5),
+        eta * (r4 - r5),
+        -eta * (q4 - q5),
+    )
+    Hx_eta = stack(
+        -P5 * u - xi * (P6 - P5),
+        q5 * u - xi * (q5 + q6),
+        -4 + 6 * (xi + eta) + r5 * u - xi * (r5 + r6),
+        xi * (P4 + P6),
+        xi * (q4 - q6),
+        -xi * (r6 - r4),
+        P5 * u - xi * (P4 + P5),
+        q5 * u + xi * (q4 - q5),
+        -2 + 6 * eta + r5 * u + xi * (r4 - r5),
+    )
+    Hy_eta = stack(
+        -t5 * u - xi * (t6 - t5),
+        1 + r5 * u - xi * (r5 + r6),
+        -q5 * u + xi * (q5 + q6),
+        xi * (t4 + t6),
+        xi * (r4 - r6),
+        -xi * (q4 - q6),
+        t5 * u - xi * (t4 + t5),
+        -1 + r5 * u + xi * (r4 - r5),
+        -q5 * u - xi * (q4 - q5),
+    )
+    return Hx_xi, Hx_eta, Hy_xi, Hy_eta
+
+def dkt_B_matrices(coords, xi, eta):
+    """Matrices B (n_elem, nq, 3, 9) y area (n_elem,) en los puntos (xi, eta)"""
+    coords = np.asarray(coords, dtype=float)
+    x, y = coords[..., 0], coords[..., 1]
+    x31, y31 = (x[:, 2] - x[:, 0])[:, None, None], (y[:, 2] - y[:, 0])[:, None, None]
+    x12, y12 = (x[:, 0] - x[:, 1])[:, None, None], (y[:, 0] - y[:, 1])[:, None, None]
+    two_A = (x31 * y12 - x12 * y31)[:, 0, 0]
+
+    Hx_xi, Hx_eta, Hy_xi, Hy_eta = dkt_h_derivatives(dkt_edge_coefficients(coords), xi, eta)
+    B = np.stack([
+        y31 * Hx_xi + y12 * Hx_eta,
+        -x31 * Hy_xi - x12 * Hy_eta,
+        -x31 * Hx_xi - x12 * Hx_eta + y31 * Hy_xi + y12 * Hy_eta,
+    ], axis=-2) / two_A[:, None, None, None]
+    return B, two_A / 2
+
+# Regla de 3 puntos en los puntos medios de los lados (exacta para grado 2)
+DKT_POINTS = np.array([[0.5, 0.0], [0.5, 0.5], [0.0, 0.5]])
+DKT_WEIGHTS = np.full(3, 1.0 / 6.0)
+
+def dkt_stiffness(coords, D):
+    """Matrices de rigidez DKT (n_elem, 9, 9)"""
+    B, area = dkt_B_matrices(coords, DKT_POINTS[:, 0], DKT_POINTS[:, 1])
+    # Los pesos suman 1/2 (area del triangulo de referencia): dA = 2A dxi deta
+    return integrate_stiffness(B, D, 2 * area[:, None] * DKT_WEIGHTS)
@@ -0,0 +1,93 @@
+"""
+elemcache.py - Cache de matrices de elemento por geometria canonica
+
+En mallas regulares casi todos los elementos son traslaciones de unos pocos
+elementos tipo (uno en cuadrilateros, dos en triangulos con diagonal
+alternada). La clave de cache es:
+
+    (tipo de elemento, material, coordenadas relativas al primer nodo redondeadas)
+
+de modo que es invariante a traslaciones. Las matrices se calculan solo para
+las geometrias nuevas (en un solo lote) y se distribuyen a todos los
+elementos por indice. En mallas no estructuradas se reporta la tasa de
+aciertos.
+"""
+
+import numpy as np
+
+def canonical_geometry(coords, decimals=9):
+    """Coordenadas (n_elem, n_nodos*2) relativas al primer nodo, redondeadas
+
+    El +0.0 convierte -0.0 en 0.0 para que ambos den la misma clave.
+    """
+    coords = np.asarray(coords, dtype=float)
+    rel = coords - coords[:, :1, :]
+    return np.round(rel, decimals).reshape(len(coords), -1) + 0.0
+
+class ElementMatrixCache:
+    """Matrices de elemento reutilizadas entre elementos con la misma geometria canonica"""
+
+    def __init__(self, decimals=9):
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._store = {}
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def hit_rate(self):
+        """Fraccion de elementos servidos desde el cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._store.clear()
+        self.hits = self.misses = 0
+
+    def element_matrices(self, coords, compute, kind, material=()):
+        """Matrices (n_elem, m, m) de todos los elementos
+
+        coords:   (n_elem, n_nodos, 2) coordenadas de los nodos
+        compute:  funcion coords_unicas -> matrices (n_unicas, m, m)
+        kind:     nombre del tipo de elemento (parte de la clave)
+        material: tupla de parametros de material/espesor (parte de la clave)
+
+        Solo los elementos cuya geometria no esta en el cache cuentan como
+        fallos; cada fallo calcula una matriz, pero todas en una llamada.
+        """
+        coords = np.asarray(coords, dtype=float)
+        prefix = (kind, tuple(float(v) for v in material))
+
+        geometry = canonical_geometry(coords, self.decimals)
+        unique, first, inverse = np.unique(geometry, axis=0, return_index=True, return_inverse=True)
+        keys = [prefix + (row.tobytes(),) for row in unique]
+
+        cached = np.array([key in self._store for key in keys], dtype=bool)
+        missing = np.flatnonzero(~cached)
+
+        Ke_unique = None
+        if len(missing):
+            # Se calcula con las coordenadas de un representante de cada geometria
+            computed = np.asarray(compute(coords[first[missing]]))
+            Ke_unique = np.empty((len(keys),) + computed.shape[1:], dtype=computed.dtype)
+            Ke_unique[missing] = computed
+            self._store.update(zip((keys[k] for k in missing), computed))
+
+        found = np.flatnonzero(cached)
+        if len(found):
+            stored = np.stack([self._store[keys[k]] for k in found])
+            if Ke_unique is None:
+                Ke_unique = np.empty((len(keys),) + stored.shape[1:], dtype=stored.dtype)
+            Ke_unique[found] = stored
+
+        self.misses += len(missing)
+        self.hits += len(coords) - len(missing)
+
+        return Ke_unique[inverse.ravel()]
+
+    def report(self):
+        """Resumen de una linea: entradas, aciertos, fallos y tasa de aciertos"""
+        return (f"{len(self)} matrices unicas, {self.hits} aciertos, "
+                f"{self.misses} fallos ({100 * self.hit_rate:.1f} % aciertos)")
@@ -0,0 +1,193 @@
+"""
+frame.py - Porticos 2D y vigas continuas con rigidez en banda simetrica
+
+Elemento de portico de 2 nodos (Euler-Bernoulli) con DOF [u, v, theta] por
+nodo, como el de verify_fem_beam.py. Todas las funciones trabajan sobre un
+lote de barras:
+
+    k_local = matriz 6x6 en ejes de la barra (EA/L, 12EI/L^3, 6EI/L^2, ...)
+    k_e     = T^T k_local T                    (n_elem, 6, 6)
+
+La rigidez global se guarda en banda simetrica (forma superior de
+scipy.linalg.solveh_banded): ab[u + i - j, j] = K[i, j] para i <= j, con
+u el semi-ancho de banda. En vigas continuas y porticos numerados en orden
+u es pequeno (5 con nodos consecutivos), de modo que memoria y
+factorizacion son O(n u^2) en lugar de O(n^3) del solve denso. Si la
+numeracion da un ancho de banda grande conviene renumerar antes con
+fem.renumber.
+
+Los apoyos se imponen por eliminacion dentro de la banda (fila y columna
+en cero, diagonal unitaria), sin cambiar el ancho de banda. BandedSolver
+factoriza una sola vez (cholesky_banded) y resuelve varios casos de carga.
+"""
+
+import numpy as np
+from scipy.linalg import cholesky_banded, cho_solve_banded
+
+# ============================================================
+# ELEMENTO
+# ============================================================
+def frame_geometry(nodes, elements):
+    """Longitud, coseno y seno de cada barra (n_elem,)"""
+    nodes = np.asarray(nodes, dtype=float)
+    elements = np.asarray(elements)
+    d = nodes[elements[:, 1], :2] - nodes[elements[:, 0], :2]
+    L = np.hypot(d[:, 0], d[:, 1])
+    return L, d[:, 0] / L, d[:, 1] / L
+
+def frame_local_stiffness(L, E, A, I):
+    """Matrices de rigidez en ejes locales (n_elem, 6, 6)
+
+    E, A, I: escalares o arreglos (n_elem,) por barra.
+    """
+    L = np.asarray(L, dtype=float)
+    E, A, I = (np.broadcast_to(np.asarray(p, dtype=float), L.shape) for p in (E, A, I))
+
+    k11 = E * A / L
+    k22 = 12 * E * I / L**3
+    k23 = 6 * E * I / L**2
+    k33 = 4 * E * I / L
+    k36 = 2 * E * I / L
+
+    k = np.zeros(L.shape + (6, 6))
+    k[:, 0, 0] = k[:, 3, 3] = k11
+    k[:, 0, 3] = k[:, 3, 0] = -k11
+    k[:, 1, 1] = k[:, 4, 4] = k22
+    k[:, 1, 4] = k[:, 4, 1] = -k22
+    k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = k23
+    k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -k23
+    k[:, 2, 2] = k[:, 5, 5] = k33
+    k[:, 2, 5] = k[:, 5, 2] = k36
+    return k
+
+def frame_transformation(c, s):
+    """Matrices de rotacion global -> local (n_elem, 6, 6)"""
+    c = np.asarray(c, dtype=float)
+    s = np.asarray(s, dtype=float)
+
+    T = np.zeros(c.shape + (6, 6))
+    for o in (0, 3):
+        T[:, o, o] = T[:, o + 1, o + 1] = c
+        T[:, o, o + 1] = s
+        T[:, o + 1, o] = -s
+        T[:, o + 2, o + 2] = 1.0
+    return T
+
+def frame_stiffness(nodes, elements, E, A, I):
+    """Matrices de rigidez en ejes globales (n_elem, 6, 6): T^T k_local T"""
+    L, c, s = frame_geometry(nodes, elements)
+    T = frame_transformation(c, s)
+    k = frame_local_stiffness(L, E, A, I)
+    return np.einsum('nji,njk,nkl->nil', T, k, T, optimize=True)
+
+def frame_uniform_load(nodes, elements, q):
+    """Cargas nodales equivalentes de una carga uniforme q: (p_global, p_local) (n_elem, 6)
+
+    q: (n_elem,) o escalar, carga por unidad de longitud en el eje local y
+    de la barra. En ejes locales: [0, qL/2, qL^2/12, 0, qL/2, -qL^2/12].
+    """
+    L, c, s = frame_geometry(nodes, elements)
+    q = np.broadcast_to(np.asarray(q, dtype=float), L.shape)
+
+    p_local = np.zeros(L.shape + (6,))
+    p_local[:, 1] = p_local[:, 4] = q * L / 2
+    p_local[:, 2] = q * L**2 / 12
+    p_local[:, 5] = -q * L**2 / 12
+    return np.einsum('nji,nj->ni', frame_transformation(c, s), p_local), p_local
+
+def member_end_forces(nodes, elements, E, A, I, U, dofs, p_local=None):
+    """Fuerzas en los extremos de cada barra en ejes locales (n_elem, 6) [, n_cases]
+
+    f = k_local T u_e - p_local, con p_local las cargas equivalentes de las
+    cargas de barra (frame_uniform_load). Orden [N_i, V_i, M_i, N_j, V_j, M_j]
+    con la convencion de signos de la matriz de rigidez (ejes locales).
+    """
+    L, c, s = frame_geometry(nodes, elements)
+    kT = np.einsum('nij,njk->nik', frame_local_stiffness(L, E, A, I), frame_transformation(c, s))
+
+    u_e = np.asarray(U)[np.asarray(dofs)]
+    f = np.einsum('nij,nj...->ni...', kT, u_e)
+    if p_local is not None:
+        f = f - np.asarray(p_local).reshape(p_local.shape + (1,) * (f.ndim - 2))
+    return f
+
+# ============================================================
+# ALMACENAMIENTO EN BANDA
+# ============================================================
+def dof_bandwidth(dofs):
+    """Semi-ancho de banda u = max |i - j| sobre los DOF de cada elemento"""
+    dofs = np.asarray(dofs)
+    return int(np.max(dofs.max(axis=1) - dofs.min(axis=1)))
+
+def assemble_banded(Ke, dofs, num_dof, bandwidth=None):
+    """Ensambla bloques Ke (n_elem, m, m) en banda simetrica superior (u + 1, num_dof)"""
+    Ke = np.asarray(Ke)
+    dofs = np.asarray(dofs, dtype=np.int64)
+    u = dof_bandwidth(dofs) if bandwidth is None else bandwidth
+
+    rows = np.broadcast_to(dofs[:, :, None], Ke.shape)
+    cols = np.broadcast_to(dofs[:, None, :], Ke.shape)
+    upper = rows <= cols
+
+    ab = np.zeros((u + 1, num_dof))
+    np.add.at(ab, (u + rows[upper] - cols[upper], cols[upper]), Ke[upper])
+    return ab
+
+def banded_matvec(ab, x):
+    """Producto K x con K en banda simetrica superior; x: (n,) o (n, n_cases)"""
+    u = ab.shape[0] - 1
+    x = np.asarray(x, dtype=float)
+    y = ab[u].reshape(-1, *([1] * (x.ndim - 1))) * x
+    for d in range(1, u + 1):
+        diag = ab[u - d, d:].reshape(-1, *([1] * (x.ndim - 1)))
+        y[:-d] += diag * x[d:]
+        y[d:] += diag * x[:-d]
+    return y
+
+def banded_to_dense(ab):
+    """Matriz densa simetrica a partir de la banda superior (para verificacion)"""
+    u, n = ab.shape[0] - 1, ab.shape[1]
+    K = np.zeros((n, n))
+    for d in range(u + 1):
+        idx = np.arange(n - d)
+        K[idx, idx + d] = K[idx + d, idx] = ab[u - d, d:]
+    return K
+
+def constrain_banded(ab, fixed_dofs):
+    """Copia de la banda con los DOF fijos eliminados (fila/columna 0, diagonal 1)"""
+    ab = ab.copy()
+    u, n = ab.shape[0] - 1, ab.shape[1]
+    fixed = np.asarray(fixed_dofs, dtype=np.int64)
+
+    # Columna j fija: ab[:, j]; fila i fija: ab[u + i - j, j] con j = i..i+u
+    ab[:, fixed] = 0.0
+    offsets = np.arange(1, u + 1)
+    j = fixed[:, None] + offsets
+    valid = j < n
+    ab[np.broadcast_to(u - offsets, j.shape)[valid], j[valid]] = 0.0
+    ab[u, fixed] = 1.0
+    return ab
+
+class BandedSolver:
+    """Cholesky en banda de K con apoyos eliminados, reutilizable para muchos casos
+
+    Equivale a scipy.linalg.solveh_banded, pero guarda el factor
+    (cholesky_banded) para resolver casos de carga posteriores sin volver a
+    factorizar.
+    """
+
+    def __init__(self, ab, fixed_dofs):
+        self.ab = ab
+        self.fixed = np.unique(np.asarray(fixed_dofs, dtype=np.int64))
+        self.bandwidth = ab.shape[0] - 1
+        self._factor = cholesky_banded(constrain_banded(ab, self.fixed))
+
+    def solve(self, F):
+        """Desplazamientos U (num_dof,) o (num_dof, n_cases) con U = 0 en los apoyos"""
+        F = np.array(F, dtype=float)
+        F[self.fixed] = 0.0
+        return cho_solve_banded((self._factor, False), F)
+
+    def reactions(self, U, F):
+        """Reacciones en los DOF fijos: R_c = (K u)_c - F_c"""
+        return banded_matvec(self.ab, U)[self.fixed] - np.asarray(F, dtype=float)[self.fixed]
@@ -0,0 +1,66 @@
+"""
+hermite.py - Elemento rectangular de placa de Hermite (16 DOF, Bogner-Fox-Schmit)
+
+Funciones de forma con la notacion de Calcpad (Rectangular Slab FEA):
+productos Phi_a(xi) * Phi_b(eta) de polinomios cubicos de Hermite, con
+xi = x/a_e, eta = y/b_e en [0, 1].
+
+Orden de DOF por elemento:
+    [w1, tx1, ty1, psi1, w2, tx2, ty2, psi2, w3, tx3, ty3, psi3, w4, tx4, ty4, psi4]
+"""
+
+import numpy as np
+
+# Polinomio de Hermite (en x y en y) que usa cada uno de los 16 DOF
+HERMITE_A = np.array([0, 1, 0, 1, 2, 3, 2, 3, 2, 3, 2, 3, 0, 1, 0, 1])
+HERMITE_B = np.array([0, 0, 1, 1, 0, 0, 1, 1, 2, 2, 3, 3, 2, 2, 3, 3])
+
+def hermite_1d(s, h):
+    """Polinomios de Hermite Phi_1..4 y sus derivadas respecto a x = s*h
+
+    s: (nq,) coordenadas en [0, 1]
+    h: longitud del elemento (escalar o (n_elem,) para un lote)
+
+    Retorna (phi, dphi, ddphi), cada uno de forma (..., nq, 4).
+    """
+    s = np.asarray(s, dtype=float)
+    h = np.asarray(h, dtype=float)[..., None]
+
+    phi = np.stack(np.broadcast_arrays(
+        1 - s**2 * (3 - 2*s),
+        s * h * (1 - s*(2 - s)),
+        s**2 * (3 - 2*s),
+        s**2 * h * (-1 + s),
+    ), axis=-1)
+
+    dphi = np.stack(np.broadcast_arrays(
+        -6 * (s/h) * (1 - s),
+        1 - s*(4 - 3*s),
+        6 * (s/h) * (1 - s),
+        -s * (2 - 3*s),
+    ), axis=-1)
+
+    ddphi = np.stack(np.broadcast_arrays(
+        -(6/h**2) * (1 - 2*s),
+        -(2/h) * (2 - 3*s),
+        (6/h**2) * (1 - 2*s),
+        -(2/h) * (1 - 3*s),
+    ), axis=-1)
+
+    return phi, dphi, ddphi
+
+def shape_tables(xi, eta, a_e, b_e):
+    """Tablas N (..., nq, 16) y B (..., nq, 3, 16) en los puntos (xi, eta)
+
+    Filas de B: d2w/dx2, d2w/dy2, 2*d2w/dxdy
+    """
+    phi_a, dphi_a, ddphi_a = (f[..., HERMITE_A] for f in hermite_1d(xi, a_e))
+    phi_b, dphi_b, ddphi_b = (f[..., HERMITE_B] for f in hermite_1d(eta, b_e))
+
+    N = phi_a * phi_b
+    B = np.stack([
+        ddphi_a * phi_b,
+        phi_a * ddphi_b,
+        2 * dphi_a * dphi_b,
+    ], axis=-2)
+    return N, B
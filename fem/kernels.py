@@ -0,0 +1,167 @@
+"""
+kernels.py - Registro de kernels de elemento en lote
+
+Un ElementKernel agrupa las funciones en lote de un tipo de elemento, todas
+sobre coordenadas (n_elem, n_nodos, 2) y un dict de material
+{"E", "nu", "t", "rho"}:
+
+    stiffness(coords, material)            -> (n_elem, m, m)
+    mass(coords, material, lumped)         -> (n_elem, m, m)
+    resultants(coords, material, u_e)      -> (n_elem, nq, n_comp)
+
+y la matriz de extrapolacion (n_nodos, nq) de los puntos de resultantes a
+los nodos. Kernels incluidos:
+
+    tri3-mindlin   triangulo de plate_fem_example.py   [w, theta_x, theta_y]
+    tri3-dkt       triangulo DKT                        [w, theta_x, theta_y]
+    quad4-dkq      cuadrilatero DKQ                     [w, theta_x, theta_y]
+    rect4-hermite  rectangulo de Hermite (16 DOF)       [w, theta_x, theta_y, psi]
+
+Otros elementos se agregan con register_kernel.
+"""
+
+import numpy as np
+
+from . import mindlin_tri
+from .dkq import (plate_bending_D, dkq_stiffness, dkq_B_matrices, quad_bilinear_functions,
+                  dkt_stiffness, dkt_B_matrices, DKT_POINTS)
+from .hermite import shape_tables
+from .mass import tri_mass_matrices, quad_mass_matrices, hermite_mass_matrices
+from .quadrature import tensor_gauss, integrate_stiffness
+from .recovery import extrapolation_matrix
+
+class ElementKernel:
+    """Funciones en lote de un tipo de elemento"""
+
+    def __init__(self, name, nodes_per_element, dof_per_node, stiffness,
+                 mass=None, resultants=None, resultant_names=(), extrapolation=None):
+        self.name = name
+        self.nodes_per_element = nodes_per_element
+        self.dof_per_node = dof_per_node
+        self.stiffness = stiffness
+        self.mass = mass
+        self.resultants = resultants
+        self.resultant_names = tuple(resultant_names)
+        self.extrapolation = extrapolation
+
+    def __repr__(self):
+        return f"ElementKernel({self.name!r}, {self.nodes_per_element} nodos, {self.dof_per_node} DOF/nodo)"
+
+_kernels = {}
+
+def register_kernel(kernel):
+    """Registra (o reemplaza) un kernel por su nombre"""
+    _kernels[kernel.name] = kernel
+    return kernel
+
+def get_kernel(name):
+    try:
+        return _kernels[name]
+    except KeyError:
+        raise ValueError(f"Kernel de elemento desconocido {name!r}; disponibles: {sorted(_kernels)}") from None
+
+def available_kernels():
+    return sorted(_kernels)
+
+# ============================================================
+# tri3-mindlin
+# ============================================================
+def _tri3_mindlin_resultants(coords, material, u_e):
+    """Mx, My, Mxy, Qx, Qy en el centroide (curvatura y cortante constantes)"""
+    Bb, _ = mindlin_tri.get_bending_B_matrices(coords)
+    Bs, _ = mindlin_tri.get_shear_B_matrices(coords)
+    Db, Ds = mindlin_tri.plate_constitutive(material["E"], material["nu"], material["t"])
+
+    D = np.zeros((5, 5))
+    D[:3, :3] = Db
+    D[3:, 3:] = Ds
+    B = np.concatenate([Bb, Bs], axis=1)
+    return np.einsum('kl,nlj,nj->nk', D, B, u_e, optimize=True)[:, None]
+
+register_kernel(ElementKernel(
+    "tri3-mindlin", 3, 3,
+    stiffness=lambda c, m: mindlin_tri.get_local_stiffness_matrices(c, m["E"], m["nu"], m["t"]),
+    mass=lambda c, m, lumped=False: tri_mass_matrices(c, m["rho"], m["t"], lumped),
+    resultants=_tri3_mindlin_resultants,
+    resultant_names=("Mx", "My", "Mxy", "Qx", "Qy"),
+    extrapolation=extrapolation_matrix(np.full((1, 3), 1.0 / 3.0)),
+))
+
+# ============================================================
+# tri3-dkt
+# ============================================================
+def _tri3_dkt_resultants(coords, material, u_e):
+    """Mx, My, Mxy en los puntos medios de los lados"""
+    B, _ = dkt_B_matrices(coords, DKT_POINTS[:, 0], DKT_POINTS[:, 1])
+    D = plate_bending_D(material["E"], material["nu"], material["t"])
+    return np.einsum('kl,nqlj,nj->nqk', D, B, u_e, optimize=True)
+
+# Funciones lineales [1 - xi - eta, xi, eta] en los puntos medios
+_DKT_N = np.column_stack([1 - DKT_POINTS.sum(axis=1), DKT_POINTS[:, 0], DKT_POINTS[:, 1]])
+
+register_kernel(ElementKernel(
+    "tri3-dkt", 3, 3,
+    stiffness=lambda c, m: dkt_stiffness(c, plate_bending_D(m["E"], m["nu"], m["t"])),
+    mass=lambda c, m, lumped=False: tri_mass_matrices(c, m["rho"], m["t"], lumped),
+    resultants=_tri3_dkt_resultants,
+    resultant_names=("Mx", "My", "Mxy"),
+    extrapolation=extrapolation_matrix(_DKT_N),
+))
+
+# ============================================================
+# quad4-dkq
+# ============================================================
+_Q4_POINTS, _ = tensor_gauss(2, -1.0, 1.0)
+
+def _quad4_dkq_resultants(coords, material, u_e):
+    """Mx, My, Mxy en los 2x2 puntos de Gauss"""
+    B, _ = dkq_B_matrices(coords, _Q4_POINTS[:, 0], _Q4_POINTS[:, 1])
+    D = plate_bending_D(material["E"], material["nu"], material["t"])
+    return np.einsum('kl,nqlj,nj->nqk', D, B, u_e, optimize=True)
+
+register_kernel(ElementKernel(
+    "quad4-dkq", 4, 3,
+    stiffness=lambda c, m: dkq_stiffness(c, plate_bending_D(m["E"], m["nu"], m["t"])),
+    mass=lambda c, m, lumped=False: quad_mass_matrices(c, m["rho"], m["t"], lumped),
+    resultants=_quad4_dkq_resultants,
+    resultant_names=("Mx", "My", "Mxy"),
+    extrapolation=extrapolation_matrix(quad_bilinear_functions(_Q4_POINTS[:, 0], _Q4_POINTS[:, 1])[0]),
+))
+
+# ============================================================
+# rect4-hermite
+# ============================================================
+_H_POINTS, _H_WEIGHTS = tensor_gauss(4)
+_H_RESULTANT_POINTS, _ = tensor_gauss(2)
+
+def _rectangle_sizes(coords):
+    """Dimensiones a_e, b_e de rectangulos alineados con los ejes"""
+    coords = np.asarray(coords, dtype=float)
+    return np.ptp(coords[:, :, 0], axis=1), np.ptp(coords[:, :, 1], axis=1)
+
+def _rect4_hermite_stiffness(coords, material):
+    a_e, b_e = _rectangle_sizes(coords)
+    D = plate_bending_D(material["E"], material["nu"], material["t"])
+    _, B = shape_tables(_H_POINTS[:, 0], _H_POINTS[:, 1], a_e, b_e)
+    return integrate_stiffness(B, D, _H_WEIGHTS * (a_e * b_e)[:, None])
+
+def _rect4_hermite_resultants(coords, material, u_e):
+    """Mx, My, Mxy = -D kappa en los 2x2 puntos de Gauss (convencion de Calcpad)"""
+    a_e, b_e = _rectangle_sizes(coords)
+    D = plate_bending_D(material["E"], material["nu"], material["t"])
+    _, B = shape_tables(_H_RESULTANT_POINTS[:, 0], _H_RESULTANT_POINTS[:, 1], a_e, b_e)
+    return -np.einsum('kl,nqlj,nj->nqk', D, B, u_e, optimize=True)
+
+def _bilinear_unit(points):
+    """Funciones bilineales en [0, 1]^2, nodos (0,0), (1,0), (1,1), (0,1)"""
+    x, y = points[:, 0], points[:, 1]
+    return np.column_stack([(1 - x) * (1 - y), x * (1 - y), x * y, (1 - x) * y])
+
+register_kernel(ElementKernel(
+    "rect4-hermite", 4, 4,
+    stiffness=_rect4_hermite_stiffness,
+    mass=lambda c, m, lumped=False: hermite_mass_matrices(*_rectangle_sizes(c), m["rho"], m["t"], lumped),
+    resultants=_rect4_hermite_resultants,
+    resultant_names=("Mx", "My", "Mxy"),
+    extrapolation=extrapolation_matrix(_bilinear_unit(_H_RESULTANT_POINTS)),
+))
@@ -0,0 +1,95 @@
+"""
+mass.py - Matrices de masa consistentes y concentradas para elementos de placa
+
+Todas las funciones trabajan sobre un lote de elementos y retornan bloques
+(n_elem, m, m) listos para el ensamblaje COO:
+
+    tri_mass_matrices       triangulo de 3 nodos [w, theta_x, theta_y] (plate_fem_example)
+    quad_mass_matrices      cuadrilatero de 4 nodos [w, theta_x, theta_y] (DKQ / Mindlin)
+    hermite_mass_matrices   rectangulo de Hermite de 16 DOF (solo inercia de w)
+
+Masa traslacional rho*t y rotacional rho*t^3/12 (Mindlin). La masa
+concentrada usa el escalado HRZ de la diagonal consistente, que en los
+elementos lineales coincide con la suma por filas.
+"""
+
+import numpy as np
+
+from .quadrature import tensor_gauss, integrate_mass
+from .dkq import quad_bilinear_functions, quad_jacobian
+from .hermite import shape_tables
+
+def hrz_lump(M, translational):
+    """Masa concentrada HRZ: diagonal consistente escalada para conservar la masa total
+
+    M:             (n_elem, m, m) matrices consistentes
+    translational: mascara (m,) de los DOF de traslacion (w)
+    """
+    M = np.asarray(M)
+    translational = np.asarray(translational, dtype=bool)
+
+    diag = np.diagonal(M, axis1=1, axis2=2)
+    total = M[:, translational][:, :, translational].sum(axis=(1, 2))
+    scale = total / diag[:, translational].sum(axis=1)
+
+    lumped = np.zeros_like(M)
+    idx = np.arange(M.shape[1])
+    lumped[:, idx, idx] = diag * scale[:, None]
+    return lumped
+
+def _mindlin_block(NN, rho, t):
+    """Expande integrales de N_i N_j (n, k, k) a la masa Mindlin (n, 3k, 3k)"""
+    n_elem, k, _ = NN.shape
+    inertia = np.array([rho * t, rho * t**3 / 12, rho * t**3 / 12])
+
+    M = np.zeros((n_elem, k, 3, k, 3))
+    dof = np.arange(3)
+    M[:, :, dof, :, dof] = inertia[:, None, None, None] * NN[None]
+    return M.reshape(n_elem, 3 * k, 3 * k)
+
+def _translational_mask(n_nodes):
+    mask = np.zeros(3 * n_nodes, dtype=bool)
+    mask[::3] = True
+    return mask
+
+def tri_mass_matrices(coords, rho, t, lumped=False):
+    """Matrices de masa (n_elem, 9, 9) del triangulo lineal de placa
+
+    Consistente: integral exacta de N_i N_j = A/12 (1 + delta_ij).
+    """
+    coords = np.asarray(coords, dtype=float)
+    d1 = coords[:, 1] - coords[:, 0]
+    d2 = coords[:, 2] - coords[:, 0]
+    A = 0.5 * np.abs(d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0])
+
+    NN = A[:, None, None] / 12 * (np.ones((3, 3)) + np.eye(3))
+    M = _mindlin_block(NN, rho, t)
+    return hrz_lump(M, _translational_mask(3)) if lumped else M
+
+def quad_mass_matrices(coords, rho, t, lumped=False, n_points=2):
+    """Matrices de masa (n_elem, 12, 12) del cuadrilatero de 4 nodos (interpolacion bilineal)"""
+    points, weights = tensor_gauss(n_points, -1.0, 1.0)
+    N, dN = quad_bilinear_functions(points[:, 0], points[:, 1])
+    _, _, det = quad_jacobian(coords, dN)
+
+    NN = integrate_mass(np.broadcast_to(N, det.shape + (4,)), weights * det)
+    M = _mindlin_block(NN, rho, t)
+    return hrz_lump(M, _translational_mask(4)) if lumped else M
+
+def hermite_mass_matrices(a_e, b_e, rho, t, lumped=False, n_points=4):
+    """Matrices de masa (..., 16, 16) del rectangulo de Hermite (inercia de w)
+
+    a_e, b_e: escalares o arreglos (n_elem,) de dimensiones de elemento.
+    """
+    a_e = np.asarray(a_e, dtype=float)
+    b_e = np.asarray(b_e, dtype=float)
+    points, weights = tensor_gauss(n_points)
+    N, _ = shape_tables(points[:, 0], points[:, 1], a_e, b_e)
+
+    M = rho * t * integrate_mass(N, weights * (a_e * b_e)[..., None])
+    if not lumped:
+        return M
+
+    translational = np.zeros(16, dtype=bool)
+    translational[::4] = True
+    return hrz_lump(M.reshape(-1, 16, 16), translational).reshape(M.shape)
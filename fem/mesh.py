@@ -0,0 +1,109 @@
+"""
+mesh.py - Generadores de mallas estructuradas (triangulos y cuadrilateros)
+
+Construye nodos y conectividad con meshgrid / aritmetica de indices, sin
+bucles Python. Dos ordenamientos de nodos y elementos:
+
+    order="x"  x varia mas rapido (plate_fem_example.py, verify_triangle.py)
+    order="y"  y varia mas rapido (Calcpad Rectangular Slab FEA, Hermite)
+
+Los cuadrilateros se numeran en sentido antihorario [n1, n2, n3, n4] y cada
+cuadrilatero se divide en los triangulos [n1, n2, n4] y [n2, n3, n4].
+"""
+
+import numpy as np
+
+def _check_order(order):
+    if order not in ("x", "y"):
+        raise ValueError(f"order debe ser 'x' o 'y', no {order!r}")
+
+def grid_nodes(Lx, Ly, nx, ny, order="x", ndim=2):
+    """Coordenadas de nodos (n_nodes, ndim) de una malla rectangular nx x ny
+
+    ndim=3 agrega la coordenada z = 0.
+    """
+    _check_order(order)
+    dx = Lx / nx
+    dy = Ly / ny
+
+    # Misma aritmetica que los bucles originales: i*dx, j*dy
+    x = np.arange(nx + 1) * dx
+    y = np.arange(ny + 1) * dy
+
+    nodes = np.zeros((nx + 1, ny + 1, ndim)) if order == "y" else np.zeros((ny + 1, nx + 1, ndim))
+    if order == "x":
+        nodes[:, :, 0] = x[None, :]
+        nodes[:, :, 1] = y[:, None]
+    else:
+        nodes[:, :, 0] = x[:, None]
+        nodes[:, :, 1] = y[None, :]
+
+    return nodes.reshape(-1, ndim)
+
+def _first_corner(nx, ny, order, base, dtype):
+    """Nodo inferior izquierdo n1 de cada celda y saltos de indice en x, y"""
+    _check_order(order)
+
+    if order == "x":
+        # Nodo (i, j) -> j*(nx+1) + i; celdas con i variando mas rapido
+        n1 = np.arange(ny, dtype=dtype)[:, None] * (nx + 1) + np.arange(nx, dtype=dtype)[None, :]
+        step_x, step_y = 1, nx + 1
+    else:
+        # Nodo (i, j) -> i*(ny+1) + j; celdas con j variando mas rapido
+        n1 = np.arange(nx, dtype=dtype)[:, None] * (ny + 1) + np.arange(ny, dtype=dtype)[None, :]
+        step_x, step_y = ny + 1, 1
+
+    n1 = n1.ravel()
+    if base:
+        n1 += base
+    return n1, step_x, step_y
+
+def quad_connectivity(nx, ny, order="x", base=0, dtype=np.int64):
+    """Conectividad (nx*ny, 4) de cuadrilateros [n1, n2, n3, n4] antihorarios
+
+    base=1 retorna numeracion base 1 (como Calcpad / Mathcad).
+    """
+    n1, step_x, step_y = _first_corner(nx, ny, order, base, dtype)
+
+    quads = np.empty((n1.size, 4), dtype=dtype)
+    quads[:, 0] = n1
+    np.add(n1, step_x, out=quads[:, 1])
+    np.add(n1, step_x + step_y, out=quads[:, 2])
+    np.add(n1, step_y, out=quads[:, 3])
+    return quads
+
+def tri_connectivity(nx, ny, order="x", base=0, dtype=np.int64):
+    """Conectividad (2*nx*ny, 3): cada cuadrilatero -> [n1, n2, n4], [n2, n3, n4]"""
+    n1, step_x, step_y = _first_corner(nx, ny, order, base, dtype)
+
+    tris = np.empty((n1.size, 2, 3), dtype=dtype)
+    tris[:, 0, 0] = n1
+    np.add(n1, step_x, out=tris[:, 0, 1])
+    np.add(n1, step_y, out=tris[:, 0, 2])
+    tris[:, 1, 0] = tris[:, 0, 1]
+    np.add(n1, step_x + step_y, out=tris[:, 1, 1])
+    tris[:, 1, 2] = tris[:, 0, 2]
+    return tris.reshape(-1, 3)
+
+def rectangular_mesh(Lx, Ly, nx, ny, element="tri", order="x", base=0, ndim=2):
+    """Malla estructurada de un rectangulo Lx x Ly: (nodes, elements)
+
+    element: "tri" (2 triangulos por celda) o "quad"
+    """
+    nodes = grid_nodes(Lx, Ly, nx, ny, order, ndim)
+
+    if element == "tri":
+        elements = tri_connectivity(nx, ny, order, base)
+    elif element == "quad":
+        elements = quad_connectivity(nx, ny, order, base)
+    else:
+        raise ValueError(f"element debe ser 'tri' o 'quad', no {element!r}")
+
+    return nodes, elements
+
+def boundary_nodes(nodes, Lx, Ly, tol=1e-6):
+    """Indices (base 0) de los nodos sobre el contorno del rectangulo"""
+    x = nodes[:, 0]
+    y = nodes[:, 1]
+    on_edge = (np.abs(x) < tol) | (np.abs(x - Lx) < tol) | (np.abs(y) < tol) | (np.abs(y - Ly) < tol)
+    return np.flatnonzero(on_edge)
@@ -0,0 +1,97 @@
+"""
+mindlin_tri.py - Triangulo de placa de 3 nodos (Mindlin-Reissner simplificado) en lote
+
+Kernels de plate_fem_example.py para todos los triangulos a la vez:
+flexion con curvaturas constantes y cortante evaluado en el centroide.
+
+DOF por nodo: [w, theta_x, theta_y]   (9 DOF por elemento)
+"""
+
+import numpy as np
+
+def triangle_geometry(coords):
+    """Area y derivadas (b, c) de todos los triangulos
+
+    coords: arreglo (n_elem, 3, 2) con las coordenadas x, y de los nodos
+    Retorna A (n_elem,), b (n_elem, 3), c (n_elem, 3) y la mascara de
+    elementos validos (A >= 1e-12).
+    """
+    coords = np.asarray(coords, dtype=float)
+    x = coords[:, :, 0]
+    y = coords[:, :, 1]
+
+    # b_i = y_j - y_k, c_i = x_k - x_j (permutacion ciclica i, j, k)
+    b = np.roll(y, -1, axis=1) - np.roll(y, -2, axis=1)
+    c = np.roll(x, -2, axis=1) - np.roll(x, -1, axis=1)
+
+    A = 0.5 * np.abs(x[:, 0] * b[:, 0] + x[:, 1] * b[:, 1] + x[:, 2] * b[:, 2])
+    valid = A >= 1e-12
+
+    return A, b, c, valid
+
+def _inv2A(A, valid):
+    """1/(2A) con cero en los elementos degenerados"""
+    inv2A = np.zeros_like(A)
+    np.divide(1.0, 2.0 * A, out=inv2A, where=valid)
+    return inv2A[:, None]
+
+def plate_constitutive(E, nu, t):
+    """Matrices constitutivas de flexion Db (3, 3) y cortante Ds (2, 2)"""
+    D = E * t**3 / (12.0 * (1.0 - nu**2))
+    Db = D * np.array([
+        [1,   nu,  0],
+        [nu,  1,   0],
+        [0,   0,   (1-nu)/2]
+    ])
+
+    kappa = 5.0 / 6.0
+    G = E / (2.0 * (1.0 + nu))
+    Ds = kappa * G * t * np.eye(2)
+    return Db, Ds
+
+def get_bending_B_matrices(coords):
+    """Matrices Bb (n_elem, 3, 9) de curvatura y areas (con cero en degenerados)"""
+    A, b, c, valid = triangle_geometry(coords)
+    inv2A = _inv2A(A, valid)
+
+    Bb = np.zeros((len(A), 3, 9))
+    Bb[:, 0, 2::3] = b * inv2A      # kappa_x
+    Bb[:, 1, 1::3] = -c * inv2A     # kappa_y
+    Bb[:, 2, 1::3] = -b * inv2A     # torsion
+    Bb[:, 2, 2::3] = c * inv2A
+    return Bb, A * valid
+
+def get_shear_B_matrices(coords):
+    """Matrices Bs (n_elem, 2, 9) de cortante en el centroide y areas"""
+    A, b, c, valid = triangle_geometry(coords)
+    inv2A = _inv2A(A, valid)
+
+    # Funciones de forma en centroide
+    N = 1.0 / 3.0
+
+    Bs = np.zeros((len(A), 2, 9))
+    Bs[:, 0, 0::3] = b * inv2A      # gamma_xz = dw/dx - theta_y
+    Bs[:, 0, 2::3] = -N
+    Bs[:, 1, 0::3] = c * inv2A      # gamma_yz = dw/dy + theta_x
+    Bs[:, 1, 1::3] = N
+    return Bs, A * valid
+
+def get_bending_stiffness_matrices(coords, E, nu, t):
+    """Matrices de rigidez de flexion (n_elem, 9, 9) para todos los triangulos"""
+    Bb, A = get_bending_B_matrices(coords)
+    Db, _ = plate_constitutive(E, nu, t)
+
+    DbB = np.einsum('kl,nlj->nkj', Db, Bb) * A[:, None, None]
+    return np.einsum('nki,nkj->nij', Bb, DbB)
+
+def get_shear_stiffness_matrices(coords, E, nu, t):
+    """Matrices de rigidez de cortante (n_elem, 9, 9) para todos los triangulos"""
+    Bs, A = get_shear_B_matrices(coords)
+    _, Ds = plate_constitutive(E, nu, t)
+
+    return np.einsum('nki,nkj,n->nij', Bs, Bs, Ds[0, 0] * A, optimize=True)
+
+def get_local_stiffness_matrices(coords, E, nu, t):
+    """Matrices de rigidez locales (n_elem, 9, 9) de todos los elementos shell"""
+    return (get_bending_stiffness_matrices(coords, E, nu, t)
+            + get_shear_stiffness_matrices(coords, E, nu, t))
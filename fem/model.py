@@ -0,0 +1,176 @@
+"""
+model.py - Modelo como estructura de arreglos y tuberia ensamblar/resolver/post-procesar
+
+Model guarda todo como arreglos NumPy:
+
+    nodes      (num_nodes, 2|3)           coordenadas
+    elements   (n_elem, nodos_por_elem)   conectividad (base 0)
+    dof_map    (n_elem, m)                DOF globales de cada elemento
+    loads      (num_dof, n_cases)         cargas nodales por caso
+    fixed_dofs (n_fixed,)                 DOF restringidos (ordenados)
+    prescribed {dof: valor}               desplazamientos impuestos
+
+y el tipo de elemento es un ElementKernel de fem.kernels. Las funciones de
+la tuberia (assemble_stiffness, assemble_mass, solve, resultants, analyze)
+trabajan sobre cualquier Model, de modo que los scripts solo describen el
+problema.
+"""
+
+import numpy as np
+
+from .assembly import element_dof_map, assemble_coo, assemble_coo_chunked
+from .kernels import ElementKernel, get_kernel
+from .recovery import element_values, extrapolate_to_nodes, node_element_incidence, nodal_average
+from .solvers import DofElimination, solve_load_cases
+
+class Model:
+    """Malla, material, apoyos y cargas de un modelo FEM como arreglos"""
+
+    def __init__(self, nodes, elements, kernel, material, fixed_dofs=(), loads=None, prescribed=None):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.elements = np.asarray(elements, dtype=np.int64)
+        self.kernel = kernel if isinstance(kernel, ElementKernel) else get_kernel(kernel)
+        self.material = dict(material)
+        self.fixed_dofs = np.unique(np.asarray(fixed_dofs, dtype=np.int64))
+        self.prescribed = dict(prescribed or {})
+
+        if self.elements.shape[1] != self.kernel.nodes_per_element:
+            raise ValueError(f"{self.kernel.name} usa {self.kernel.nodes_per_element} nodos por elemento, "
+                             f"la conectividad tiene {self.elements.shape[1]}")
+
+        if loads is None:
+            self.loads = np.zeros((self.num_dof, 1))
+        else:
+            self.loads = np.asarray(loads, dtype=float).reshape(self.num_dof, -1)
+
+        self._dof_map = None
+
+    @property
+    def num_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def dof_per_node(self):
+        return self.kernel.dof_per_node
+
+    @property
+    def num_dof(self):
+        return self.num_nodes * self.dof_per_node
+
+    @property
+    def num_cases(self):
+        return self.loads.shape[1]
+
+    @property
+    def coords(self):
+        """Coordenadas x, y de los nodos de cada elemento (n_elem, nodos_por_elem, 2)"""
+        return self.nodes[self.elements][:, :, :2]
+
+    @property
+    def dof_map(self):
+        if self._dof_map is None:
+            self._dof_map = element_dof_map(self.elements, self.dof_per_node)
+        return self._dof_map
+
+    def node_dofs(self, node_ids, components=None):
+        """DOF globales de los nodos dados (todas las componentes o las indicadas)"""
+        node_ids = np.asarray(node_ids, dtype=np.int64).reshape(-1, 1)
+        components = np.arange(self.dof_per_node) if components is None else np.atleast_1d(components)
+        return (node_ids * self.dof_per_node + components).ravel()
+
+    def fix(self, node_ids, components=None):
+        """Restringe componentes (todas por defecto) de los nodos dados"""
+        self.fixed_dofs = np.union1d(self.fixed_dofs, self.node_dofs(node_ids, components))
+
+    def add_nodal_loads(self, node_ids, component, values, case=0):
+        """Suma cargas nodales (escalar o una por nodo) en la componente del caso dado"""
+        if case >= self.num_cases:
+            self.loads = np.hstack([self.loads, np.zeros((self.num_dof, case + 1 - self.num_cases))])
+        np.add.at(self.loads[:, case], self.node_dofs(node_ids, component), values)
+
+# ============================================================
+# TUBERIA
+# ============================================================
+def assemble_stiffness(model, cache=None, chunk_size=None, workers=None):
+    """Rigidez global CSR
+
+    Con cache (ElementMatrixCache) solo se calculan geometrias nuevas. Con
+    chunk_size (y sin cache) los bloques se calculan por tramos en un pool
+    de workers hilos (assemble_coo_chunked).
+    """
+    kernel, material = model.kernel, model.material
+    compute = lambda coords: kernel.stiffness(coords, material)
+
+    if cache is None and chunk_size is not None:
+        return assemble_coo_chunked(compute, model.coords, model.dof_map, model.num_dof,
+                                    chunk_size, workers)
+    if cache is None:
+        Ke = compute(model.coords)
+    else:
+        Ke = cache.element_matrices(model.coords, compute, kind=kernel.name,
+                                    material=tuple(material[k] for k in sorted(material)))
+    return assemble_coo(Ke, model.dof_map, model.num_dof)
+
+def assemble_mass(model, lumped=False):
+    """Masa global CSR (consistente o concentrada HRZ)"""
+    if model.kernel.mass is None:
+        raise ValueError(f"El kernel {model.kernel.name} no define matriz de masa")
+    Me = model.kernel.mass(model.coords, model.material, lumped)
+    return assemble_coo(Me, model.dof_map, model.num_dof)
+
+def boundary_conditions(model):
+    """DofElimination de los apoyos y desplazamientos impuestos del modelo"""
+    return DofElimination(model.num_dof, model.fixed_dofs, model.prescribed)
+
+def solve(model, K=None, key=None, method="direct", **options):
+    """Desplazamientos U y reacciones R (num_dof|n_fixed, n_cases) de todos los casos
+
+    Una sola factorizacion para todos los casos; key la guarda en memoria
+    para llamadas posteriores con el mismo modelo. method "cg" o "minres"
+    usa el solver iterativo (options: preconditioner, rtol, maxiter, ...).
+    """
+    if K is None:
+        K = assemble_stiffness(model)
+    bc = boundary_conditions(model)
+    U, R = solve_load_cases(K, model.loads, bc, key, method, dof_per_node=model.dof_per_node, **options)
+    return U, R, bc
+
+def resultants(model, U, incidence=None):
+    """Resultantes en puntos de Gauss, por nodo de elemento y promediados en nodos
+
+    U: (num_dof,) o (num_dof, n_cases). Con varios casos cada arreglo gana
+    un eje final de casos.
+    """
+    kernel = model.kernel
+    if kernel.resultants is None:
+        raise ValueError(f"El kernel {kernel.name} no define esfuerzos resultantes")
+
+    U = np.asarray(U)
+    if incidence is None:
+        incidence = node_element_incidence(model.elements, model.num_nodes)
+
+    u_cases = U[:, None] if U.ndim == 1 else U
+    gauss, at_nodes, nodal = [], [], []
+    for u in u_cases.T:
+        g = kernel.resultants(model.coords, model.material, element_values(u, model.dof_map))
+        a = extrapolate_to_nodes(g, kernel.extrapolation)
+        gauss.append(g)
+        at_nodes.append(a)
+        nodal.append(nodal_average(a, incidence))
+
+    stack = (lambda arrs: arrs[0]) if U.ndim == 1 else (lambda arrs: np.stack(arrs, axis=-1))
+    return {
+        "names": kernel.resultant_names,
+        "gauss": stack(gauss),
+        "element_nodes": stack(at_nodes),
+        "nodal": stack(nodal),
+    }
+
+def analyze(model, cache=None, key=None, chunk_size=None, workers=None):
+    """Tuberia completa: ensamblaje, solucion de todos los casos y resultantes"""
+    K = assemble_stiffness(model, cache, chunk_size, workers)
+    U, R, bc = solve(model, K, key)
+    results = {"K": K, "U": U, "R": R, "bc": bc}
+    if model.kernel.resultants is not None:
+        results["resultants"] = resultants(model, U)
+    return results
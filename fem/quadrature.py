@@ -0,0 +1,85 @@
+"""
+quadrature.py - Cuadratura de Gauss-Legendre precalculada y matrices de elemento por einsum
+
+Los puntos y pesos se calculan una sola vez por orden (lru_cache) y se
+devuelven como arreglos de solo lectura. Las tablas de funciones de forma y
+sus derivadas se evaluan una vez sobre todos los puntos, y las matrices de
+elemento se forman con un unico einsum:
+
+    K = sum_q w_q * B_q^T D B_q        (rigidez)
+    M = sum_q w_q * N_q^T N_q          (masa)
+    F = sum_q w_q * N_q * q            (carga distribuida)
+
+Los pesos pueden incluir el Jacobiano (por ejemplo a_e*b_e) y tener forma
+(..., nq) para integrar un lote de elementos a la vez.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from numpy.polynomial.legendre import leggauss
+
+@lru_cache(maxsize=None)
+def _leggauss(n):
+    points, weights = leggauss(n)
+    points.setflags(write=False)
+    weights.setflags(write=False)
+    return points, weights
+
+def gauss_legendre(n, a=-1.0, b=1.0):
+    """Puntos y pesos de Gauss-Legendre de n puntos en [a, b]
+
+    Exacta para polinomios de grado <= 2n - 1.
+    """
+    if n < 1:
+        raise ValueError(f"El orden de cuadratura debe ser >= 1, no {n}")
+
+    points, weights = _leggauss(n)
+    if (a, b) == (-1.0, 1.0):
+        return points, weights
+
+    # Misma transformacion que los scripts: [-1,1] -> [0,1] es (x + 1)/2, w/2
+    half = (b - a) / 2
+    return a + half * (points + 1), weights * half
+
+@lru_cache(maxsize=None)
+def tensor_gauss(n, a=0.0, b=1.0):
+    """Regla producto n x n en [a, b]^2: (points (n*n, 2), weights (n*n,))
+
+    El primer eje varia mas lento, como en los bucles
+    `for xi in xi_g: for eta in eta_g`.
+    """
+    s, w = gauss_legendre(n, a, b)
+    points = np.empty((n * n, 2))
+    points[:, 0] = np.repeat(s, n)
+    points[:, 1] = np.tile(s, n)
+    weights = np.outer(w, w).ravel()
+
+    points.setflags(write=False)
+    weights.setflags(write=False)
+    return points, weights
+
+def integrate_stiffness(B, D, weights):
+    """Matriz de rigidez sum_q w_q B_q^T D B_q
+
+    B:       (..., nq, n_strain, n_dof) tabla de la matriz B en los puntos
+    D:       (n_strain, n_strain) matriz constitutiva
+    weights: (..., nq) pesos de cuadratura (con Jacobiano incluido)
+    """
+    return np.einsum('...q,...qki,kl,...qlj->...ij', weights, B, D, B, optimize=True)
+
+def integrate_load(N, weights, load=1.0):
+    """Vector de carga sum_q w_q N_q * load
+
+    N:       (..., nq, n_dof) tabla de funciones de forma en los puntos
+    weights: (..., nq) pesos de cuadratura (con Jacobiano incluido)
+    """
+    return np.einsum('...q,...qi->...i', weights, N) * load
+
+def integrate_mass(N, weights, density=1.0):
+    """Matriz de masa sum_q w_q N_q^T N_q * density
+
+    N:       (..., nq, n_dof) tabla de funciones de forma en los puntos
+    weights: (..., nq) pesos de cuadratura (con Jacobiano incluido)
+    """
+    return np.einsum('...q,...qi,...qj->...ij', weights, N, N, optimize=True) * density
@@ -0,0 +1,157 @@
+"""
+quality.py - Metricas de calidad de malla vectorizadas (triangulos y cuadrilateros)
+
+Calcula en una sola pasada, para todos los elementos:
+
+    area          area (positiva)
+    quality       triangulos: 4*sqrt(3)*A / (a^2 + b^2 + c^2)  (1 = equilatero)
+                  cuadrilateros: Jacobiano escalado minimo      (1 = rectangulo)
+    aspect_ratio  triangulos: L_max * perimetro / (4*sqrt(3)*A) (1 = equilatero)
+                  cuadrilateros: L_max / L_min
+    min_angle     angulo interior minimo (grados)
+    jacobian      signo del Jacobiano: +1 antihorario, -1 invertido, 0 degenerado
+"""
+
+import numpy as np
+
+METRICS = ("area", "quality", "aspect_ratio", "min_angle", "jacobian")
+
+def _element_coords(nodes, elements, base=0):
+    """Coordenadas (n_elem, n_nodos, 2) de los elementos"""
+    elements = np.asarray(elements)
+    if base:
+        elements = elements - base
+    return np.asarray(nodes, dtype=float)[elements][:, :, :2]
+
+def _corner_vectors(coords):
+    """Aristas salientes y entrantes en cada vertice, con cross/dot por vertice"""
+    e_next = np.roll(coords, -1, axis=1) - coords    # p[k+1] - p[k]
+    e_prev = np.roll(coords, 1, axis=1) - coords     # p[k-1] - p[k]
+    cross = e_next[..., 0] * e_prev[..., 1] - e_next[..., 1] * e_prev[..., 0]
+    dot = np.einsum('nki,nki->nk', e_next, e_prev)
+    lengths = np.sqrt(np.einsum('nki,nki->nk', e_next, e_next))
+    return e_next, e_prev, cross, dot, lengths
+
+def triangle_quality(coords):
+    """Metricas de calidad de triangulos a partir de coords (n_elem, 3, 2)"""
+    coords = np.asarray(coords, dtype=float)
+    _, _, cross, dot, lengths = _corner_vectors(coords)
+
+    signed_area = 0.5 * cross[:, 0]
+    area = np.abs(signed_area)
+    sum_l2 = np.sum(lengths**2, axis=1)
+    perimeter = np.sum(lengths, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quality = np.where(sum_l2 > 0, 4.0 * np.sqrt(3) * area / sum_l2, 0.0)
+        aspect = np.where(area > 0, lengths.max(axis=1) * perimeter / (4.0 * np.sqrt(3) * area), np.inf)
+
+    angles = np.degrees(np.arctan2(np.abs(cross), dot))
+
+    return {
+        "area": area,
+        "quality": quality,
+        "aspect_ratio": aspect,
+        "min_angle": angles.min(axis=1),
+        "jacobian": np.sign(signed_area).astype(np.int8),
+    }
+
+def quad_quality(coords):
+    """Metricas de calidad de cuadrilateros a partir de coords (n_elem, 4, 2)"""
+    coords = np.asarray(coords, dtype=float)
+    e_next, e_prev, cross, dot, lengths = _corner_vectors(coords)
+
+    # Formula del area de Gauss (shoelace)
+    x = coords[..., 0]
+    y = coords[..., 1]
+    signed_area = 0.5 * np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1)
+
+    prev_lengths = np.sqrt(np.einsum('nki,nki->nk', e_prev, e_prev))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled_jacobian = np.where(lengths * prev_lengths > 0, cross / (lengths * prev_lengths), 0.0)
+        aspect = np.where(lengths.min(axis=1) > 0, lengths.max(axis=1) / lengths.min(axis=1), np.inf)
+
+    # Angulo interior en (0, 360): los vertices reentrantes superan 180
+    angles = np.degrees(np.mod(np.arctan2(cross, dot), 2.0 * np.pi))
+
+    # Jacobiano en las 4 esquinas: todas positivas -> +1, alguna negativa -> -1
+    jacobian = np.where(np.all(cross > 0, axis=1), 1, np.where(np.any(cross < 0, axis=1), -1, 0))
+
+    return {
+        "area": np.abs(signed_area),
+        "quality": scaled_jacobian.min(axis=1),
+        "aspect_ratio": aspect,
+        "min_angle": angles.min(axis=1),
+        "jacobian": jacobian.astype(np.int8),
+    }
+
+def mesh_quality(nodes, elements, base=0):
+    """Metricas de calidad de todos los elementos (triangulos o cuadrilateros)"""
+    coords = _element_coords(nodes, elements, base)
+    n_vertices = coords.shape[1]
+
+    if n_vertices == 3:
+        return triangle_quality(coords)
+    if n_vertices == 4:
+        return quad_quality(coords)
+    raise ValueError(f"Elementos de {n_vertices} nodos no soportados (solo 3 o 4)")
+
+def quality_summary(metrics, worst=10, bins=10):
+    """Resumen estadistico, histograma de calidad y lista de peores elementos"""
+    quality = metrics["quality"]
+    summary = {
+        "n_elements": len(quality),
+        "inverted": int(np.count_nonzero(metrics["jacobian"] < 0)),
+        "degenerate": int(np.count_nonzero(metrics["jacobian"] == 0)),
+    }
+
+    for name in METRICS[:-1]:
+        values = metrics[name]
+        finite = values[np.isfinite(values)]
+        summary[name] = {
+            "min": float(finite.min()) if finite.size else np.nan,
+            "mean": float(finite.mean()) if finite.size else np.nan,
+            "max": float(finite.max()) if finite.size else np.nan,
+        }
+
+    counts, edges = np.histogram(np.clip(quality, 0.0, 1.0), bins=bins, range=(0.0, 1.0))
+    summary["histogram"] = (counts, edges)
+
+    # Peores elementos por calidad, con los invertidos primero
+    # (argpartition evita ordenar toda la malla)
+    rank = np.where(metrics["jacobian"] < 0, -np.abs(quality), quality)
+    k = min(worst, len(quality))
+    if k:
+        idx = np.argpartition(rank, k - 1)[:k]
+        summary["worst"] = idx[np.argsort(rank[idx])]
+    else:
+        summary["worst"] = np.array([], dtype=np.int64)
+
+    return summary
+
+def format_quality_report(metrics, summary=None, base=0):
+    """Reporte de texto de la calidad de malla (numeracion de elementos en base `base`)"""
+    summary = summary or quality_summary(metrics)
+    lines = [
+        f"Elementos: {summary['n_elements']}  "
+        f"(invertidos: {summary['inverted']}, degenerados: {summary['degenerate']})",
+        "",
+        f"{'Metrica':>14} {'Min':>12} {'Media':>12} {'Max':>12}",
+    ]
+    for name in METRICS[:-1]:
+        s = summary[name]
+        lines.append(f"{name:>14} {s['min']:12.6g} {s['mean']:12.6g} {s['max']:12.6g}")
+
+    counts, edges = summary["histogram"]
+    total = max(summary["n_elements"], 1)
+    lines += ["", "Histograma de calidad:"]
+    for count, lo, hi in zip(counts, edges[:-1], edges[1:]):
+        bar = "#" * int(round(40 * count / total))
+        lines.append(f"  [{lo:4.2f}, {hi:4.2f}) {count:10d} {bar}")
+
+    lines += ["", "Peores elementos:", f"{'Elem':>10} {'Calidad':>10} {'Aspecto':>10} {'Ang min':>10} {'Jac':>4}"]
+    for e in summary["worst"]:
+        lines.append(f"{e + base:10d} {metrics['quality'][e]:10.4f} {metrics['aspect_ratio'][e]:10.4g} "
+                     f"{metrics['min_angle'][e]:10.3f} {metrics['jacobian'][e]:4d}")
+
+    return "\n".join(lines)
@@ -0,0 +1,69 @@
+"""
+recovery.py - Recuperacion vectorizada de esfuerzos resultantes y promedio nodal
+
+Flujo para todos los elementos a la vez:
+
+    1. u_e = U[dofs]                                (n_elem, n_dof_e)
+    2. valores en puntos de Gauss: D B_q u_e        (n_elem, nq, n_comp)
+    3. extrapolacion a los nodos del elemento       (n_elem, n_nodos, n_comp)
+    4. promedio nodal con la matriz de incidencia   (num_nodes, n_comp)
+
+La matriz de incidencia nodo-elemento se precalcula una vez por malla (CSR
+con pesos 1/valencia), de modo que el promedio es un solo producto
+disperso. Los valores por nodo de elemento (sin promediar) tienen la misma
+forma que la salida AreaForceShell de SAP2000 (un registro por elemento y
+nodo).
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+def element_values(U, dofs):
+    """Desplazamientos de elemento (n_elem, n_dof_e) [, n_cases] a partir del vector global"""
+    return np.asarray(U)[np.asarray(dofs)]
+
+def gauss_resultants(B, D, u_e):
+    """Resultantes D B_q u_e en los puntos de Gauss
+
+    B:   (n_elem, nq, n_comp, n_dof_e) o (n_elem, n_comp, n_dof_e) (un punto)
+    D:   (n_comp, n_comp)
+    u_e: (n_elem, n_dof_e)
+    Retorna (n_elem, nq, n_comp); con un punto nq = 1.
+    """
+    B = np.asarray(B)
+    if B.ndim == 3:
+        B = B[:, None]
+    return np.einsum('kl,nqlj,nj->nqk', D, B, u_e, optimize=True)
+
+def extrapolation_matrix(N_gauss):
+    """Matriz (n_nodos, nq) que lleva valores de Gauss a los nodos del elemento
+
+    N_gauss: (nq, n_nodos) funciones de forma (de la interpolacion de
+    esfuerzos) en los puntos de Gauss. Con nq = n_nodos es la inversa
+    (p. ej. 2x2 Gauss en cuadrilateros); con un punto da el valor constante.
+    """
+    return np.linalg.pinv(np.asarray(N_gauss, dtype=float))
+
+def extrapolate_to_nodes(values, extrapolation):
+    """Valores (n_elem, nq, n_comp) -> (n_elem, n_nodos, n_comp)"""
+    return np.einsum('aq,nqk->nak', extrapolation, values)
+
+def node_element_incidence(elements, num_nodes):
+    """Matriz CSR (num_nodes, n_elem*n_nodos) de promedio nodal
+
+    Cada columna es un nodo de elemento (en el orden de elements.ravel()) y
+    cada fila suma 1: el producto con los valores por nodo de elemento da el
+    promedio simple sobre los elementos que comparten el nodo.
+    """
+    elements = np.asarray(elements)
+    rows = elements.ravel()
+    cols = np.arange(rows.size)
+
+    valence = np.bincount(rows, minlength=num_nodes).astype(float)
+    weights = 1.0 / valence[rows]
+    return csr_matrix((weights, (rows, cols)), shape=(num_nodes, rows.size))
+
+def nodal_average(element_node_values, incidence):
+    """Promedio nodal (num_nodes, n_comp) de valores (n_elem, n_nodos, n_comp)"""
+    values = np.asarray(element_node_values)
+    return incidence @ values.reshape(-1, values.shape[-1])
@@ -0,0 +1,98 @@
+"""
+renumber.py - Renumeracion de nodos para reducir el ancho de banda (Cuthill-McKee inverso)
+
+Los scripts numeran los DOF como node*dof_per_node + k en el orden de
+generacion de la malla. NodeRenumbering calcula una permutacion RCM sobre el
+grafo de adyacencia de nodos, la aplica antes del ensamblaje y la revierte al
+entregar resultados, de modo que el resto del script sigue usando la
+numeracion original.
+"""
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+def node_adjacency(elements, num_nodes):
+    """Grafo de adyacencia nodo-nodo (CSR simetrico) de la conectividad"""
+    elements = np.asarray(elements)
+    n_elem, n_per_elem = elements.shape
+
+    rows = np.repeat(elements, n_per_elem, axis=1).ravel()
+    cols = np.tile(elements, (1, n_per_elem)).ravel()
+    data = np.ones(rows.size, dtype=np.int8)
+
+    adj = coo_matrix((data, (rows, cols)), shape=(num_nodes, num_nodes)).tocsr()
+    adj.data[:] = 1
+    return adj
+
+def bandwidth_profile(A):
+    """Semi-ancho de banda y perfil (envolvente) de una matriz dispersa simetrica
+
+    bandwidth = max |i - j| sobre los no nulos
+    profile   = suma por fila de (i - columna minima de la fila)
+    """
+    A = csr_matrix(A)
+    if A.nnz == 0:
+        return 0, 0
+
+    rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    bandwidth = int(np.max(np.abs(rows - A.indices)))
+
+    # Columna minima por fila (solo filas no vacias)
+    nonempty = np.flatnonzero(np.diff(A.indptr))
+    first_col = np.minimum.reduceat(A.indices, A.indptr[nonempty])
+    profile = int(np.sum(np.maximum(nonempty - first_col, 0)))
+
+    return bandwidth, profile
+
+class NodeRenumbering:
+    """Permutacion de nodos y su aplicacion a mallas, DOF y resultados
+
+    perm[k]    = nodo original que ocupa la posicion nueva k
+    inverse[n] = numero nuevo del nodo original n
+    """
+
+    def __init__(self, perm):
+        self.perm = np.asarray(perm, dtype=np.int64)
+        self.inverse = np.empty_like(self.perm)
+        self.inverse[self.perm] = np.arange(len(self.perm))
+
+    @classmethod
+    def rcm(cls, elements, num_nodes):
+        """Renumeracion por Cuthill-McKee inverso del grafo de nodos"""
+        adj = node_adjacency(elements, num_nodes)
+        return cls(reverse_cuthill_mckee(adj, symmetric_mode=True))
+
+    @classmethod
+    def identity(cls, num_nodes):
+        return cls(np.arange(num_nodes))
+
+    # Malla
+    def nodes(self, nodes):
+        """Coordenadas reordenadas a la numeracion nueva"""
+        return np.asarray(nodes)[self.perm]
+
+    def elements(self, elements):
+        """Conectividad expresada con los numeros nuevos de nodo"""
+        return self.inverse[np.asarray(elements)]
+
+    # DOF
+    def dof_perm(self, dof_per_node):
+        """dof_perm[D] = DOF original del DOF nuevo D"""
+        return (self.perm[:, None] * dof_per_node + np.arange(dof_per_node)).ravel()
+
+    def dofs_to_new(self, dofs, dof_per_node):
+        """Numeros de DOF originales -> nuevos"""
+        dofs = np.asarray(dofs, dtype=np.int64)
+        return self.inverse[dofs // dof_per_node] * dof_per_node + dofs % dof_per_node
+
+    def to_new(self, values, dof_per_node):
+        """Vector/matriz indexado por DOF original -> numeracion nueva"""
+        return np.asarray(values)[self.dof_perm(dof_per_node)]
+
+    def to_old(self, values, dof_per_node):
+        """Vector/matriz indexado por DOF nuevo -> numeracion original"""
+        values = np.asarray(values)
+        out = np.empty_like(values)
+        out[self.dof_perm(dof_per_node)] = values
+        return out
@@ -0,0 +1,341 @@
+"""
+s2k.py - Lectura de modelos de texto de SAP2000 (.$2k / .s2k) sin SAP2000
+
+Formato de tablas de base de datos:
+
+    TABLE:  "JOINT COORDINATES"
+       Joint=1   CoordSys=GLOBAL   CoordType=Cartesian   XorR=0   Y=0   Z=0
+       Joint=2   ...   Color=Black   F11Mod=1 _
+            V13Mod=1   WMod=1                   <- continuacion con " _"
+       Item="Company Name"                      <- valores entre comillas
+    (linea en blanco)
+    TABLE:  "CONNECTIVITY - AREA"
+    ...
+    END TABLE DATA
+
+S2KFile indexa los desplazamientos en bytes de cada tabla recorriendo el
+archivo mapeado en memoria con mmap.find (lineas que empiezan con TABLE:)
+y validando cada encabezado candidato con un match de regex. Una tabla se
+lee solo cuando se pide: rows() la recorre como flujo de dicts y table()
+la convierte en columnas NumPy. Abrir la tabla de nodos de un modelo
+grande no lee ni interpreta el resto del archivo. Las etiquetas de nodos
+y areas se leen como textos: "010" es un nombre de SAP2000 distinto de
+"10".
+
+write_model() hace el camino inverso: genera un modelo .$2k completo
+(material, seccion, nodos, areas, apoyos y cargas) a partir de arreglos
+NumPy en una sola escritura, para que SAP2000 lo abra con un unico
+File.OpenFile en lugar de una llamada COM por nodo, area, apoyo y carga.
+
+El formato antiguo de SAP2000 V7 (secciones JOINT / SHELL / LOAD sin
+TABLE:) no esta soportado.
+"""
+
+import mmap
+import re
+
+import numpy as np
+
+_TABLE = re.compile(rb'^TABLE:\s+"([^"]*)"[ \t]*\r?$', re.MULTILINE)
+_FIELD = re.compile(r'([^\s=]+)=("(?:[^"]|"")*"|\S*)')
+
+ENCODING = "latin-1"
+
+def parse_row(line):
+    """Campos Key=Value de una fila logica (las comillas se quitan)"""
+    row = {}
+    for key, value in _FIELD.findall(line):
+        if value.startswith('"') and value.endswith('"') and len(value) >= 2:
+            value = value[1:-1].replace('""', '"')
+        row[key] = value
+    return row
+
+def _logical_lines(lines):
+    """Une las lineas terminadas en ' _' con la siguiente"""
+    pending = ""
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.endswith(" _"):
+            pending += line[:-2] + " "
+            continue
+        yield pending + line
+        pending = ""
+    if pending:
+        yield pending
+
+def _column(values):
+    """Lista de textos -> arreglo int64, float o de texto segun su contenido"""
+    text = np.array(values, dtype=str)
+    for dtype in (np.int64, float):
+        try:
+            return text.astype(dtype)
+        except (ValueError, OverflowError):
+            pass
+    return np.array(values, dtype=object)
+
+def _to_columns(rows, columns=None, text_fields=()):
+    """Filas (dicts) -> {campo: arreglo}; los campos de text_fields quedan como textos"""
+    if columns is None:
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+    return {col: np.array([row.get(col, "") for row in rows], dtype=str) if col in text_fields
+            else _column([row.get(col, "") for row in rows])
+            for col in columns}
+
+def _line_starts(buffer, token, stop):
+    """Posiciones de las lineas de buffer que empiezan con token antes de stop"""
+    if buffer[:len(token)] == token:
+        yield 0
+    pos = buffer.find(b"\n" + token, 0, stop)
+    while pos >= 0:
+        yield pos + 1
+        pos = buffer.find(b"\n" + token, pos + 1, stop)
+
+class S2KFile:
+    """Modelo .$2k con indice de tablas por desplazamiento en bytes y lectura perezosa"""
+
+    def __init__(self, path):
+        self.path = path
+        self.index = self._build_index()
+
+    def _build_index(self):
+        """{nombre: (inicio, fin)} en bytes de las filas de cada tabla"""
+        with open(self.path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:          # archivo vacio
+                return {}
+            with mm:
+                end = mm.find(b"\nEND TABLE DATA")
+                data_end = len(mm) if end < 0 else end + 1
+
+                # mmap.find salta las filas a velocidad de memchr; la regex
+                # solo valida las lineas candidatas
+                matches = (_TABLE.match(mm, pos, data_end) for pos in _line_starts(mm, b"TABLE:", data_end))
+                headers = [(m.group(1).decode(ENCODING), m.start(), m.end()) for m in matches if m]
+
+        # Cada tabla llega hasta el encabezado siguiente (o END TABLE DATA)
+        stops = [start for _, start, _ in headers[1:]] + [data_end]
+        return {name: (end, stop) for (name, _, end), stop in zip(headers, stops)}
+
+    def tables(self):
+        return list(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def _span(self, name):
+        try:
+            return self.index[name]
+        except KeyError:
+            raise ValueError(f"{self.path}: no hay tabla {name!r}; tablas: {sorted(self.index)}") from None
+
+    def rows(self, name):
+        """Filas de la tabla como dicts, leyendo solo su rango de bytes"""
+        start, stop = self._span(name)
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            text = f.read(stop - start).decode(ENCODING)
+
+        for line in _logical_lines(text.splitlines()):
+            if line.strip():
+                yield parse_row(line)
+
+    def table(self, name, columns=None, text_fields=()):
+        """Tabla en columnas {campo: arreglo}; los campos ausentes en una fila quedan como ''
+
+        columns: subconjunto de campos a convertir (por defecto todos, en el
+        orden de aparicion). text_fields: campos que quedan como textos sin
+        convertir a numeros (etiquetas).
+        """
+        return _to_columns(list(self.rows(name)), columns, text_fields)
+
+    def units(self):
+        """Unidades del archivo (CurrUnits de PROGRAM CONTROL), p. ej. 'KN, m, C'"""
+        if "PROGRAM CONTROL" not in self:
+            return None
+        return next(self.rows("PROGRAM CONTROL"), {}).get("CurrUnits")
+
+# ============================================================
+# MALLA
+# ============================================================
+def joint_coordinates(s2k):
+    """Etiquetas (n,) y coordenadas (n, 3) de JOINT COORDINATES"""
+    t = s2k.table("JOINT COORDINATES", ["Joint", "XorR", "Y", "Z"], text_fields=("Joint",))
+    xyz = np.column_stack([t["XorR"], t["Y"], t["Z"]]).astype(float)
+    return t["Joint"], xyz
+
+def area_connectivity(s2k, joint_labels):
+    """Etiquetas (n_area,) y conectividad base 0 (n_area, 4) de CONNECTIVITY - AREA
+
+    Los triangulos tienen -1 en la cuarta columna.
+    """
+    rows = list(s2k.rows("CONNECTIVITY - AREA"))
+    fields = dict.fromkeys(key for row in rows for key in row)
+    joint_cols = sorted((c for c in fields if re.fullmatch(r"Joint\d+", c)), key=lambda c: int(c[5:]))
+    t = _to_columns(rows, ["Area", *joint_cols], text_fields=("Area", *joint_cols))
+
+    position = {label: i for i, label in enumerate(joint_labels)}
+    elements = np.column_stack([[position.get(v, -1) for v in t[c]] for c in joint_cols])
+    return t["Area"], elements.astype(np.int64)
+
+def read_mesh(path):
+    """Nodos (n, 3), conectividad base 0 y etiquetas de nodos y areas de un .$2k"""
+    s2k = S2KFile(path)
+    joints, nodes = joint_coordinates(s2k)
+    areas, elements = area_connectivity(s2k, joints)
+    return {"nodes": nodes, "elements": elements, "joints": joints, "areas": areas, "units": s2k.units()}
+
+# ============================================================
+# ESCRITURA
+# ============================================================
+DOF_NAMES = ("U1", "U2", "U3", "R1", "R2", "R3")
+FORCE_NAMES = ("F1", "F2", "F3", "M1", "M2", "M3")
+
+def format_value(value):
+    """Texto de un valor .$2k: numeros en forma corta exacta, comillas si hay espacios"""
+    if isinstance(value, (bool, np.bool_)):
+        return "Yes" if value else "No"
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, (float, np.floating)):
+        text = repr(float(value))
+        return (text[:-2] if text.endswith(".0") else text).replace("e", "E")
+    text = str(value)
+    if text == "" or any(c.isspace() for c in text) or '"' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _format_column(values, n):
+    """Textos de una columna (None donde la celda se omite)"""
+    if np.ndim(values) == 0:
+        return [format_value(values)] * n
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return [str(v) for v in values.tolist()]
+    return [None if v is None else format_value(v) for v in values.tolist()]
+
+def format_table(name, columns):
+    """Bloque TABLE: de texto a partir de columnas {campo: arreglo o escalar}
+
+    Los escalares se repiten en todas las filas; las celdas None se omiten
+    de su fila (p. ej. Joint4 de un triangulo).
+    """
+    n = max((len(v) for v in columns.values() if np.ndim(v) > 0), default=1)
+    cells = []
+    for key, values in columns.items():
+        if np.ndim(values) > 0 and len(values) != n:
+            raise ValueError(f"Tabla {name!r}: columna {key!r} con {len(values)} filas, se esperaban {n}")
+        cells.append([None if text is None else f"{key}={text}" for text in _format_column(values, n)])
+
+    lines = [f'TABLE:  "{name}"']
+    lines.extend("   " + "   ".join(c for c in row if c is not None) for row in zip(*cells))
+    return "\n".join(lines) + "\n \n"
+
+def model_tables(nodes, elements, material, section="LOSA", shell_type="Plate-Thick",
+                 restraints=None, joint_loads=None, area_loads=None, units="KN, m, C",
+                 joint_labels=None, area_labels=None):
+    """Tablas {nombre: columnas} de un modelo de placa/lamina de SAP2000
+
+    nodes: (n, 2) o (n, 3). elements: (n_elem, 3 o 4) base 0, con -1 en la
+    cuarta columna de los triangulos. material: {"E", "nu", "t"} y
+    opcionalmente "w" (peso especifico), en las unidades dadas.
+    restraints: (n, 6) bool [U1 U2 U3 R1 R2 R3]. joint_loads:
+    {patron: (n, 6) fuerzas F1..M3}. area_loads: {patron: q escalar o
+    (n_elem,)} uniforme en Z global con su signo (negativo hacia abajo).
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    if nodes.ndim != 2 or nodes.shape[1] not in (2, 3):
+        raise ValueError(f"nodes debe ser (n, 2) o (n, 3), no {nodes.shape}")
+    if nodes.shape[1] == 2:
+        nodes = np.column_stack([nodes, np.zeros(len(nodes))])
+    elements = np.asarray(elements, dtype=np.int64)
+    if elements.ndim != 2 or elements.shape[1] not in (3, 4):
+        raise ValueError(f"elements debe ser (n_elem, 3) o (n_elem, 4), no {elements.shape}")
+    if elements.max(initial=-1) >= len(nodes) or (elements[:, :3] < 0).any():
+        raise ValueError("elements contiene indices de nodo fuera de rango")
+
+    n, n_elem = len(nodes), len(elements)
+    joints = np.arange(1, n + 1) if joint_labels is None else np.asarray(joint_labels)
+    areas = np.arange(1, n_elem + 1) if area_labels is None else np.asarray(area_labels)
+    E, nu, t = material["E"], material["nu"], material["t"]
+
+    connectivity = {"Area": areas}
+    for k in range(elements.shape[1]):
+        col = elements[:, k]
+        if (col < 0).any():
+            labels = np.empty(n_elem, dtype=object)
+            labels[col >= 0] = joints[col[col >= 0]]
+            connectivity[f"Joint{k + 1}"] = labels
+        else:
+            connectivity[f"Joint{k + 1}"] = joints[col]
+
+    tables = {
+        "PROGRAM CONTROL": {"ProgramName": "SAP2000", "CurrUnits": units},
+        "ACTIVE DEGREES OF FREEDOM": dict.fromkeys(("UX", "UY", "UZ", "RX", "RY", "RZ"), True),
+        "MATERIAL PROPERTIES 01 - GENERAL": {"Material": "MAT", "Type": "Concrete",
+                                             "SymType": "Isotropic", "TempDepend": False},
+        "MATERIAL PROPERTIES 02 - BASIC MECHANICAL PROPERTIES": {
+            "Material": "MAT", "UnitWeight": float(material.get("w", 0.0)),
+            "E1": float(E), "G12": float(E) / (2 * (1 + nu)), "U12": float(nu), "A1": 0.0},
+        "AREA SECTION PROPERTIES": {"Section": section, "Material": "MAT", "MatAngle": 0,
+                                    "AreaType": "Shell", "Type": shell_type,
+                                    "Thickness": float(t), "BendThick": float(t)},
+        "JOINT COORDINATES": {"Joint": joints, "CoordSys": "GLOBAL", "CoordType": "Cartesian",
+                              "XorR": nodes[:, 0], "Y": nodes[:, 1], "Z": nodes[:, 2]},
+        "CONNECTIVITY - AREA": connectivity,
+        "AREA SECTION ASSIGNMENTS": {"Area": areas, "Section": section, "MatProp": "Default"},
+    }
+
+    if restraints is not None:
+        restraints = np.asarray(restraints, dtype=bool)
+        if restraints.shape != (n, 6):
+            raise ValueError(f"restraints debe ser ({n}, 6), no {restraints.shape}")
+        rows = np.flatnonzero(restraints.any(axis=1))
+        tables["JOINT RESTRAINT ASSIGNMENTS"] = {
+            "Joint": joints[rows], **{d: restraints[rows, k] for k, d in enumerate(DOF_NAMES)}}
+
+    patterns = list(dict.fromkeys([*(joint_loads or {}), *(area_loads or {})]))
+    if patterns:
+        tables["LOAD PATTERN DEFINITIONS"] = {"LoadPat": np.array(patterns, dtype=object),
+                                              "DesignType": "Dead", "SelfWtMult": 0}
+        tables["LOAD CASE DEFINITIONS"] = {"Case": np.array(patterns, dtype=object),
+                                           "Type": "LinStatic", "InitialCond": "Zero", "RunCase": True}
+        tables["CASE - STATIC 1 - LOAD ASSIGNMENTS"] = {
+            "Case": np.array(patterns, dtype=object), "LoadType": "Load pattern",
+            "LoadName": np.array(patterns, dtype=object), "LoadSF": 1}
+
+    if joint_loads:
+        parts = []
+        for pattern, F in joint_loads.items():
+            F = np.asarray(F, dtype=float)
+            if F.shape != (n, 6):
+                raise ValueError(f"joint_loads[{pattern!r}] debe ser ({n}, 6), no {F.shape}")
+            rows = np.flatnonzero(np.any(F != 0.0, axis=1))
+            parts.append((np.full(len(rows), pattern, dtype=object), rows, F[rows]))
+        tables["JOINT LOADS - FORCE"] = {
+            "Joint": joints[np.concatenate([r for _, r, _ in parts])],
+            "LoadPat": np.concatenate([p for p, _, _ in parts]), "CoordSys": "GLOBAL",
+            **{f: np.concatenate([v[:, k] for _, _, v in parts]) for k, f in enumerate(FORCE_NAMES)}}
+
+    if area_loads:
+        q = [np.broadcast_to(np.asarray(v, dtype=float), (n_elem,)) for v in area_loads.values()]
+        tables["AREA LOADS - UNIFORM"] = {
+            "Area": np.tile(areas, len(q)),
+            "LoadPat": np.repeat(np.array(list(area_loads), dtype=object), n_elem),
+            "CoordSys": "GLOBAL", "Dir": "Z", "UnifLoad": np.concatenate(q)}
+    return tables
+
+def write_tables(path, tables):
+    """Escribe las tablas {nombre: columnas} como archivo .$2k en una sola escritura
+
+    Las tablas se escriben en el orden del dict: PROGRAM CONTROL primero y
+    las definiciones (patrones de carga) antes de sus asignaciones, como
+    las arma model_tables.
+    """
+    text = "".join(format_table(name, columns) for name, columns in tables.items())
+    with open(path, "w", encoding=ENCODING) as f:
+        f.write(" \n" + text + "END TABLE DATA\n")
+
+def write_model(path, nodes, elements, material, **options):
+    """Modelo .$2k completo a partir de arreglos (ver model_tables para las opciones)"""
+    write_tables(path, model_tables(nodes, elements, material, **options))
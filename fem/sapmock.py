@@ -0,0 +1,583 @@
+"""
+sapmock.py - SapModel falso para pruebas sin SAP2000 y perfil de llamadas COM
+
+Los scripts sap2000_*.py necesitan SAP2000 en Windows. Este modulo da:
+
+    FakeSapModel      SapModel en memoria con PointObj, AreaObj, PropArea,
+                      PropMaterial, LoadPatterns, LoadCases, Results,
+                      DatabaseTables, Analyze, File y View. La geometria se
+                      crea con las mismas llamadas del API o se abre de un
+                      .$2k (File.OpenFile, via fem.s2k); los resultados salen
+                      de tablas ("Joint Displacements", "Joint Reactions",
+                      "Element Forces - Area Shells") cargadas del .$2k, de
+                      add_table() o de una sesion grabada.
+    InstrumentedProxy Envuelve un SapModel (real o falso) y cuenta y mide
+                      cada llamada por metodo del API ("PointObj.AddCartesian");
+                      opcionalmente graba (metodo, argumentos, resultado) y
+                      responde llamadas desde una grabacion.
+
+Convencion de retorno (la de comtypes): los metodos Get devuelven
+[salidas..., ret] y los Set/Add devuelven el codigo ret (0 = correcto),
+salvo los que tienen argumentos ByRef de salida (AddCartesian -> [Name, ret]).
+
+Analyze.RunAnalysis no resuelve el modelo: marca los casos como
+terminados y los resultados vienen de las tablas.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .s2k import S2KFile, format_value
+
+_VALUE_TYPES = (int, float, complex, str, bytes, bool, list, tuple, dict, type(None), np.ndarray, np.generic)
+
+# ============================================================
+# PERFIL, GRABACION Y REPRODUCCION
+# ============================================================
+class CallProfile:
+    """Numero de llamadas y tiempo acumulado por metodo del API"""
+
+    def __init__(self):
+        self.stats = {}
+
+    def add(self, method, seconds):
+        entry = self.stats.setdefault(method, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    @property
+    def total_calls(self):
+        return sum(count for count, _ in self.stats.values())
+
+    def count(self, method):
+        return self.stats.get(method, [0, 0.0])[0]
+
+    def report(self, top=None):
+        """Tabla de texto ordenada por numero de llamadas"""
+        rows = sorted(self.stats.items(), key=lambda item: (-item[1][0], item[0]))[:top]
+        lines = [f"{'Metodo':<50} {'Llamadas':>9} {'Total ms':>10} {'us/llamada':>11}"]
+        for method, (count, seconds) in rows:
+            lines.append(f"{method:<50} {count:9d} {1e3 * seconds:10.2f} {1e6 * seconds / count:11.1f}")
+        lines.append(f"{'Total':<50} {self.total_calls:9d}")
+        return "\n".join(lines)
+
+def _jsonable(value):
+    """Resultado COM / NumPy -> listas, numeros y textos para JSON"""
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _call_key(method, args):
+    return method + json.dumps(_jsonable(list(args)))
+
+def save_recording(path, calls):
+    """Guarda [(metodo, args, resultado), ...] como JSON lines"""
+    with open(path, "w", encoding="utf-8") as f:
+        for method, args, result in calls:
+            f.write(json.dumps({"method": method, "args": _jsonable(list(args)),
+                                "result": _jsonable(result)}) + "\n")
+
+def load_recording(path):
+    """{clave de llamada: resultado} de una grabacion; la ultima llamada repetida gana"""
+    replay = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                call = json.loads(line)
+                replay[_call_key(call["method"], call["args"])] = call["result"]
+    return replay
+
+class InstrumentedProxy:
+    """Proxy de un SapModel que perfila, graba y reproduce llamadas
+
+    target: SapModel real (comtypes) o FakeSapModel; None para reproducir
+    solo desde la grabacion. profile: CallProfile compartido. recorder:
+    lista donde se agregan (metodo, args, resultado). replay: dict de
+    load_recording(); una llamada grabada con los mismos argumentos se
+    responde sin llamar a target.
+    """
+
+    def __init__(self, target, profile=None, recorder=None, replay=None, prefix=""):
+        self._target = target
+        self._profile = CallProfile() if profile is None else profile
+        self._recorder = recorder
+        self._replay = replay or {}
+        self._prefix = prefix
+        self._children = {}
+        self._recorded_methods = {key[:key.index("[")] for key in self._replay}
+
+    @property
+    def profile(self):
+        return self._profile
+
+    @property
+    def recorder(self):
+        return self._recorder
+
+    def _child(self, name, target):
+        if name not in self._children:
+            self._children[name] = InstrumentedProxy(target, self._profile, self._recorder,
+                                                     self._replay, f"{self._prefix}{name}.")
+        return self._children[name]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = self._prefix + name
+
+        if self._target is None:
+            if method in self._recorded_methods:
+                return self._wrap(method, None)
+            return self._child(name, None)
+
+        attr = getattr(self._target, name)
+        if callable(attr):
+            return self._wrap(method, attr)
+        if isinstance(attr, _VALUE_TYPES):
+            return attr
+        return self._child(name, attr)
+
+    def _wrap(self, method, function):
+        def call(*args):
+            t0 = time.perf_counter()
+            key = _call_key(method, args)
+            if key in self._replay:
+                result = self._replay[key]
+            elif function is None:
+                raise KeyError(f"Llamada no grabada: {method}{list(args)}")
+            else:
+                result = function(*args)
+            self._profile.add(method, time.perf_counter() - t0)
+            if self._recorder is not None:
+                self._recorder.append((method, args, result))
+            return result
+        call.__name__ = method
+        return call
+
+# ============================================================
+# SAPMODEL FALSO
+# ============================================================
+class _Namespace:
+    """Base de los objetos del API: acceso al modelo compartido"""
+
+    def __init__(self, model):
+        self._model = model
+
+def _name_list(names):
+    names = list(names)
+    return [len(names), names, 0]
+
+class _PointObj(_Namespace):
+    def AddCartesian(self, x, y, z, Name="", UserName="", CSys="Global", MergeOff=False, MergeNumber=0):
+        return [self._model._add_point((x, y, z), UserName), 0]
+
+    def Count(self, *_):
+        return len(self._model.points)
+
+    def GetNameList(self, *_):
+        return _name_list(self._model.points)
+
+    def GetCoordCartesian(self, Name, *_):
+        if Name not in self._model.points:
+            return [0.0, 0.0, 0.0, 1]
+        return [*self._model.points[Name], 0]
+
+    def SetRestraint(self, Name, Value, ItemType=0):
+        if Name not in self._model.points:
+            return 1
+        self._model.restraints[Name] = [bool(v) for v in Value]
+        return 0
+
+    def GetRestraint(self, Name, *_):
+        return [self._model.restraints.get(Name, [False] * 6), 0]
+
+    def DeleteRestraint(self, Name, ItemType=0):
+        self._model.restraints.pop(Name, None)
+        return 0
+
+    def SetLoadForce(self, Name, LoadPat, Value, Replace=False, CSys="Global", ItemType=0):
+        loads = self._model.point_loads.setdefault(LoadPat, {})
+        previous = [0.0] * 6 if Replace else loads.get(Name, [0.0] * 6)
+        loads[Name] = [p + float(v) for p, v in zip(previous, Value)]
+        return 0
+
+class _AreaObj(_Namespace):
+    def AddByPoint(self, NumberPoints, Point, Name="", PropName="Default", UserName=""):
+        points = [str(p) for p in list(Point)[:NumberPoints]]
+        if any(p not in self._model.points for p in points):
+            return [list(Point), "", 1]
+        return [list(Point), self._model._add_area(points, PropName, UserName), 0]
+
+    def AddByCoord(self, NumberPoints, X, Y, Z, Name="", PropName="Default", UserName="", CSys="Global"):
+        points = [self._model._add_point(xyz, "", merge=True)
+                  for xyz in zip(list(X)[:NumberPoints], list(Y)[:NumberPoints], list(Z)[:NumberPoints])]
+        return [list(X), list(Y), list(Z), self._model._add_area(points, PropName, UserName), 0]
+
+    def Count(self, *_):
+        return len(self._model.areas)
+
+    def GetNameList(self, *_):
+        return _name_list(self._model.areas)
+
+    def GetPoints(self, Name, *_):
+        points = self._model.areas.get(Name, [])
+        return [len(points), list(points), 0 if points else 1]
+
+    def GetProperty(self, Name, *_):
+        return [self._model.area_props.get(Name, ""), 0]
+
+    def SetLoadUniform(self, Name, LoadPat, Value, Dir, Replace=True, CSys="Global", ItemType=0):
+        loads = self._model.area_loads.setdefault(LoadPat, {})
+        entry = (CSys, int(Dir), float(Value))
+        loads[Name] = [entry] if Replace else loads.get(Name, []) + [entry]
+        return 0
+
+    def GetLoadUniform(self, Name, *_):
+        rows = [(pattern, entry) for pattern, loads in self._model.area_loads.items()
+                for entry in loads.get(Name, [])]
+        return [len(rows), [Name] * len(rows), [p for p, _ in rows], [e[0] for _, e in rows],
+                [e[1] for _, e in rows], [e[2] for _, e in rows], 0]
+
+class _PropArea(_Namespace):
+    def SetShell_1(self, Name, ShellType, IncludeDrillingDOF, MatProp, MatAng, MemThick, BendThick,
+                   Color=-1, Notes="", GUID=""):
+        self._model.shells[Name] = [ShellType, IncludeDrillingDOF, MatProp, MatAng, MemThick, BendThick,
+                                    Color, Notes, GUID]
+        return 0
+
+    def GetShell_1(self, Name, *_):
+        if Name not in self._model.shells:
+            return [0, False, "", 0.0, 0.0, 0.0, -1, "", "", 1]
+        return [*self._model.shells[Name], 0]
+
+    def GetNameList(self, *_):
+        return _name_list(self._model.shells)
+
+class _PropMaterial(_Namespace):
+    def SetMaterial(self, Name, MatType, Color=-1, Notes="", GUID=""):
+        self._model.materials.setdefault(Name, {})["type"] = MatType
+        return 0
+
+    def SetMPIsotropic(self, Name, E, U, A, Temp=0):
+        self._model.materials.setdefault(Name, {}).update(E=E, U=U, A=A)
+        return 0
+
+    def GetMPIsotropic(self, Name, *_):
+        mat = self._model.materials.get(Name)
+        if mat is None or "E" not in mat:
+            return [0.0, 0.0, 0.0, 0.0, 1]
+        return [mat["E"], mat["U"], mat["A"], mat["E"] / (2 * (1 + mat["U"])), 0]
+
+    def GetNameList(self, *_):
+        return _name_list(self._model.materials)
+
+class _LoadPatterns(_Namespace):
+    def Add(self, Name, MyType, SelfWTMultiplier=0, AddAnalysisCase=True):
+        self._model.patterns[Name] = MyType
+        if AddAnalysisCase:
+            self._model.cases.setdefault(Name, "LinStatic")
+        return 0
+
+    def GetNameList(self, *_):
+        return _name_list(self._model.patterns)
+
+class _LoadCases(_Namespace):
+    def GetNameList(self, *_):
+        return _name_list(self._model.cases)
+
+    def Count(self, *_):
+        return len(self._model.cases)
+
+class _ResultsSetup(_Namespace):
+    def DeselectAllCasesAndCombosForOutput(self):
+        self._model.output_cases.clear()
+        return 0
+
+    def SetCaseSelectedForOutput(self, Name, Selected=True):
+        if Selected:
+            self._model.output_cases.add(Name)
+        else:
+            self._model.output_cases.discard(Name)
+        return 0
+
+    def SetComboSelectedForOutput(self, Name, Selected=True):
+        return self.SetCaseSelectedForOutput(Name, Selected)
+
+def _column_getter(table, rows):
+    """col(campo, numerico) -> lista de las filas dadas (0.0 / '' si el campo no esta)"""
+    def col(field, numeric=True):
+        if field not in table:
+            return [0.0] * len(rows) if numeric else [""] * len(rows)
+        values = np.asarray(table[field])[rows]
+        return values.astype(float).tolist() if numeric else values.astype(str).tolist()
+    return col
+
+class _Results(_Namespace):
+    def __init__(self, model):
+        super().__init__(model)
+        self.Setup = _ResultsSetup(model)
+
+    def _rows(self, table_key, field, Name, ItemTypeElm):
+        """Filas de la tabla de resultados para un objeto (0), o todo con grupo/seleccion (2, 3)"""
+        table = self._model.table(table_key)
+        if table is None:
+            return None, np.zeros(0, dtype=int)
+        case = np.asarray(table["OutputCase"]).astype(str)
+        mask = np.isin(case, list(self._model.output_cases))
+        if ItemTypeElm in (0, 1):
+            mask &= np.asarray(table[field]).astype(str) == str(Name)
+        return table, np.flatnonzero(mask)
+
+    def JointDispl(self, Name, ItemTypeElm=0, *_):
+        table, rows = self._rows("Joint Displacements", "Joint", Name, ItemTypeElm)
+        if table is None:
+            return [0, [], [], [], [], [], [], [], [], [], [], [], 1]
+        col = _column_getter(table, rows)
+        values = [col(f) for f in ("U1", "U2", "U3", "R1", "R2", "R3")]
+        joints = col("Joint", False)
+        return [len(rows), joints, joints, col("OutputCase", False), col("StepType", False),
+                col("StepNum"), *values, 0]
+
+    def JointReact(self, Name, ItemTypeElm=0, *_):
+        table, rows = self._rows("Joint Reactions", "Joint", Name, ItemTypeElm)
+        if table is None:
+            return [0, [], [], [], [], [], [], [], [], [], [], [], 1]
+        col = _column_getter(table, rows)
+        values = [col(f) for f in ("F1", "F2", "F3", "M1", "M2", "M3")]
+        joints = col("Joint", False)
+        return [len(rows), joints, joints, col("OutputCase", False), col("StepType", False),
+                col("StepNum"), *values, 0]
+
+    def AreaForceShell(self, Name, ItemTypeElm=0, *_):
+        fields = ("F11", "F22", "F12", "FMax", "FMin", "FAngle", "FVM", "M11", "M22", "M12",
+                  "MMax", "MMin", "MAngle", "V13", "V23", "VMax", "VAngle")
+        table, rows = self._rows("Element Forces - Area Shells", "Area", Name, ItemTypeElm)
+        if table is None:
+            return [0] + [[] for _ in range(6 + len(fields))] + [1]
+        col = _column_getter(table, rows)
+        values = [col(f) for f in fields]
+        return [len(rows), col("Area", False), col("AreaElem", False), col("Joint", False),
+                col("OutputCase", False), col("StepType", False), col("StepNum"), *values, 0]
+
+class _DatabaseTables(_Namespace):
+    def __init__(self, model):
+        super().__init__(model)
+        self.display_cases = None
+
+    def SetLoadCasesSelectedForDisplay(self, Cases):
+        self.display_cases = [str(c) for c in Cases]
+        return 0
+
+    def GetAvailableTables(self, *_):
+        names = [name for name, _ in self._model.tables.values()]
+        return [len(names), names, names, [0] * len(names), 0]
+
+    def GetTableForDisplayArray(self, TableKey, FieldKeyList=None, GroupName="", *_):
+        table = self._model.table(TableKey)
+        if table is None:
+            return [FieldKeyList, 0, [], 0, [], 1]
+        fields = [f for f in (FieldKeyList or table) if f in table]
+        n = len(next(iter(table.values()))) if table else 0
+        rows = np.arange(n)
+        if self.display_cases is not None and "OutputCase" in table:
+            rows = np.flatnonzero(np.isin(np.asarray(table["OutputCase"]).astype(str), self.display_cases))
+        columns = [[format_value(v) for v in np.asarray(table[f])[rows].tolist()] for f in fields]
+        data = [value for row in zip(*columns) for value in row]
+        return [FieldKeyList, 1, fields, len(rows), data, 0]
+
+class _Analyze(_Namespace):
+    def CreateAnalysisModel(self):
+        return 0
+
+    def RunAnalysis(self):
+        self._model.analyzed = True
+        return 0
+
+    def SetRunCaseFlag(self, Name, Run, All=False):
+        return 0
+
+    def GetCaseStatus(self, *_):
+        names = list(self._model.cases)
+        status = [4 if self._model.analyzed else 1] * len(names)
+        return [len(names), names, status, 0]
+
+class _File(_Namespace):
+    def NewBlank(self):
+        self._model.clear()
+        return 0
+
+    def OpenFile(self, FileName):
+        try:
+            self._model.load_s2k(FileName)
+        except (OSError, ValueError):
+            return 1
+        return 0
+
+    def Save(self, FileName=""):
+        if FileName:
+            self._model.filename = str(FileName)
+        return 0
+
+class _View(_Namespace):
+    def RefreshView(self, Window=0, Zoom=True):
+        return 0
+
+class FakeSapModel:
+    """SapModel en memoria con el subconjunto del API que usan los scripts sap2000_*.py
+
+    path: .$2k opcional que se abre al crear el modelo (File.OpenFile).
+    """
+
+    def __init__(self, path=None):
+        self.PointObj = _PointObj(self)
+        self.AreaObj = _AreaObj(self)
+        self.PropArea = _PropArea(self)
+        self.PropMaterial = _PropMaterial(self)
+        self.LoadPatterns = _LoadPatterns(self)
+        self.LoadCases = _LoadCases(self)
+        self.Results = _Results(self)
+        self.DatabaseTables = _DatabaseTables(self)
+        self.Analyze = _Analyze(self)
+        self.File = _File(self)
+        self.View = _View(self)
+        self.units = 6
+        self.locked = False
+        self.clear()
+        if path is not None:
+            self.load_s2k(path)
+
+    def clear(self):
+        self.filename = ""
+        self.points = {}
+        self.restraints = {}
+        self.point_loads = {}
+        self.areas = {}
+        self.area_props = {}
+        self.area_loads = {}
+        self.shells = {}
+        self.materials = {}
+        self.patterns = {}
+        self.cases = {}
+        self.output_cases = set()
+        self.tables = {}
+        self.analyzed = False
+        self._coord_index = {}
+
+    # ------------------------------------------------------------
+    # Geometria
+    # ------------------------------------------------------------
+    @staticmethod
+    def _next_label(existing):
+        """Primer numero libre desde len + 1, como la numeracion automatica de SAP2000"""
+        k = len(existing) + 1
+        while str(k) in existing:
+            k += 1
+        return str(k)
+
+    def _add_point(self, xyz, user_name="", merge=False):
+        xyz = tuple(float(v) for v in xyz)
+        key = tuple(round(v, 6) for v in xyz)
+        if merge and key in self._coord_index:
+            return self._coord_index[key]
+        name = str(user_name) if user_name else self._next_label(self.points)
+        self.points[name] = xyz
+        self._coord_index.setdefault(key, name)
+        return name
+
+    def _add_area(self, points, prop, user_name=""):
+        name = str(user_name) if user_name else self._next_label(self.areas)
+        self.areas[name] = list(points)
+        self.area_props[name] = prop
+        return name
+
+    # ------------------------------------------------------------
+    # Tablas
+    # ------------------------------------------------------------
+    def add_table(self, key, columns):
+        """Agrega o reemplaza una tabla {campo: arreglo o escalar}; la clave no distingue mayusculas"""
+        n = max((len(v) for v in columns.values() if np.ndim(v) > 0), default=1)
+        columns = {f: np.asarray(v) if np.ndim(v) > 0 else np.full(n, v, dtype=object)
+                   for f, v in columns.items()}
+        self.tables[key.casefold()] = (key, columns)
+        if "OutputCase" in columns:
+            for case in np.unique(columns["OutputCase"].astype(str)).tolist():
+                self.cases.setdefault(case, "LinStatic")
+
+    def table(self, key):
+        entry = self.tables.get(key.casefold())
+        return None if entry is None else entry[1]
+
+    def load_s2k(self, path):
+        """Modelo y tablas (tambien las de resultados, si las tiene) desde un .$2k"""
+        s2k = S2KFile(path)
+        self.clear()
+        self.filename = str(Path(path))
+        for name in s2k.tables():
+            self.add_table(name, s2k.table(name))
+
+        joints = self.table("JOINT COORDINATES")
+        if joints is not None:
+            xyz = np.column_stack([joints["XorR"], joints["Y"], joints["Z"]]).astype(float)
+            for label, point in zip(joints["Joint"].astype(str).tolist(), xyz):
+                self._add_point(point, label)
+
+        areas = self.table("CONNECTIVITY - AREA")
+        if areas is not None:
+            joint_cols = sorted((c for c in areas if c.startswith("Joint") and c[5:].isdigit()),
+                                key=lambda c: int(c[5:]))
+            for k, label in enumerate(areas["Area"].astype(str).tolist()):
+                points = [str(areas[c][k]) for c in joint_cols if str(areas[c][k]) != ""]
+                self._add_area(points, "Default", label)
+
+        sections = self.table("AREA SECTION ASSIGNMENTS")
+        if sections is not None:
+            self.area_props.update(zip(sections["Area"].astype(str).tolist(),
+                                       sections["Section"].astype(str).tolist()))
+
+        restraints = self.table("JOINT RESTRAINT ASSIGNMENTS")
+        if restraints is not None:
+            dofs = np.column_stack([restraints[d] == "Yes" for d in ("U1", "U2", "U3", "R1", "R2", "R3")])
+            for label, row in zip(restraints["Joint"].astype(str).tolist(), dofs):
+                self.restraints[label] = row.tolist()
+
+        patterns = self.table("LOAD PATTERN DEFINITIONS")
+        if patterns is not None:
+            self.patterns.update(dict.fromkeys(patterns["LoadPat"].astype(str).tolist(), 0))
+        cases = self.table("LOAD CASE DEFINITIONS")
+        if cases is not None:
+            self.cases.update(zip(cases["Case"].astype(str).tolist(), cases["Type"].astype(str).tolist()))
+
+    # ------------------------------------------------------------
+    # Metodos de SapModel
+    # ------------------------------------------------------------
+    def InitializeNewModel(self, Units=6):
+        self.clear()
+        self.units = Units
+        return 0
+
+    def GetVersion(self):
+        return ["24.1.0 (fake)", 24.1, 0]
+
+    def GetModelFilename(self, IncludePath=True):
+        return self.filename if IncludePath else Path(self.filename).name
+
+    def GetModelIsLocked(self):
+        return self.locked
+
+    def SetModelIsLocked(self, Locked):
+        self.locked = bool(Locked)
+        return 0
+
+    def GetPresentUnits(self):
+        return self.units
+
+    def SetPresentUnits(self, Units):
+        self.units = Units
+        return 0
@@ -0,0 +1,143 @@
+"""
+saptables.py - Resultados de SAP2000 por tablas completas (DatabaseTables) en NumPy
+
+Results.JointDispl / JointReact / AreaForceShell por objeto son una
+llamada COM fuera de proceso por nodo o area. GetTableForDisplayArray
+devuelve la tabla entera en una sola llamada como un arreglo plano de
+textos fila por fila:
+
+    TableData = [fila1_campo1, fila1_campo2, ..., fila2_campo1, ...]
+
+table_columns() lo convierte en columnas tipadas (reshape a
+(n_filas, n_campos)) y keyed_results() reordena los campos numericos en un
+arreglo (n_claves, n_casos, n_campos) por nodo/elemento y caso de carga,
+con NaN donde la combinacion no tiene fila. Los campos de nombres (Joint,
+Area, OutputCase) se dejan como textos: "010" es un nombre de SAP2000
+distinto de "10".
+
+El objeto sap_model solo necesita DatabaseTables.GetTableForDisplayArray
+(y SetLoadCasesSelectedForDisplay si se filtran casos), de modo que las
+funciones se prueban con cualquier objeto local que lo imite.
+"""
+
+import numpy as np
+
+from .s2k import _column
+
+DISPLACEMENT_FIELDS = ("U1", "U2", "U3", "R1", "R2", "R3")
+REACTION_FIELDS = ("F1", "F2", "F3", "M1", "M2", "M3")
+SHELL_FORCE_FIELDS = ("F11", "F22", "F12", "M11", "M22", "M12", "V13", "V23")
+
+def _unpack(result):
+    """(codigo, campos, n_filas, datos) de la salida de GetTableForDisplayArray
+
+    comtypes devuelve los argumentos ByRef y el codigo al final:
+        [FieldKeyList, TableVersion, FieldsKeysIncluded, NumberRecords, TableData, ret]
+    y algunos enlaces devuelven el codigo primero:
+        [ret, TableVersion, FieldsKeysIncluded, NumberRecords, TableData]
+    """
+    result = list(result)
+    if len(result) == 6:
+        _, _, fields, n_records, data, ret = result
+    elif len(result) == 5:
+        ret, _, fields, n_records, data = result
+    else:
+        raise ValueError(f"Salida de GetTableForDisplayArray no reconocida ({len(result)} elementos)")
+    return int(ret), list(fields), int(n_records), data
+
+def table_columns(fields, n_records, data, text_fields=()):
+    """Arreglo plano TableData -> columnas tipadas {campo: arreglo (n_records,)}
+
+    Los campos de text_fields quedan como textos sin convertir.
+    """
+    n_fields = len(fields)
+    if len(data) != n_records * n_fields:
+        raise ValueError(f"TableData tiene {len(data)} valores, se esperaban {n_records} x {n_fields}")
+    rows = np.asarray(data, dtype=object).reshape(n_records, n_fields)
+    return {field: rows[:, k].astype(str) if field in text_fields else _column(rows[:, k])
+            for k, field in enumerate(fields)}
+
+def get_table(sap_model, table_key, fields=None, group="", cases=None, text_fields=()):
+    """Tabla de base de datos completa en una llamada, como columnas tipadas
+
+    fields: campos a pedir (por defecto todos). group: grupo de SAP2000
+    ("" = todo el modelo). cases: casos de carga a mostrar (por defecto los
+    seleccionados en el modelo). text_fields: campos que se dejan como
+    textos (nombres de objetos y casos).
+    """
+    tables = sap_model.DatabaseTables
+    if cases is not None:
+        tables.SetLoadCasesSelectedForDisplay(list(cases))
+
+    ret, names, n_records, data = _unpack(
+        tables.GetTableForDisplayArray(table_key, list(fields or []), group))
+    if ret != 0:
+        raise RuntimeError(f"GetTableForDisplayArray({table_key!r}) devolvio {ret}")
+    return table_columns(names, n_records, data, text_fields)
+
+def _first_occurrence_codes(columns):
+    """Codigo entero por fila para la combinacion de columnas y sus valores unicos
+
+    El orden de las claves es el de primera aparicion (el de SAP2000), no el
+    alfabetico ("10" despues de "9").
+    """
+    inverse = [np.unique(np.asarray(col).astype(str), return_inverse=True)[1] for col in columns]
+    combined = np.column_stack(inverse)
+    _, first, code = np.unique(combined, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[code.ravel()], first[order]
+
+def keyed_results(table, key, fields, case_field="OutputCase"):
+    """Campos numericos por clave y caso: dict con keys, cases, values (n_key, n_case, n_fields)
+
+    key: campo ("Joint") o tupla de campos (("Area", "Joint")) que identifica
+    la fila; conviene leerlos como textos (text_fields de get_table), de lo
+    contrario "010" llega convertido a 10. De las filas repetidas de una
+    misma clave y caso (StepType Max/Min de envolventes) se conserva la
+    ultima de la tabla.
+    """
+    key_fields = (key,) if isinstance(key, str) else tuple(key)
+    missing = [f for f in (*key_fields, case_field, *fields) if f not in table]
+    if missing:
+        raise ValueError(f"Campos ausentes en la tabla: {missing}; campos: {list(table)}")
+
+    key_code, key_rows = _first_occurrence_codes([table[f] for f in key_fields])
+    case_code, case_rows = _first_occurrence_codes([table[case_field]])
+
+    # Ultima fila de cada (clave, caso): la asignacion con indices repetidos
+    # no garantiza cual escribe al final
+    cell = key_code * len(case_rows) + case_code
+    _, from_end = np.unique(cell[::-1], return_index=True)
+    last = len(cell) - 1 - from_end
+
+    values = np.full((len(key_rows), len(case_rows), len(fields)), np.nan)
+    data = np.column_stack([np.asarray(table[f])[last] for f in fields]).astype(float)
+    values[key_code[last], case_code[last]] = data
+
+    keys = np.column_stack([np.asarray(table[f]).astype(str)[key_rows] for f in key_fields])
+    return {
+        "keys": keys[:, 0] if len(key_fields) == 1 else keys,
+        "cases": np.asarray(table[case_field]).astype(str)[case_rows],
+        "fields": list(fields),
+        "values": values,
+    }
+
+def joint_displacements(sap_model, cases=None, group=""):
+    """Desplazamientos de todos los nodos: keys, cases, values (n_joint, n_case, 6) U1..R3"""
+    table = get_table(sap_model, "Joint Displacements", group=group, cases=cases,
+                      text_fields=("Joint", "OutputCase"))
+    return keyed_results(table, "Joint", DISPLACEMENT_FIELDS)
+
+def joint_reactions(sap_model, cases=None, group=""):
+    """Reacciones de los nodos con apoyo: keys, cases, values (n_joint, n_case, 6) F1..M3"""
+    table = get_table(sap_model, "Joint Reactions", group=group, cases=cases,
+                      text_fields=("Joint", "OutputCase"))
+    return keyed_results(table, "Joint", REACTION_FIELDS)
+
+def area_shell_forces(sap_model, cases=None, group=""):
+    """Fuerzas de lamina por (area, nodo): keys (n, 2), cases, values (n, n_case, 8) F11..V23"""
+    table = get_table(sap_model, "Element Forces - Area Shells", group=group, cases=cases,
+                      text_fields=("Area", "Joint", "OutputCase"))
+    return keyed_results(table, ("Area", "Joint"), SHELL_FORCE_FIELDS)
@@ -0,0 +1,340 @@
+"""
+solvers.py - Condiciones de frontera por eliminacion y solver multi-caso
+
+DofElimination reduce K u = F al bloque de DOF libres (sin penalizacion) y
+recupera desplazamientos completos y reacciones. FactorizedSolver factoriza
+K_ff una sola vez (CHOLMOD si esta instalado, si no splu) y resuelve
+bloques de casos de carga; las factorizaciones se guardan por clave en un
+cache LRU en memoria (FACTOR_CACHE_SIZE entradas) para reutilizarlas entre
+llamadas. El cache vive solo dentro del proceso: entre corridas del mismo
+modelo se reutilizan K y los resultados guardados con fem.store, no la
+factorizacion. clear_solver_cache() y invalidate_solver() lo vacian.
+
+Para mallas donde el llenado de la factorizacion no cabe en memoria,
+IterativeSolver resuelve con CG o MINRES precondicionado:
+
+    "jacobi"        inversa de la diagonal
+    "block-jacobi"  inversa de los bloques nodales 3x3 (DOF libres de cada nodo)
+    "ilu"           factorizacion incompleta spilu en modo simetrico (scipy
+                    no tiene Cholesky incompleto)
+
+El precondicionador se construye una vez y se reutiliza en todos los casos
+y pasos de carga; cada solucion arranca desde la anterior (warm start) y
+queda registrada en history (iteraciones, residuo, tiempo).
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from scipy.sparse.linalg import LinearOperator, cg, minres, splu, spilu
+
+# Cholesky disperso (scikit-sparse) es opcional; sin el se usa splu
+try:
+    from sksparse.cholmod import cholesky
+except ImportError:
+    cholesky = None
+
+class DofElimination:
+    """Condiciones de frontera por eliminacion de DOF
+
+    Construye una sola vez los mapas de DOF libres/fijos y reduce el sistema
+    K u = F al bloque libre K_ff u_f = F_f - K_fc u_c, sin penalizacion, de
+    modo que K_ff conserva el condicionamiento original y admite solvers
+    iterativos. Soporta desplazamientos prescritos distintos de cero.
+    """
+
+    def __init__(self, num_dof, fixed_dofs, prescribed=None):
+        """prescribed: dict {dof: valor} de desplazamientos impuestos (se suman a los fijos)"""
+        prescribed = dict(prescribed or {})
+        prescribed_dofs = np.fromiter(prescribed.keys(), dtype=np.int64, count=len(prescribed))
+
+        self.num_dof = num_dof
+        self.fixed = np.union1d(np.asarray(fixed_dofs, dtype=np.int64), prescribed_dofs)
+
+        is_fixed = np.zeros(num_dof, dtype=bool)
+        is_fixed[self.fixed] = True
+        self.free = np.flatnonzero(~is_fixed)
+
+        # Valores prescritos en los DOF fijos (0 por defecto)
+        self.u_fixed = np.zeros(len(self.fixed))
+        self.u_fixed[np.searchsorted(self.fixed, prescribed_dofs)] = list(prescribed.values())
+
+    def reduce(self, K, F):
+        """Sistema reducido (K_ff, F_f) en CSR"""
+        K = csr_matrix(K)
+        K_f = K[self.free]
+        K_ff = K_f[:, self.free]
+
+        F = np.asarray(F, dtype=float)
+        F_f = F[self.free]
+        if np.any(self.u_fixed):
+            K_fc = K_f[:, self.fixed]
+            F_f = F_f - (K_fc @ self.u_fixed).reshape(-1, *([1] * (F.ndim - 1)))
+
+        return K_ff.tocsr(), F_f
+
+    def expand(self, U_f):
+        """Vector de desplazamientos completo a partir de la solucion reducida"""
+        U_f = np.asarray(U_f)
+        U = np.zeros((self.num_dof,) + U_f.shape[1:])
+        U[self.free] = U_f
+        U[self.fixed] = self.u_fixed.reshape(-1, *([1] * (U_f.ndim - 1)))
+        return U
+
+    def reactions(self, K, U, F):
+        """Reacciones en los DOF fijos: R_c = K_c u - F_c"""
+        F = np.asarray(F, dtype=float)
+        return csr_matrix(K)[self.fixed] @ U - F[self.fixed]
+
+class FactorizedSolver:
+    """Factorizacion de la rigidez reducida, reutilizable para muchos casos de carga"""
+
+    def __init__(self, K_ff):
+        if cholesky is not None:
+            self.method = "cholmod"
+            self._factor = cholesky(K_ff.tocsc())
+        else:
+            self.method = "splu"
+            self._factor = splu(K_ff.tocsc())
+
+    def solve(self, B):
+        """Resuelve K_ff X = B para un vector o un bloque (n_free, n_cases)"""
+        if self.method == "cholmod":
+            return self._factor(B)
+        return self._factor.solve(np.asarray(B, dtype=float))
+
+# ============================================================
+# SOLVER ITERATIVO
+# ============================================================
+def jacobi_preconditioner(K):
+    return diags(1.0 / K.diagonal()).tocsr()
+
+def block_jacobi_preconditioner(K, blocks):
+    """Inversa de los bloques diagonales de K como matriz CSR diagonal por bloques
+
+    blocks: (n,) bloque (nodo) de cada DOF, no decreciente. Los bloques
+    incompletos (nodos con DOF eliminados) se rellenan con la identidad.
+    """
+    K = csr_matrix(K)
+    blocks = np.asarray(blocks)
+    _, start, inverse, counts = np.unique(blocks, return_index=True, return_inverse=True,
+                                          return_counts=True)
+    pos = np.arange(len(blocks)) - start[inverse]
+    size = int(counts.max())
+
+    coo = K.tocoo()
+    same = inverse[coo.row] == inverse[coo.col]
+    B = np.zeros((len(counts), size, size))
+    B[inverse[coo.row[same]], pos[coo.row[same]], pos[coo.col[same]]] = coo.data[same]
+    pad = np.arange(size)[None, :] >= counts[:, None]
+    B[:, np.arange(size), np.arange(size)] += pad
+
+    B_inv = np.linalg.inv(B)
+
+    # Solo las posiciones reales de cada bloque
+    dof = np.full((len(counts), size), -1)
+    dof[inverse, pos] = np.arange(len(blocks))
+    valid = (dof[:, :, None] >= 0) & (dof[:, None, :] >= 0)
+    rows = np.broadcast_to(dof[:, :, None], B.shape)[valid]
+    cols = np.broadcast_to(dof[:, None, :], B.shape)[valid]
+    return csr_matrix((B_inv[valid], (rows, cols)), shape=K.shape)
+
+def ilu_preconditioner(K, drop_tol=1e-5, fill_factor=20):
+    """spilu de D^-1/2 K D^-1/2 en modo simetrico (sin pivoteo, orden MMD de K + K^T)
+
+    El escalado iguala las unidades de w y de los giros; sin el y sin
+    SymmetricMode el factor incompleto pierde la simetria y CG diverge.
+    """
+    scale = 1.0 / np.sqrt(K.diagonal())
+    A = (diags(scale) @ csr_matrix(K) @ diags(scale)).tocsc()
+    ilu = spilu(A, drop_tol=drop_tol, fill_factor=fill_factor, permc_spec="MMD_AT_PLUS_A",
+                diag_pivot_thresh=0.0, options={"SymmetricMode": True})
+
+    n = K.shape[0]
+    op = LinearOperator((n, n), matvec=lambda x: scale * ilu.solve(scale * x), dtype=float)
+    op.nnz = ilu.L.nnz + ilu.U.nnz
+    return op
+
+class IterativeSolver:
+    """CG / MINRES precondicionado con precondicionador reutilizable y warm start"""
+
+    def __init__(self, K_ff, method="cg", preconditioner="block-jacobi", blocks=None,
+                 rtol=1e-8, maxiter=None, warm_start=True, **options):
+        """blocks: nodo de cada DOF libre para "block-jacobi" (por defecto grupos de 3)
+        options: drop_tol, fill_factor de "ilu"
+        """
+        if method not in ("cg", "minres"):
+            raise ValueError(f"method debe ser 'cg' o 'minres', no {method!r}")
+
+        self.K = csr_matrix(K_ff)
+        self.method = method
+        self.preconditioner = preconditioner
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.warm_start = warm_start
+        self.history = []
+        self._last = None
+
+        n = self.K.shape[0]
+        t0 = time.perf_counter()
+        if preconditioner is None:
+            self.M = None
+        elif preconditioner == "jacobi":
+            self.M = jacobi_preconditioner(self.K)
+        elif preconditioner == "block-jacobi":
+            self.M = block_jacobi_preconditioner(self.K, np.arange(n) // 3 if blocks is None else blocks)
+        elif preconditioner == "ilu":
+            self.M = ilu_preconditioner(self.K, **options)
+        else:
+            raise ValueError(f"Precondicionador desconocido {preconditioner!r}; "
+                             "use None, 'jacobi', 'block-jacobi' o 'ilu'")
+        self.setup_time = time.perf_counter() - t0
+
+    def solve(self, B, x0=None):
+        """Resuelve K_ff X = B para un vector o un bloque (n_free, n_cases), columna a columna"""
+        B = np.asarray(B, dtype=float)
+        if B.ndim == 1:
+            return self._solve_one(B, x0)
+
+        X = np.empty_like(B)
+        for j in range(B.shape[1]):
+            X[:, j] = self._solve_one(B[:, j], None if x0 is None else np.asarray(x0)[:, j])
+        return X
+
+    def _solve_one(self, b, x0):
+        if x0 is None and self.warm_start and self._last is not None:
+            x0 = self._last
+
+        iterations = [0]
+        def callback(*args):
+            iterations[0] += 1
+
+        krylov = cg if self.method == "cg" else minres
+        t0 = time.perf_counter()
+        x, info = krylov(self.K, b, x0=x0, rtol=self.rtol, maxiter=self.maxiter, M=self.M,
+                         callback=callback)
+        elapsed = time.perf_counter() - t0
+
+        b_norm = np.linalg.norm(b)
+        residual = np.linalg.norm(b - self.K @ x) / b_norm if b_norm > 0 else 0.0
+        self.history.append({
+            "iterations": iterations[0],
+            "residual": residual,
+            "seconds": elapsed,
+            "converged": info == 0,
+            "warm": x0 is not None,
+        })
+        self._last = x
+        return x
+
+    def report(self):
+        if not self.history:
+            return f"{self.method} + {self.preconditioner}: sin soluciones"
+        its = [h["iterations"] for h in self.history]
+        failed = sum(not h["converged"] for h in self.history)
+        text = (f"{self.method} + {self.preconditioner}: {len(its)} soluciones, "
+                f"{sum(its)} iteraciones ({np.mean(its):.1f} por solucion), "
+                f"residuo max {max(h['residual'] for h in self.history):.2e}")
+        return text + (f", {failed} sin converger" if failed else "")
+
+# ============================================================
+# CACHE DE SOLVERS (EN MEMORIA DEL PROCESO)
+# ============================================================
+# Factorizaciones de mallas grandes ocupan cientos de MB: se conservan las
+# FACTOR_CACHE_SIZE usadas mas recientemente
+FACTOR_CACHE_SIZE = 4
+
+# model_hash -> FactorizedSolver, (model_hash, method, ...) -> IterativeSolver
+_factor_cache = OrderedDict()
+
+def _cache_get(key):
+    solver = _factor_cache.get(key)
+    if solver is not None:
+        _factor_cache.move_to_end(key)
+    return solver
+
+def _cache_put(key, solver):
+    _factor_cache[key] = solver
+    _factor_cache.move_to_end(key)
+    while len(_factor_cache) > FACTOR_CACHE_SIZE:
+        _factor_cache.popitem(last=False)
+
+def clear_solver_cache():
+    """Descarta todas las factorizaciones y precondicionadores guardados"""
+    _factor_cache.clear()
+
+def invalidate_solver(key):
+    """Descarta los solvers (directo e iterativos) guardados con key"""
+    for cached in list(_factor_cache):
+        if cached == key or (isinstance(cached, tuple) and cached and cached[0] == key):
+            del _factor_cache[cached]
+
+def get_factorized_solver(K_ff, key=None):
+    """FactorizedSolver para K_ff, reutilizando la del cache si key ya existe"""
+    solver = None if key is None else _cache_get(key)
+    if solver is not None:
+        return solver
+
+    solver = FactorizedSolver(K_ff)
+    if key is not None:
+        _cache_put(key, solver)
+    return solver
+
+def cached_solver(key):
+    """FactorizedSolver guardado con key, o None"""
+    return _factor_cache.get(key)
+
+def get_iterative_solver(K_ff, key=None, method="cg", preconditioner="block-jacobi", **options):
+    """IterativeSolver para K_ff; con key se reutiliza su precondicionador (y su warm start)
+
+    La clave del cache incluye las opciones (rtol, maxiter, warm_start,
+    drop_tol, fill_factor): con opciones distintas se construye otro solver.
+    blocks no entra en la clave porque sale de los DOF libres, que ya
+    forman parte de key.
+    """
+    settings = tuple(sorted((name, value) for name, value in options.items() if name != "blocks"))
+    cache_key = None if key is None else (key, method, preconditioner, settings)
+    solver = None if cache_key is None else _cache_get(cache_key)
+    if solver is not None:
+        return solver
+
+    solver = IterativeSolver(K_ff, method, preconditioner, **options)
+    if cache_key is not None:
+        _cache_put(cache_key, solver)
+    return solver
+
+def solve_load_cases(K, F_cases, bc, key=None, method="direct", preconditioner="block-jacobi",
+                     dof_per_node=3, **options):
+    """Resuelve todos los casos de carga con una sola factorizacion (o un solo precondicionador)
+
+    F_cases: (n_dof,) o (n_dof, n_cases)
+    method: "direct" (FactorizedSolver), "cg" o "minres" (IterativeSolver)
+    Retorna U y las reacciones R con la misma cantidad de columnas.
+    """
+    K_ff, F_f = bc.reduce(K, F_cases)
+    if method == "direct":
+        solver = get_factorized_solver(K_ff, key)
+    else:
+        solver = get_iterative_solver(K_ff, key, method, preconditioner,
+                                      blocks=bc.free // dof_per_node, **options)
+
+    U = bc.expand(solver.solve(F_f))
+    R = bc.reactions(K, U, F_cases)
+    return U, R
+
+def combine_load_cases(results, case_names, combinations):
+    """Combinaciones lineales de resultados por caso
+
+    results: (n, n_cases) desplazamientos o reacciones por caso
+    combinations: dict {nombre: {caso: factor}}
+    Retorna (n, n_combos) en el orden de combinations.
+    """
+    index = {name: i for i, name in enumerate(case_names)}
+    factors = np.zeros((len(case_names), len(combinations)))
+    for j, combo in enumerate(combinations.values()):
+        for case, factor in combo.items():
+            factors[index[case], j] = factor
+
+    return np.asarray(results) @ factors
@@ -0,0 +1,155 @@
+"""
+spatial.py - Indice espacial de nodos con tolerancia (busqueda por coordenadas)
+
+Los scripts de comparacion buscan nodos por coordenadas con recorridos
+lineales (abs(nx - x) < tol sobre todos los nodos, dentro de bucles sobre
+una grilla de x e y): O(n^2) para armar una grilla de resultados. NodeIndex
+construye una vez un cKDTree sobre las coordenadas y responde en lote:
+
+    find(points)        nodo a distancia <= tol de cada punto (-1 si no hay)
+    in_box(lo, hi)      nodos dentro de una caja (ampliada en tol)
+    on_segment(p0, p1)  nodos sobre un segmento, ordenados a lo largo de el
+    on_boundary()       nodos sobre el contorno de la caja envolvente
+    to_grid(values)     valores nodales reordenados en una grilla (ny, nx)
+
+Las coordenadas de la grilla se agrupan con la misma tolerancia
+(cluster_coordinates), de modo que 2.9999999 y 3.0 son una sola columna.
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+def cluster_coordinates(values, tol):
+    """Valores distintos (a mas de tol) ordenados y el indice de cada valor original
+
+    Retorna (centers, inverse) con centers[inverse] ~= values.
+    """
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    new_group = np.concatenate([[True], np.diff(sorted_values) > tol])
+    group = np.cumsum(new_group) - 1
+
+    inverse = np.empty(len(values), dtype=np.int64)
+    inverse[order] = group
+    counts = np.bincount(group)
+    centers = np.bincount(group, weights=sorted_values) / counts
+    return centers, inverse
+
+class NodeIndex:
+    """Indice de nodos (n, 2) o (n, 3) con tolerancia para busquedas por coordenadas
+
+    labels: nombres de los nodos (p. ej. los de SAP2000); por defecto los
+    indices base 0.
+    """
+
+    def __init__(self, coords, labels=None, tol=1e-3):
+        coords = np.asarray(coords, dtype=float)
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError(f"coords debe ser (n, 2) o (n, 3), no {coords.shape}")
+        if tol <= 0:
+            raise ValueError(f"tol debe ser positiva, no {tol}")
+        self.coords = coords
+        self.labels = np.arange(len(coords)) if labels is None else np.asarray(labels)
+        if len(self.labels) != len(coords):
+            raise ValueError(f"{len(self.labels)} etiquetas para {len(coords)} nodos")
+        self.tol = tol
+        self.tree = cKDTree(coords)
+
+    @classmethod
+    def from_dict(cls, points, tol=1e-3):
+        """Indice desde {nombre: (x, y[, z])}, como los diccionarios de los scripts de SAP2000"""
+        names = list(points)
+        return cls(np.array([points[name] for name in names], dtype=float), names, tol)
+
+    def __len__(self):
+        return len(self.coords)
+
+    def _points(self, points):
+        points = np.asarray(points, dtype=float)
+        single = points.ndim == 1
+        points = np.atleast_2d(points)
+        if points.shape[1] != self.coords.shape[1]:
+            raise ValueError(f"Los puntos tienen {points.shape[1]} coordenadas, los nodos "
+                             f"{self.coords.shape[1]}")
+        return points, single
+
+    # ------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------
+    def nearest(self, points):
+        """(indice, distancia) del nodo mas cercano a cada punto"""
+        points, single = self._points(points)
+        dist, idx = self.tree.query(points)
+        return (idx[0], dist[0]) if single else (idx, dist)
+
+    def find(self, points):
+        """Indice del nodo a distancia <= tol de cada punto, -1 si no hay ninguno"""
+        points, single = self._points(points)
+        dist, idx = self.tree.query(points, distance_upper_bound=self.tol * (1 + 1e-12))
+        idx = np.where(np.isfinite(dist), idx, -1)
+        return idx[0] if single else idx
+
+    def find_labels(self, points):
+        """Etiqueta del nodo en cada punto (KeyError si algun punto no tiene nodo)"""
+        idx = np.atleast_1d(self.find(points))
+        if (idx < 0).any():
+            missing, _ = self._points(points)
+            raise KeyError(f"Sin nodo a menos de {self.tol} de {missing[idx < 0][:5].tolist()}")
+        labels = self.labels[idx]
+        return labels[0] if np.ndim(points) == 1 else labels
+
+    def in_box(self, lo, hi):
+        """Indices de los nodos con lo - tol <= coord <= hi + tol en cada eje"""
+        lo = np.asarray(lo, dtype=float)
+        hi = np.asarray(hi, dtype=float)
+        center, half = (lo + hi) / 2, (hi - lo) / 2 + self.tol
+        # Candidatos con la esfera que contiene la caja, luego filtro exacto
+        candidates = np.asarray(self.tree.query_ball_point(center, np.linalg.norm(half)), dtype=np.int64)
+        inside = np.all(np.abs(self.coords[candidates] - center) <= half, axis=1)
+        return np.sort(candidates[inside])
+
+    def on_segment(self, p0, p1):
+        """Indices de los nodos a distancia <= tol del segmento p0-p1, ordenados desde p0"""
+        p0 = np.asarray(p0, dtype=float)
+        p1 = np.asarray(p1, dtype=float)
+        d = p1 - p0
+        length = np.linalg.norm(d)
+        candidates = self.in_box(np.minimum(p0, p1), np.maximum(p0, p1))
+        rel = self.coords[candidates] - p0
+        s = rel @ d / length**2 if length > 0 else np.zeros(len(candidates))
+        dist = np.linalg.norm(rel - np.outer(np.clip(s, 0, 1), d), axis=1)
+        keep = dist <= self.tol
+        return candidates[keep][np.argsort(s[keep], kind="stable")]
+
+    def on_boundary(self):
+        """Indices de los nodos sobre el contorno de la caja envolvente en x e y"""
+        lo = self.coords[:, :2].min(axis=0)
+        hi = self.coords[:, :2].max(axis=0)
+        xy = self.coords[:, :2]
+        on_edge = (np.abs(xy - lo) <= self.tol).any(axis=1) | (np.abs(xy - hi) <= self.tol).any(axis=1)
+        return np.flatnonzero(on_edge)
+
+    # ------------------------------------------------------------
+    # Grillas
+    # ------------------------------------------------------------
+    def grid_indices(self):
+        """(xs, ys, ix, iy): coordenadas de la grilla y columna/fila de cada nodo"""
+        xs, ix = cluster_coordinates(self.coords[:, 0], self.tol)
+        ys, iy = cluster_coordinates(self.coords[:, 1], self.tol)
+        return xs, ys, ix, iy
+
+    def to_grid(self, values, fill=np.nan):
+        """Valores nodales (n, ...) como grilla (ny, nx, ...) con y creciente por filas
+
+        Las posiciones de la grilla sin nodo quedan con fill. Retorna
+        (xs, ys, grid).
+        """
+        values = np.asarray(values)
+        if len(values) != len(self.coords):
+            raise ValueError(f"{len(values)} valores para {len(self.coords)} nodos")
+        xs, ys, ix, iy = self.grid_indices()
+        dtype = np.result_type(values.dtype, np.asarray(fill).dtype)
+        grid = np.full((len(ys), len(xs)) + values.shape[1:], fill, dtype=dtype)
+        grid[iy, ix] = values
+        return xs, ys, grid
@@ -0,0 +1,176 @@
+"""
+store.py - Almacen en disco de sistemas ensamblados y resultados (.npy con mmap)
+
+Cada modelo ocupa un directorio <raiz>/<clave>/ con un archivo .npy por
+arreglo:
+
+    K.indptr.npy, K.indices.npy, K.data.npy   rigidez CSR
+    F.npy                                     cargas (num_dof, n_cases)
+    U.npy, R.npy                              desplazamientos y reacciones
+    meta.json                                 forma de las matrices,
+                                              metadatos de la factorizacion...
+
+La clave es un hash de malla, material y apoyos (model_key), de modo que
+un script que solo cambia el post-proceso vuelve a abrir K y U en lugar de
+ensamblar y resolver. Los arreglos se abren con mmap_mode='r': la recarga
+de sistemas de 10^7 no nulos es inmediata y varios procesos comparten una
+sola copia en la cache de paginas del sistema operativo. Las escrituras
+van a un archivo temporal y se renombran (os.replace), de modo que un
+lector nunca ve un .npy a medio escribir.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from .model import assemble_stiffness, solve
+from .solvers import cached_solver
+
+def array_hash(*arrays, params=()):
+    """Hash SHA-1 de arreglos (forma, tipo y contenido) y parametros escalares"""
+    h = hashlib.sha1()
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(f"{arr.shape}{arr.dtype.str}".encode())
+        h.update(arr.tobytes())
+    h.update(repr(tuple(params)).encode())
+    return h.hexdigest()
+
+def model_key(model):
+    """Clave de un fem.model.Model: malla, kernel, material y apoyos (sin las cargas)"""
+    prescribed = sorted(model.prescribed.items())
+    params = (model.kernel.name, sorted(model.material.items()), prescribed)
+    return array_hash(model.nodes, model.elements, model.fixed_dofs, params=params)
+
+class ModelStore:
+    """Directorio de sistemas y resultados guardados como .npy, uno por clave"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, key):
+        return self.root / key
+
+    def _file(self, key, name):
+        return self.path(key) / f"{name}.npy"
+
+    def has(self, key, *names):
+        """True si la clave tiene guardados todos los arreglos (o matrices CSR) dados"""
+        for name in names:
+            if not (self._file(key, name).exists() or self._file(key, f"{name}.data").exists()):
+                return False
+        return True
+
+    # ------------------------------------------------------------
+    # Arreglos
+    # ------------------------------------------------------------
+    def save_array(self, key, name, array):
+        directory = self.path(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        final = self._file(key, name)
+        tmp = final.with_name(f".{final.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(array))
+        os.replace(tmp, final)
+
+    def save_arrays(self, key, **arrays):
+        for name, array in arrays.items():
+            self.save_array(key, name, array)
+
+    def load_array(self, key, name, mmap=True):
+        """Arreglo guardado (np.memmap de solo lectura con mmap=True) o None"""
+        path = self._file(key, name)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode="r" if mmap else None)
+
+    # ------------------------------------------------------------
+    # Matrices CSR
+    # ------------------------------------------------------------
+    def save_csr(self, key, name, K):
+        K = csr_matrix(K)
+        self.save_arrays(key, **{f"{name}.indptr": K.indptr, f"{name}.indices": K.indices,
+                                 f"{name}.data": K.data})
+        self.update_meta(key, **{name: {"shape": list(K.shape), "nnz": int(K.nnz)}})
+
+    def load_csr(self, key, name, mmap=True):
+        """Matriz CSR sobre los .npy mapeados en memoria (sin copia) o None"""
+        info = self.meta(key).get(name)
+        if info is None or not self.has(key, name):
+            return None
+        parts = [self.load_array(key, f"{name}.{p}", mmap) for p in ("data", "indices", "indptr")]
+        return csr_matrix(tuple(parts), shape=tuple(info["shape"]), copy=False)
+
+    # ------------------------------------------------------------
+    # Metadatos
+    # ------------------------------------------------------------
+    def meta(self, key):
+        path = self.path(key) / "meta.json"
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def update_meta(self, key, **values):
+        """Agrega o reemplaza entradas de meta.json"""
+        meta = self.meta(key)
+        meta.update(values)
+        directory = self.path(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        final = directory / "meta.json"
+        tmp = final.with_name(f".meta.json.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, final)
+
+    # ------------------------------------------------------------
+    # Resultados
+    # ------------------------------------------------------------
+    def save_results(self, key, F, U, R, solver=None):
+        """Guarda cargas, desplazamientos y reacciones (y los datos del solver, si se da)"""
+        self.save_arrays(key, F=F, U=U, R=R)
+        meta = {"loads": array_hash(F)}
+        if solver is not None:
+            meta["factorization"] = factorization_info(solver)
+        self.update_meta(key, **meta)
+
+    def load_results(self, key, F, mmap=True):
+        """(U, R) guardados si fueron calculados con las mismas cargas F, si no None"""
+        if self.meta(key).get("loads") != array_hash(F) or not self.has(key, "U", "R"):
+            return None
+        return self.load_array(key, "U", mmap), self.load_array(key, "R", mmap)
+
+def stored_solve(model, store, cache=None):
+    """K, U, R de un Model desde el almacen; lo que falte se ensambla/resuelve y se guarda
+
+    K se reutiliza mientras no cambien malla, material ni apoyos; U y R
+    ademas exigen las mismas cargas.
+    """
+    key = model_key(model)
+    K = store.load_csr(key, "K")
+    if K is None:
+        K = assemble_stiffness(model, cache)
+        store.save_csr(key, "K", K)
+
+    results = store.load_results(key, model.loads)
+    if results is None:
+        U, R, _ = solve(model, K, key)
+        store.save_results(key, model.loads, U, R, cached_solver(key))
+    else:
+        U, R = results
+    return K, U, R
+
+def factorization_info(solver):
+    """Metadatos de un FactorizedSolver: metodo, tamano y llenado del factor"""
+    info = {"method": solver.method}
+    factor = solver._factor
+    if solver.method == "splu":
+        info.update(n=int(factor.shape[0]), nnz_L=int(factor.L.nnz), nnz_U=int(factor.U.nnz))
+    else:
+        L = factor.L()
+        info.update(n=int(L.shape[0]), nnz_L=int(L.nnz))
+    return info
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Rectangular Slab FEA - modelo .$2k escrito en bloque
+====================================================
+Mismo modelo que rectangular_slab_fea_sap2000.py (losa 6 x 4 m, malla
+6 x 4, bordes con U3 y giro normal restringidos, q = 10 kN/m2), pero en
+lugar de una llamada COM por punto, area, apoyo y carga se escribe el
+archivo .$2k completo desde arreglos (fem.s2k.write_model) y SAP2000 lo
+abre con un solo File.OpenFile.
+
+Ejecutar: python rectangular_slab_fea_s2k.py [salida.$2k] [--sap2000]
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fem.mesh import rectangular_mesh
+from fem.s2k import write_model
+
+# ========== PARAMETROS (IDENTICOS A CALCPAD) ==========
+a, b, t = 6.0, 4.0, 0.1     # m
+q = 10.0                    # kN/m2
+E, nu = 35000, 0.15         # MPa
+n_a, n_b = 6, 4
+
+args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+output = Path(args[0] if args else "rectangular_slab_fea_bulk.$2k").resolve()
+
+# ========== MALLA ==========
+nodes, elements = rectangular_mesh(a, b, n_a, n_b, element="quad", ndim=3)
+
+# ========== APOYOS (TODOS LOS BORDES) ==========
+# U3 en todo el borde; R1 en x = 0, a; R2 en y = 0, b
+x_border = np.isclose(nodes[:, 0], 0.0) | np.isclose(nodes[:, 0], a)
+y_border = np.isclose(nodes[:, 1], 0.0) | np.isclose(nodes[:, 1], b)
+restraints = np.zeros((len(nodes), 6), dtype=bool)
+restraints[:, 2] = x_border | y_border
+restraints[:, 3] = x_border
+restraints[:, 4] = y_border
+
+# ========== ESCRIBIR ==========
+write_model(output, nodes, elements, {"E": E * 1000, "nu": nu, "t": t},
+            shell_type="Plate-Thin", restraints=restraints, area_loads={"DEAD": -q},
+            units="KN, m, C")
+print(f"[OK] {output} ({len(nodes)} nodos, {len(elements)} areas, {int(restraints.any(axis=1).sum())} apoyos)")
+
+# ========== ABRIR EN SAP2000 ==========
+if "--sap2000" in sys.argv:
+    import comtypes.client
+
+    helper = comtypes.client.CreateObject('SAP2000v1.Helper')
+    helper = helper.QueryInterface(comtypes.gen.SAP2000v1.cHelper)
+    SapObject = helper.CreateObjectProgID("CSI.SAP2000.API.SapObject")
+    SapObject.ApplicationStart()
+    SapModel = SapObject.SapModel
+
+    ret = SapModel.File.OpenFile(str(output))
+    print(f"OpenFile: {ret}")
+    ret = SapModel.Analyze.RunAnalysis()
+    print(f"RunAnalysis: {ret}")
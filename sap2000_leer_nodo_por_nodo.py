@@ -2,10 +2,19 @@
 """
 Leer desplazamientos nodo por nodo
 ==================================
+Desplazamientos y reacciones por tabla completa (fem.saptables): una
+llamada COM por tabla en lugar de JointDispl / JointReact por nodo.
+Matriz UZ, nodo central y bordes por indice espacial (fem.spatial).
 """
+import sys
+from pathlib import Path
 
 import comtypes.client
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fem.saptables import joint_displacements, joint_reactions
+from fem.spatial import NodeIndex
+
 print("="*70)
 print("LECTURA DE DESPLAZAMIENTOS NODO POR NODO")
 print("="*70)
@@ -36,19 +45,20 @@ for nodo in nodos_list:
 SapModel.Results.Setup.DeselectAllCasesAndCombosForOutput()
 SapModel.Results.Setup.SetCaseSelectedForOutput("DEAD")
 
-# Leer desplazamientos NODO POR NODO con ObjectElm=0
-print("\n=== DESPLAZAMIENTOS (ObjectElm=0, elemento a elemento) ===")
-U3_dict = {}
-for nodo in nodos_list:
-    ret = SapModel.Results.JointDispl(nodo, 0)
-    if ret[0] > 0:
-        U3_dict[nodo] = ret[9][0]
+# Tabla "Joint Displacements" completa (una llamada)
+print("\n=== DESPLAZAMIENTOS (tabla Joint Displacements) ===")
+disp = joint_displacements(SapModel, cases=["DEAD"])
+U3_dict = dict(zip(disp["keys"], disp["values"][:, 0, 2]))
 
 print(f"Nodos con resultados: {len(U3_dict)}")
 
+# Indice espacial de nodos (busqueda por coordenadas sin recorrer todos los nodos)
+index = NodeIndex.from_dict(nodos, tol=0.001)
+borde = index.labels[index.on_boundary()]
+
 if U3_dict:
-    xs = sorted(set(x for x, y in nodos.values()))
-    ys = sorted(set(y for x, y in nodos.values()), reverse=True)
+    uz_nodos = [U3_dict.get(nodo, 0) * 1000 for nodo in index.labels]
+    xs, ys, grid = index.to_grid(uz_nodos)
 
     print(f"\nMatriz UZ (mm):")
     print(f"{'y\\x':<6}", end="")
@@ -56,50 +66,43 @@ if U3_dict:
         print(f"{x:>8.1f}", end="")
     print()
 
-    for y in ys:
+    for y, fila in zip(ys[::-1], grid[::-1]):
         print(f"{y:<6.1f}", end="")
-        for x in xs:
-            for nodo, (nx, ny) in nodos.items():
-                if abs(nx - x) < 0.001 and abs(ny - y) < 0.001:
-                    uz = U3_dict.get(nodo, 0) * 1000
-                    print(f"{uz:>8.3f}", end="")
-                    break
+        for uz in fila:
+            print(f"{uz:>8.3f}", end="")
         print()
 
     print(f"\nUZ min: {min(U3_dict.values())*1000:.4f} mm")
     print(f"UZ max: {max(U3_dict.values())*1000:.4f} mm")
 
     # Nodo central
-    for nodo, (x, y) in nodos.items():
-        if abs(x - 3.0) < 0.1 and abs(y - 2.0) < 0.1:
-            print(f"UZ centro (nodo {nodo}): {U3_dict.get(nodo, 0)*1000:.4f} mm")
-            break
+    i_centro, dist = index.nearest([3.0, 2.0])
+    if dist < 0.1:
+        nodo = index.labels[i_centro]
+        print(f"UZ centro (nodo {nodo}): {U3_dict.get(nodo, 0)*1000:.4f} mm")
 
 # Verificar que los nodos de borde tienen UZ=0
 print("\n=== VERIFICACION NODOS DE BORDE ===")
-for nodo, (x, y) in nodos.items():
-    en_borde = (abs(x) < 0.001 or abs(x - a) < 0.001 or
-                abs(y) < 0.001 or abs(y - b) < 0.001)
-    if en_borde:
-        uz = U3_dict.get(nodo, 0)
-        if abs(uz) > 0.0001:  # Si UZ no es cero
-            print(f"  PROBLEMA: Nodo {nodo} ({x:.1f},{y:.1f}) tiene UZ={uz*1000:.4f} mm (deberia ser 0)")
-
-# Reacciones nodo por nodo
-print("\n=== REACCIONES (nodo por nodo) ===")
+for nodo in borde:
+    x, y = nodos[nodo]
+    uz = U3_dict.get(nodo, 0)
+    if abs(uz) > 0.0001:  # Si UZ no es cero
+        print(f"  PROBLEMA: Nodo {nodo} ({x:.1f},{y:.1f}) tiene UZ={uz*1000:.4f} mm (deberia ser 0)")
+
+# Reacciones (tabla "Joint Reactions", una llamada)
+print("\n=== REACCIONES (tabla Joint Reactions) ===")
+reac = joint_reactions(SapModel, cases=["DEAD"])
+F3_dict = dict(zip(reac["keys"], reac["values"][:, 0, 2]))
 total_F3 = 0
 n_reac = 0
-for nodo, (x, y) in nodos.items():
-    en_borde = (abs(x) < 0.001 or abs(x - a) < 0.001 or
-                abs(y) < 0.001 or abs(y - b) < 0.001)
-    if en_borde:
-        ret = SapModel.Results.JointReact(nodo, 0)
-        if ret[0] > 0:
-            F3 = ret[8][0]
-            total_F3 += F3
-            n_reac += 1
-            if abs(F3) > 0.001:  # Solo mostrar si hay reaccion significativa
-                print(f"  Nodo {nodo} ({x:.1f},{y:.1f}): F3={F3:.4f} kN")
+for nodo in borde:
+    x, y = nodos[nodo]
+    if nodo in F3_dict:
+        F3 = F3_dict[nodo]
+        total_F3 += F3
+        n_reac += 1
+        if abs(F3) > 0.001:  # Solo mostrar si hay reaccion significativa
+            print(f"  Nodo {nodo} ({x:.1f},{y:.1f}): F3={F3:.4f} kN")
 
 print(f"\nTotal reacciones encontradas: {n_reac}")
 print(f"Suma F3: {total_F3:.4f} kN")
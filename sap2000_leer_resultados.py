@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 """
 Leer resultados del modelo SAP2000 existente
+
+Matriz UZ y nodo central por indice espacial (fem.spatial).
 """
 
+import sys
+from pathlib import Path
+
 import comtypes.client
 import math
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fem.spatial import NodeIndex
+
 print("="*70)
 print("LECTURA DE RESULTADOS - SAP2000_AnalysisModel.sdb")
 print("="*70)
@@ -75,35 +83,32 @@ for nodo in nodos_list:
     if ret[0] > 0:
         U3_dict[nodo] = ret[9][0]
 
+# Indice espacial de nodos y nodos del centro (a menos de 0.1 en x e y)
+index = NodeIndex.from_dict(nodos, tol=0.001)
+centro = index.labels[index.in_box([a/2 - 0.1, b/2 - 0.1], [a/2 + 0.1, b/2 + 0.1])]
+
 if U3_dict:
     # Matriz de desplazamientos
     print("\nMatriz UZ (mm):")
 
-    # Obtener valores unicos de x e y
-    xs = sorted(set(x for x, y in nodos.values()))
-    ys = sorted(set(y for x, y in nodos.values()), reverse=True)
+    # Valores unicos de x e y y UZ de cada nodo en la grilla
+    xs, ys, grid = index.to_grid([U3_dict.get(nodo, 0) * 1000 for nodo in index.labels])
 
     print(f"{'y\\x':<6}", end="")
     for x in xs:
         print(f"{x:>8.1f}", end="")
     print()
 
-    for y in ys:
+    for y, fila in zip(ys[::-1], grid[::-1]):
         print(f"{y:<6.1f}", end="")
-        for x in xs:
-            # Buscar nodo en (x, y)
-            for nodo, (nx, ny) in nodos.items():
-                if abs(nx - x) < 0.001 and abs(ny - y) < 0.001:
-                    uz = U3_dict.get(nodo, 0) * 1000
-                    print(f"{uz:>8.3f}", end="")
-                    break
+        for uz in fila:
+            print(f"{uz:>8.3f}", end="")
         print()
 
     # Centro
     print(f"\nDesplazamiento en centro (x={a/2}, y={b/2}):")
-    for nodo, (x, y) in nodos.items():
-        if abs(x - a/2) < 0.1 and abs(y - b/2) < 0.1:
-            print(f"  Nodo {nodo}: UZ = {U3_dict.get(nodo, 0)*1000:.4f} mm")
+    for nodo in centro:
+        print(f"  Nodo {nodo}: UZ = {U3_dict.get(nodo, 0)*1000:.4f} mm")
 
     # Maximo
     min_nodo = min(U3_dict, key=U3_dict.get)
@@ -152,15 +157,13 @@ print(f"D = {D:.2f} kNm")
 print(f"w_centro (Navier) = {w_navier*1000:.4f} mm")
 
 # Encontrar nodo central y comparar
-for nodo, (x, y) in nodos.items():
-    if abs(x - a/2) < 0.1 and abs(y - b/2) < 0.1:
-        w_sap = abs(U3_dict.get(nodo, 0))
-        if w_navier != 0:
-            error = abs(w_sap - w_navier) / w_navier * 100
-            print(f"\nComparacion centro:")
-            print(f"  Navier:  {w_navier*1000:.4f} mm")
-            print(f"  SAP2000: {w_sap*1000:.4f} mm")
-            print(f"  Error:   {error:.2f}%")
-        break
+for nodo in centro[:1]:
+    w_sap = abs(U3_dict.get(nodo, 0))
+    if w_navier != 0:
+        error = abs(w_sap - w_navier) / w_navier * 100
+        print(f"\nComparacion centro:")
+        print(f"  Navier:  {w_navier*1000:.4f} mm")
+        print(f"  SAP2000: {w_sap*1000:.4f} mm")
+        print(f"  Error:   {error:.2f}%")
 
 print("\n" + "="*70)